@@ -4,6 +4,9 @@ from rosdl import ocr_module
 from rosdl import pdf_tools
 import inspect
 from rosdl import metadata_extractor
+from rosdl import metadata_index
+from rosdl import metadata_watch
+from rosdl import duplicate_finder
 from rosdl import file_converter
 from rosdl import image_tools
 from rosdl import data_generator
@@ -259,12 +262,40 @@ def meta():
     pass
 
 
+def _parse_meta_fields(ctx, param, value):
+    try:
+        return metadata_extractor.parse_fields(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+
+
+def _parse_meta_time(ctx, param, value):
+    try:
+        return metadata_index.parse_since(value)
+    except ValueError as e:
+        raise click.BadParameter(f"expected a span such as 7d or 12h, or an ISO date; got {value!r}") from e
+
+
+meta_fields_option = click.option(
+    "--fields", callback=_parse_meta_fields,
+    help="Comma-separated fields to extract (default: all). 'stat' never opens files, 'format' reads "
+         "only the header; richer: " + ", ".join(metadata_extractor.available_fields()[2:]))
+
+
+meta_archives_option = click.option(
+    "--archives", "archive_depth", type=int, default=0, show_default=True,
+    help="Also catalogue ZIP/TAR members in memory, opening nested archives up to this depth (0 = off)")
+
+
 @meta.command("file")
 @click.argument("filepath", type=click.Path(exists=True))
 @click.option("-o", "--output", type=click.Path(), help="Custom output path for report")
-def meta_file(filepath, output):
+@meta_fields_option
+@meta_archives_option
+def meta_file(filepath, output, fields, archive_depth):
     """Extract metadata for a single file (always exports a .txt report)."""
-    out = metadata_extractor.extract_file(filepath, output=output, interactive=(output is None))
+    out = metadata_extractor.extract_file(filepath, output=output, interactive=(output is None), fields=fields,
+                                          archive_depth=archive_depth)
     click.echo(click.style(f"✅ Metadata report saved at: {out}", fg="green"))
 
 
@@ -272,12 +303,133 @@ def meta_file(filepath, output):
 @click.argument("folder_path", type=click.Path(exists=True))
 @click.option("-r", "--recursive", is_flag=True, help="Recursively scan subfolders")
 @click.option("-o", "--output", type=click.Path(), help="Custom output path for report")
-def meta_folder(folder_path, recursive, output):
+@click.option("-w", "--workers", type=int, default=metadata_extractor.DEFAULT_WORKERS, show_default=True,
+              help="Threads used for extraction")
+@meta_fields_option
+@meta_archives_option
+def meta_folder(folder_path, recursive, output, workers, fields, archive_depth):
     """Extract metadata for all files in a folder (always exports a .txt report)."""
-    out = metadata_extractor.extract_folder(folder_path, output=output, recursive=recursive, interactive=(output is None))
+    out = metadata_extractor.extract_folder(folder_path, output=output, recursive=recursive,
+                                            interactive=(output is None), workers=workers, fields=fields,
+                                            archive_depth=archive_depth)
     click.echo(click.style(f"✅ Metadata report saved at: {out}", fg="green"))
 
 
+@meta.command("export")
+@click.argument("folder_path", type=click.Path(exists=True, file_okay=False))
+@click.option("-o", "--output", required=True, type=click.Path(), help="Output file (parquet: output folder)")
+@click.option("-e", "--export-format", type=click.Choice(metadata_extractor.EXPORT_FORMATS),
+              help="Output format (default: from the output extension)")
+@click.option("--recursive/--no-recursive", default=True, help="Recursively scan subfolders")
+@click.option("-w", "--workers", type=int, default=metadata_extractor.DEFAULT_WORKERS, show_default=True,
+              help="Threads used for extraction")
+@click.option("--flush-every", type=int, default=metadata_extractor.FLUSH_EVERY, show_default=True,
+              help="Flush to disk every N records")
+@click.option("--resume", is_flag=True, help="Keep existing output and skip files already exported")
+@meta_fields_option
+@meta_archives_option
+def meta_export(folder_path, output, export_format, recursive, workers, flush_every, resume, fields, archive_depth):
+    """Stream folder metadata to JSONL, CSV, Parquet or TXT as files are scanned."""
+    try:
+        n = metadata_extractor.export_folder(folder_path, output, fmt=export_format, recursive=recursive,
+                                             workers=workers, flush_every=flush_every, resume=resume,
+                                             fields=fields, archive_depth=archive_depth)
+    except (ValueError, ImportError) as e:
+        raise click.ClickException(str(e)) from e
+    click.echo(click.style(f"✅ Exported metadata for {n} files to {output}", fg="green"))
+
+
+@meta.command("dupes")
+@click.argument("folder_path", type=click.Path(exists=True, file_okay=False))
+@click.option("--recursive/--no-recursive", default=True, help="Recursively scan subfolders")
+@click.option("-w", "--workers", type=int, default=metadata_extractor.DEFAULT_WORKERS, show_default=True,
+              help="Threads used for hashing")
+@click.option("--min-size", type=int, default=1, show_default=True, help="Ignore files smaller than this (bytes)")
+@click.option("--no-mmap", is_flag=True, help="Use buffered reads instead of mmap for full hashes")
+@click.option("--json", "as_json", is_flag=True, help="Print duplicate groups as JSON")
+def meta_dupes(folder_path, recursive, workers, min_size, no_mmap, as_json):
+    """Find duplicate files: size, then head/tail hash, then full hash."""
+    import json
+    groups = duplicate_finder.find_duplicates(folder_path, recursive=recursive, workers=workers,
+                                              min_size=min_size, use_mmap=not no_mmap)
+    if as_json:
+        click.echo(json.dumps(groups, indent=2, ensure_ascii=False))
+        return
+    for g in groups:
+        click.echo(click.style(f"\n{len(g['paths'])} copies, {g['size']} bytes each ({g['hash']})", fg="cyan"))
+        for p in g["paths"]:
+            click.echo(f"  {p}")
+    wasted = sum(g["wasted_bytes"] for g in groups)
+    click.echo(click.style(f"\n✅ {len(groups)} duplicate groups, {wasted} bytes reclaimable", fg="green"))
+
+
+@meta.command("index")
+@click.argument("folder_path", type=click.Path(exists=True, file_okay=False))
+@click.option("--db", default=metadata_index.DEFAULT_DB, show_default=True, type=click.Path(), help="Index database")
+@click.option("--recursive/--no-recursive", default=True, help="Recursively scan subfolders")
+@click.option("-w", "--workers", type=int, default=metadata_extractor.DEFAULT_WORKERS, show_default=True,
+              help="Threads used for extraction")
+@meta_fields_option
+def meta_index(folder_path, db, recursive, workers, fields):
+    """Incrementally index a folder: only new or changed files are re-extracted."""
+    with metadata_index.MetadataIndex(db) as idx:
+        stats = idx.update(folder_path, recursive=recursive, workers=workers, fields=fields)
+        total = len(idx)
+    click.echo(click.style(
+        f"✅ Index updated: {stats['added']} added, {stats['updated']} updated, "
+        f"{stats['unchanged']} unchanged, {stats['removed']} removed ({total} files in {db})", fg="green"))
+
+
+@meta.command("watch")
+@click.argument("folder_path", type=click.Path(exists=True, file_okay=False))
+@click.option("--db", default=metadata_index.DEFAULT_DB, show_default=True, type=click.Path(), help="Index database")
+@click.option("--recursive/--no-recursive", default=True, help="Watch subfolders")
+@click.option("--debounce", type=float, default=metadata_watch.DEFAULT_DEBOUNCE, show_default=True,
+              help="Seconds a file must be quiet before it is re-extracted")
+@click.option("--poll", is_flag=True, help="Poll with scandir snapshots instead of OS events (network mounts)")
+@click.option("--interval", type=click.FloatRange(min=0, min_open=True), default=metadata_watch.DEFAULT_INTERVAL,
+              show_default=True, help="Seconds between polling snapshots")
+@meta_fields_option
+def meta_watch(folder_path, db, recursive, debounce, poll, interval, fields):
+    """Watch a folder and keep the metadata index current (Ctrl+C to stop)."""
+    if not poll and metadata_watch.Observer is None:
+        click.echo(click.style("ℹ️ watchdog is not installed, falling back to polling", fg="cyan"))
+
+    def report(paths, stats):
+        click.echo(f"{len(paths)} changed: {stats['updated']} re-indexed, {stats['removed']} removed")
+
+    click.echo(click.style(f"ℹ️ Watching {folder_path} (index: {db}), press Ctrl+C to stop", fg="cyan"))
+    metadata_watch.watch(folder_path, db=db, recursive=recursive, debounce=debounce, poll=poll,
+                         interval=interval, fields=fields, on_change=report)
+    click.echo(click.style("✅ Watch stopped, index is up to date", fg="green"))
+
+
+@meta.command("query")
+@click.option("--db", default=metadata_index.DEFAULT_DB, show_default=True, type=click.Path(exists=True),
+              help="Index database")
+@click.option("--format", "mime", help="MIME type, SQL LIKE patterns allowed (e.g. image/%)")
+@click.option("--ext", help="File extension (e.g. pdf)")
+@click.option("--since", callback=_parse_meta_time, help="Modified since: 7d, 12h, or an ISO date")
+@click.option("--before", callback=_parse_meta_time, help="Modified before: 7d, 12h, or an ISO date")
+@click.option("--under", type=click.Path(), help="Only files under this folder")
+@click.option("-f", "--field", "fields", multiple=True, help="Match an extracted field, e.g. -f author=Jane%")
+@click.option("-n", "--limit", type=int, help="Maximum number of results")
+@click.option("--json", "as_json", is_flag=True, help="Print full metadata as JSON lines")
+def meta_query(db, mime, ext, since, before, under, fields, limit, as_json):
+    """Query the metadata index without touching the filesystem."""
+    import json
+    try:
+        field_filters = dict(f.split("=", 1) for f in fields)
+    except ValueError:
+        raise click.BadParameter("must look like name=value", param_hint="--field")
+    with metadata_index.MetadataIndex(db) as idx:
+        results = idx.query(format=mime, extension=ext, modified_since=since, modified_before=before,
+                            path_prefix=under, limit=limit, fields=field_filters)
+    for m in results:
+        click.echo(json.dumps(m, ensure_ascii=False) if as_json else m["filepath"])
+    click.echo(click.style(f"ℹ️ {len(results)} matching files", fg="cyan"), err=True)
+
+
 cli.add_command(meta, name="meta")
 
 # =========================
@@ -387,6 +539,33 @@ def image_format_cmd(input_file, output_file):
     msg = file_converter.image_format_convert(input_file, output_path)
     click.echo(click.style(f"✅ {msg}", fg="green"))
 
+
+# -------------------------
+# Batch Conversion
+# -------------------------
+@convert.command("batch")
+@click.argument("source")
+@click.option("-o", "--output-dir", type=click.Path(), help="Folder for outputs (default: next to each input)")
+@click.option("-r", "--recursive", is_flag=True, help="Recurse into subfolders / allow ** in globs")
+@click.option("--to", "to_ext", help="Target extension for image conversions (default .png)")
+@click.option("-w", "--workers", type=click.IntRange(min=1), help="Number of worker processes (default: CPU count)")
+@click.option("-t", "--timeout", type=float, help="Per-job timeout in seconds")
+@click.option("--skip", type=click.Choice(["mtime", "hash", "none"]), default="mtime", show_default=True,
+              help="How to detect outputs that are already up to date")
+@click.option("--state-file", type=click.Path(), help="Hash state file used with --skip hash")
+@click.pass_context
+def batch_cmd(ctx, source, output_dir, recursive, to_ext, workers, timeout, skip, state_file):
+    """Convert a folder, glob or JSON/YAML manifest of files; prints a JSON summary."""
+    import json
+    try:
+        jobs = file_converter.plan_batch(source, output_dir=output_dir, recursive=recursive, to=to_ext)
+    except (ValueError, ImportError, OSError) as e:
+        raise click.ClickException(str(e)) from e
+    summary = file_converter.run_batch(jobs, workers=workers, timeout=timeout, skip=skip, state_file=state_file)
+    click.echo(json.dumps(summary, indent=2, ensure_ascii=False))
+    if summary["failed"] or summary["timeout"]:
+        ctx.exit(1)
+
 # =========================
 # IMAGE TOOLS COMMANDS
 # =========================
@@ -515,28 +694,93 @@ def _load_text(input_text):
         input_text = click.prompt("Enter text or file path")
     return tu.load_text(input_text)
 
+
+def _iter_input(input_text, unit):
+    """Yield the input lazily, one unit at a time (see text_utils_module.iter_text)."""
+    if not input_text:
+        input_text = click.prompt("Enter text or file path")
+    return tu.iter_text(input_text, unit)
+
+
+unit_option = click.option(
+    "--unit", type=click.Choice(tu.TEXT_UNITS),
+    help="Stream the input one line/paragraph/page/chunk at a time and print results as they come")
+
 # -----------------------------
 # Clean Text
 # -----------------------------
 @text.command("clean")
 @click.argument("input_text", required=False)
 @click.option("--remove-stopwords/--keep-stopwords", default=True, help="Remove stopwords or not")
-def clean_text(input_text, remove_stopwords):
-    """Clean input text or file content."""
-    text_content = _load_text(input_text)
+@click.option("--batch", "batch_source", type=click.Path(exists=True),
+              help="Clean a whole corpus: a folder of .txt/.docx/.pdf files or a .jsonl file")
+@click.option("--field", default="text", show_default=True, help="JSONL field holding the text (with --batch)")
+@click.option("-o", "--output", type=click.Path(), help="Output .jsonl for --batch (default: stdout)")
+@click.option("-w", "--workers", type=int, default=os.cpu_count(), show_default=True,
+              help="Worker processes for --batch")
+@click.option("--chunksize", type=int, default=tu.DEFAULT_CHUNKSIZE, show_default=True,
+              help="Documents sent to a worker at a time (with --batch)")
+@unit_option
+def clean_text(input_text, remove_stopwords, batch_source, field, output, workers, chunksize, unit):
+    """Clean input text or file content, or a whole corpus with --batch."""
     tu_util = tu.TextUtilities()
-    cleaned = tu_util.clean_text(text_content, remove_stopwords)
-    click.echo(cleaned)
+    if unit and not batch_source:
+        for cleaned in tu_util.clean_text(_iter_input(input_text, unit), remove_stopwords):
+            click.echo(cleaned)
+        return
+    if not batch_source:
+        text_content = _load_text(input_text)
+        cleaned = tu_util.clean_text(text_content, remove_stopwords)
+        click.echo(cleaned)
+        return
+
+    import json
+    import time
+    from collections import deque
+    ids = deque()
+
+    def texts():
+        for doc_id, doc in tu.iter_documents(batch_source, field):
+            ids.append(doc_id)
+            yield doc
+
+    start, count = time.perf_counter(), 0
+    out = open(output, "w", encoding="utf-8") if output else None
+    try:
+        for cleaned in tu_util.clean_batch(texts(), remove_stopwords, workers=workers, chunksize=chunksize):
+            line = json.dumps({"id": ids.popleft(), "text": cleaned}, ensure_ascii=False)
+            if out:
+                out.write(line + "\n")
+            else:
+                click.echo(line)
+            count += 1
+    finally:
+        if out:
+            out.close()
+    seconds = time.perf_counter() - start
+    rate = count / seconds if seconds else float("inf")
+    click.echo(click.style(f"✅ Cleaned {count} documents in {seconds:.2f}s ({rate:,.0f} docs/sec)"
+                           + (f" -> {output}" if output else ""), fg="green"), err=True)
+
+tokenizer_option = click.option(
+    "--tokenizer", type=click.Choice(list(tu.TOKENIZERS)), default=tu.DEFAULT_TOKENIZER, show_default=True,
+    help="Tokenizer backend: fast compiled regex, or NLTK (higher fidelity, needs punkt data)")
 
 # -----------------------------
 # Tokenize Text
 # -----------------------------
 @text.command("tokenize")
 @click.argument("input_text", required=False)
-def tokenize(input_text):
+@tokenizer_option
+@unit_option
+def tokenize(input_text, tokenizer, unit):
     """Tokenize input text or file content into words."""
+    tu_util = tu.TextUtilities(tokenizer=tokenizer)
+    if unit:
+        for piece in _iter_input(input_text, unit):
+            click.echo(tu_util.tokenize(piece))
+        return
     text_content = _load_text(input_text)
-    tu_util = tu.TextUtilities()
     tokens = tu_util.tokenize(text_content)
     click.echo(tokens)
 
@@ -545,13 +789,25 @@ def tokenize(input_text):
 # -----------------------------
 @text.command("stem")
 @click.argument("input_text", required=False)
-def stem(input_text):
+@tokenizer_option
+@click.option("--stemmer", "backend", type=click.Choice(tu.STEMMERS), default="porter", show_default=True,
+              help="Stemming algorithm")
+@click.option("--cache", "cache_file", type=click.Path(dir_okay=False),
+              help="JSON file to load/save the stem cache across runs")
+@unit_option
+def stem(input_text, tokenizer, backend, cache_file, unit):
     """Stem input text or file content."""
-    text_content = _load_text(input_text)
-    tu_util = tu.TextUtilities()
-    tokens = tu_util.tokenize(text_content)
-    stemmed = tu_util.stem_words(tokens)
-    click.echo(stemmed)
+    cache = tu.StemCache(backend, path=cache_file) if cache_file else backend
+    tu_util = tu.TextUtilities(tokenizer=tokenizer, stemmer=cache)
+    if unit:
+        for piece in _iter_input(input_text, unit):
+            click.echo(tu_util.stem_words(tu_util.tokenize(piece)))
+    else:
+        tokens = tu_util.tokenize(_load_text(input_text))
+        stemmed = tu_util.stem_words(tokens)
+        click.echo(stemmed)
+    if cache_file:
+        cache.save()
 
 # -----------------------------
 # Extract Keywords
@@ -559,25 +815,81 @@ def stem(input_text):
 @text.command("keywords")
 @click.argument("input_text", required=False)
 @click.option("--top-k", default=10, help="Number of keywords to extract")
-def keywords(input_text, top_k):
-    """Extract top keywords from input text or file using TF-IDF."""
-    text_content = _load_text(input_text)
-    tu_util = tu.TextUtilities()
-    cleaned = tu_util.clean_text(text_content)
-    kws = tu_util.extract_keywords([cleaned], top_k)
-    click.echo(kws)
+@click.option("--model", "model_path", type=click.Path(exists=True, dir_okay=False),
+              help="Saved IDF model (.npz) to score against")
+@click.option("--fit", "fit_corpus", type=click.Path(exists=True),
+              help="Fit the IDF model on a corpus first (folder of .txt/.docx/.pdf or .jsonl), streamed in chunks")
+@click.option("--save-model", type=click.Path(dir_okay=False), help="Save the fitted IDF model (.npz)")
+@click.option("--field", default="text", show_default=True, help="JSONL field holding the text")
+@click.option("--scores", is_flag=True, help="Show TF-IDF scores")
+def keywords(input_text, top_k, model_path, fit_corpus, save_model, field, scores):
+    """
+    Extract per-document top keywords with TF-IDF.
+
+    INPUT_TEXT may be text, a file, a folder or a .jsonl corpus (one result per
+    document). IDF comes from --model, from --fit CORPUS, or else from the
+    input's own documents (paragraphs, for a single text).
+    """
+    import re
+    from collections import deque
+    from rosdl.text_keywords import KeywordModel
+    if not input_text and not fit_corpus:
+        input_text = click.prompt("Enter text or file path")
+
+    single = None
+    if input_text and not (os.path.isdir(input_text) or input_text.lower().endswith(".jsonl")):
+        single = (input_text if os.path.isfile(input_text) else "text", tu.load_text(input_text))
+
+    def documents():
+        return iter([single]) if single else tu.iter_documents(input_text, field)
+
+    model = KeywordModel.load(model_path) if model_path else KeywordModel()
+    if fit_corpus:
+        model.fit(doc for _, doc in tu.iter_documents(fit_corpus, field))
+    elif not model_path and single:
+        model.fit(p for p in re.split(r"\n\s*\n", single[1]) if p.strip())
+    elif not model_path and input_text:
+        model.fit(doc for _, doc in documents())
+    if save_model:
+        model.save(save_model)
+        click.echo(click.style(f"✅ IDF model ({model.n_docs} documents) saved to {save_model}", fg="green"), err=True)
+    if not input_text:
+        return
+
+    ids = deque()
+
+    def texts():
+        for doc_id, doc in documents():
+            ids.append(doc_id)
+            yield doc
+
+    for kws in model.iter_keywords(texts(), top_k):
+        words = [f"{w} ({score:.3f})" if scores else w for w, score in kws]
+        click.echo(f"{ids.popleft()}: {', '.join(words)}")
 
 # -----------------------------
 # Text Info
 # -----------------------------
 @text.command("info")
 @click.argument("input_text", required=False)
-def info(input_text):
-    """Get basic info/stats about text or file content."""
-    text_content = _load_text(input_text)
-    tu_util = tu.TextUtilities()
-    stats = tu_util.get_text_info(text_content)
-    
+@tokenizer_option
+@click.option("--unique", type=click.Choice(["exact", "hll"]), default="exact", show_default=True,
+              help="Count unique and top words exactly, or estimate them in constant memory "
+                   "(HyperLogLog, Space-Saving top words)")
+@click.option("--chunk-size", type=int, default=tu.DEFAULT_TEXT_CHUNK, show_default=True,
+              help="Characters read per chunk when streaming files")
+def info(input_text, tokenizer, unique, chunk_size):
+    """Get basic info/stats about text or file content (files are streamed)."""
+    if not input_text:
+        input_text = click.prompt("Enter text or file path")
+    tu_util = tu.TextUtilities(tokenizer=tokenizer)
+    if os.path.isfile(input_text):
+        pieces = tu.iter_text(input_text, "chunk", chunk_size=chunk_size)
+        stats = tu_util.stream_text_info(pieces, unique=unique, top_capacity=None if unique == "exact" else
+                                         tu.DEFAULT_TOP_CAPACITY)
+    else:
+        stats = tu_util.get_text_info(tu.load_text(input_text))
+
     click.echo("📊 Text Statistics:")
     click.echo(f"Characters: {stats['characters']}")
     click.echo(f"Words: {stats['words']}")
@@ -587,6 +899,119 @@ def info(input_text):
     for word, freq in stats['top_words']:
         click.echo(f"  {word}: {freq}")
 
+# -----------------------------
+# Tokenizer Benchmark
+# -----------------------------
+@text.command("benchmark")
+@click.argument("corpus", type=click.Path(exists=True))
+@click.option("--field", default="text", show_default=True, help="JSONL field holding the text")
+@click.option("--reference", type=click.Choice(list(tu.TOKENIZERS)), default="nltk", show_default=True,
+              help="Backend the others are compared against")
+def benchmark(corpus, field, reference):
+    """Compare tokenizer backends on a corpus: tokens/sec and agreement with the reference."""
+    if os.path.isfile(corpus) and not corpus.lower().endswith(".jsonl"):
+        texts = [tu.load_text(corpus)]
+    else:
+        texts = [doc for _, doc in tu.iter_documents(corpus, field)]
+    results = tu.benchmark_tokenizers(texts, reference=reference)
+
+    def pct(v):
+        return "n/a" if v is None else f"{v:.1%}"
+
+    click.echo(f"📊 {len(texts)} documents, reference: {reference}")
+    for name, r in results.items():
+        if "error" in r:
+            click.echo(click.style(f"  {name:<6} ❌ {r['error']}", fg="red"))
+            continue
+        click.echo(f"  {name:<6} {r['tokens_per_sec']:>12,.0f} tokens/sec  {r['tokens']:>9} tokens  "
+                   f"token agreement {pct(r['token_agreement'])}  sentence agreement {pct(r['sentence_agreement'])}")
+
+# -----------------------------
+# Near-duplicate Detection
+# -----------------------------
+@text.command("dedup")
+@click.argument("corpus", type=click.Path(exists=True))
+@click.option("--index", "index_path", type=click.Path(dir_okay=False),
+              help="Persistent MinHash index (SQLite); later runs are checked against earlier ones")
+@click.option("-t", "--threshold", type=float, default=0.8, show_default=True,
+              help="Minimum estimated Jaccard similarity of word shingles")
+@click.option("--num-perm", type=int, default=128, show_default=True, help="MinHash permutations (new index only)")
+@click.option("--bands", type=int, default=32, show_default=True, help="LSH bands (new index only)")
+@click.option("--shingle", type=int, default=5, show_default=True, help="Words per shingle (new index only)")
+@click.option("--field", default="text", show_default=True, help="JSONL field holding the text")
+@click.option("--json", "as_json", is_flag=True, help="Print clusters as JSON lines")
+def dedup(corpus, index_path, threshold, num_perm, bands, shingle, field, as_json):
+    """Find near-duplicate documents in a folder or .jsonl corpus (MinHash + LSH)."""
+    import json
+    import time
+    from rosdl import text_dedup
+    start = time.perf_counter()
+    clusters = text_dedup.find_near_duplicates(
+        tu.iter_documents(corpus, field), index_path or ":memory:", threshold,
+        num_perm=num_perm, bands=bands, shingle_size=shingle)
+    for group in clusters:
+        click.echo(json.dumps(group, ensure_ascii=False) if as_json else "  " + "  ==  ".join(group))
+    click.echo(click.style(f"✅ {len(clusters)} near-duplicate clusters ({time.perf_counter() - start:.1f}s)",
+                           fg="green"), err=True)
+
+# -----------------------------
+# Full-text Search (BM25)
+# -----------------------------
+@text.command("index")
+@click.argument("folder_path", type=click.Path(exists=True, file_okay=False))
+@click.option("--db", default="rosdl_text.db", show_default=True, type=click.Path(dir_okay=False),
+              help="Search index database")
+@click.option("--recursive/--no-recursive", default=True, help="Recursively scan subfolders")
+@click.option("-w", "--workers", type=int, default=os.cpu_count() or 1, show_default=True,
+              help="Processes used for text extraction")
+@click.option("--no-stem", is_flag=True, help="Index words as-is (new index only)")
+def text_index(folder_path, db, recursive, workers, no_stem):
+    """Index the TXT/DOCX/PDF files in a folder for full-text search; only new or changed files are read."""
+    import time
+    from rosdl import text_search
+    start = time.perf_counter()
+    with text_search.TextIndex(db, stem=not no_stem) as idx:
+        stats = idx.update(folder_path, recursive=recursive, workers=workers)
+        total = len(idx)
+    click.echo(click.style(
+        f"✅ Index updated: {stats['added']} added, {stats['updated']} updated, {stats['unchanged']} unchanged, "
+        f"{stats['removed']} removed ({total} documents in {db}, {time.perf_counter() - start:.1f}s)", fg="green"))
+    if stats["failed"]:
+        click.echo(click.style(f"❌ {stats['failed']} files could not be read", fg="red"))
+
+
+@text.command("search")
+@click.argument("query")
+@click.option("--db", default="rosdl_text.db", show_default=True, type=click.Path(exists=True, dir_okay=False),
+              help="Search index database")
+@click.option("-n", "--limit", type=int, default=10, show_default=True, help="Maximum number of results")
+@click.option("--json", "as_json", is_flag=True, help="Print results as JSON lines")
+def text_search_cmd(query, db, limit, as_json):
+    """Search an index built with `text index`, ranked by BM25."""
+    import json
+    from rosdl import text_search
+    results, elapsed = text_search.search(query, db, limit)
+    for path, score in results:
+        click.echo(json.dumps({"path": path, "score": round(score, 4)}, ensure_ascii=False) if as_json
+                   else f"{score:8.3f}  {path}")
+    click.echo(click.style(f"ℹ️ {len(results)} results in {elapsed * 1000:.1f} ms", fg="cyan"), err=True)
+
+# -----------------------------
+# Download NLTK data (explicit, needs network)
+# -----------------------------
+@text.command("download-nltk")
+@click.option("--dir", "data_dir", type=click.Path(file_okay=False),
+              help=f"Target folder (default: ${tu.NLTK_DATA_ENV} or NLTK's default location)")
+def download_nltk(data_dir):
+    """Download the NLTK data used by the text commands, for offline use."""
+    try:
+        target = tu.download_nltk_resources(data_dir)
+    except Exception as e:
+        click.echo(click.style(f"❌ Download failed: {e}", fg="red"))
+        raise SystemExit(1)
+    click.echo(click.style(f"✅ NLTK data stored in {target}", fg="green"))
+    click.echo(click.style(f"ℹ️ Set {tu.NLTK_DATA_ENV}={target} on offline machines", fg="cyan"))
+
 # Register the text group
 cli.add_command(text)
 
@@ -599,6 +1024,7 @@ cli.add_command(text)
 # =========================
 import pandas as pd
 from rosdl import eda_drift_module as eda
+from rosdl import table_loader
 
 @cli.group()
 def eda_cli():
@@ -637,10 +1063,30 @@ def _resolve_output_interactive(input_file, output_file, default_ext, prompt_msg
 @eda_cli.command("quick")
 @click.argument("csv_file", type=click.Path(exists=True))
 @click.option("-o", "--output", type=click.Path(), help="Optional path to save report as CSV")
-def quick(csv_file, output):
-    """Perform quick EDA on a CSV file."""
-    df = pd.read_csv(csv_file)
-    report = eda.quick_eda(df)
+@click.option("--level", type=click.Choice(eda.PROFILE_LEVELS),
+              help="minimal: types/missing/unique; standard: + mean/std/min/max/top; full: + quartiles  "
+                   "[default: minimal]")
+@click.option("--sample", type=float,
+              help="Keep and profile only a random sample: number of rows, or a fraction below 1")
+@click.option("--chunksize", type=int,
+              help="Profile the whole file in chunks of this many rows with sketches (files larger than memory)")
+@click.option("-w", "--workers", type=int, default=1, show_default=True, help="Processes profiling chunks")
+def quick(csv_file, output, level, sample, chunksize, workers):
+    """Perform quick EDA on a CSV file.
+
+    Without --sample the whole file is loaded and typed; --sample streams it and keeps only the drawn rows.
+    """
+    if chunksize:
+        if level or sample:
+            raise click.UsageError("--chunksize profiles every row with sketches; --level and --sample do not apply")
+        from rosdl import eda_profile
+        report = eda_profile.streaming_eda(csv_file, chunksize=chunksize, workers=workers)
+    elif sample:
+        df, total = table_loader.read_sample(csv_file, sample)
+        report = eda.quick_eda(df, level=level or "minimal", total_rows=total)
+    else:
+        report = eda.quick_eda(table_loader.read_table(csv_file), level=level or "minimal")
+    level = level or "minimal"
 
     # Convert report to DataFrame for saving
     df_report = pd.DataFrame({
@@ -649,9 +1095,21 @@ def quick(csv_file, output):
         "Missing": [report['missing'][c] for c in report['dtypes'].keys()],
         "Unique": [report['unique_values'][c] for c in report['dtypes'].keys()]
     })
+    if level != "minimal" and "basic_stats" in report:
+        for stat, values in report["basic_stats"].items():
+            if stat != "unique":
+                df_report[stat.capitalize() if stat[0].isalpha() else stat] = df_report["Column"].map(values)
+    if "sample" in report:
+        bounds = report["sample"]["error_bounds"]
+        for stat, name in (("missing", "Missing"), ("unique_values", "Unique")):
+            df_report[f"{name}_Range"] = df_report["Column"].map(lambda c: "{}-{}".format(*bounds[stat][c]))
 
     click.echo("\n--- Quick EDA Report ---")
     click.echo(df_report.to_string(index=False))
+    if "sample" in report:
+        info = report["sample"]
+        click.echo(click.style(f"ℹ️ Estimated from {info['rows']:,} of {info['total_rows']:,} rows; "
+                               f"ranges are {info['confidence']:.0%} bounds", fg="cyan"))
 
     # Resolve output interactively if not provided
     output_path = _resolve_output_interactive(csv_file, output, ".csv", "Output EDA report filename")
@@ -663,27 +1121,130 @@ def quick(csv_file, output):
 @click.argument("csv1", type=click.Path(exists=True))
 @click.argument("csv2", type=click.Path(exists=True))
 @click.option("-o", "--output", type=click.Path(), help="Optional path to save drift report as CSV")
-def drift(csv1, csv2, output):
-    """Compare two CSV files for data drift."""
-    df1 = pd.read_csv(csv1)
-    df2 = pd.read_csv(csv2)
-
-    drift_report = eda.detect_drift(df1, df2)
+@click.option("-c", "--columns", multiple=True, help="Only test these columns (repeatable or comma-separated)")
+@click.option("-w", "--workers", type=int, default=1, show_default=True,
+              help="Parallel workers for the per-column tests (worth it for wide, large tables)")
+@click.option("--metrics", is_flag=True, help="Report PSI / Jensen-Shannon / Wasserstein instead of p-values")
+@click.option("--bins", type=int, help=f"With --metrics: quantile bins  [default: {eda.DEFAULT_BINS}]")
+@click.option("--sample", type=int, help="With --metrics: sample at most this many rows per file")
+@click.option("--stratify", metavar="COLUMN",
+              help="With --sample: keep each group of this column at its share of rows")
+@click.option("-t", "--threshold", "thresholds", multiple=True,
+              help="With --metrics: per-metric limit, e.g. -t psi=0.25 -t js=0.15 -t wasserstein=0.2")
+@click.option("--categorical-test", type=click.Choice(sorted(eda.CATEGORICAL_TESTS)), default="chi2",
+              show_default=True, help="Test on categorical frequency vectors: Pearson chi-square or G-test")
+@click.option("--top-k", type=click.IntRange(min=1), default=eda.DEFAULT_TOP_CATEGORIES, show_default=True,
+              help="Categories compared per column; rarer ones are pooled into 'other'")
+def drift(csv1, csv2, output, columns, workers, metrics, bins, sample, stratify, thresholds, categorical_test,
+          top_k):
+    """Compare two CSV files for data drift.
+
+    CSV1 may also be a reference profile saved by `eda profile` (*.profile.json);
+    then only CSV2 is read.
+    """
+    from rosdl import eda_profile
+    usecols = [c.strip() for group in columns for c in group.split(",") if c.strip()] or None
+    from_profile = csv1.lower().endswith(eda_profile.PROFILE_SUFFIX)
+    if metrics and from_profile:
+        raise click.UsageError("--metrics needs the reference data, not a saved profile")
+    if not metrics:
+        given = [name for name, value in (("--bins", bins), ("--sample", sample), ("--stratify", stratify),
+                                          ("--threshold", thresholds)) if value]
+        if given:
+            raise click.UsageError(f"{', '.join(given)} only apply with --metrics")
+    if stratify and not sample:
+        raise click.UsageError("--stratify only applies with --sample")
+    try:
+        limits = {k.strip().lower(): float(v) for k, v in (t.split("=", 1) for t in thresholds)}
+    except ValueError:
+        raise click.UsageError("--threshold must look like metric=value, e.g. psi=0.25")
+
+    readcols = usecols + [stratify] if usecols and stratify and stratify not in usecols else usecols
+    df2 = table_loader.read_table(csv2, usecols=readcols)
+    if from_profile:
+        drift_report = eda.profile_drift(csv1, df2, columns=usecols, categorical_test=categorical_test)
+    else:
+        df1 = table_loader.read_table(csv1, usecols=readcols)
+        if metrics:
+            try:
+                df_report = eda.drift_metrics(df1, df2, columns=usecols, bins=bins or eda.DEFAULT_BINS,
+                                              sample=sample, stratify=stratify, thresholds=limits, top_k=top_k)
+            except ValueError as e:
+                raise click.UsageError(str(e))
+            df_report["Drift_Detected"] = df_report["Drift_Detected"].map({True: "YES", False: "NO"})
+        else:
+            drift_report = eda.detect_drift(df1, df2, columns=usecols, workers=workers, top_k=top_k,
+                                            categorical_test=categorical_test)
 
     # Convert drift report to DataFrame
-    df_report = pd.DataFrame(drift_report, columns=["Column", "Type", "p_value"])
-    df_report["Drift_Detected"] = df_report.apply(
-        lambda row: "YES" if row["p_value"] < 0.05 and row["Type"] != "No Change" else "NO", axis=1
-    )
+    if not metrics:
+        df_report = pd.DataFrame(drift_report, columns=["Column", "Type", "p_value"])
+        df_report["Drift_Detected"] = df_report.apply(
+            lambda row: "YES" if row["p_value"] < 0.05 and row["Type"] != "No Change" else "NO", axis=1
+        )
 
     click.echo("\n--- Data Drift Report ---")
     click.echo(df_report.to_string(index=False))
 
     # Resolve output interactively if not provided
-    output_path = _resolve_output_interactive(csv1, output, ".csv", "Output drift report filename")
+    report_base = csv2 if csv1.lower().endswith(eda_profile.PROFILE_SUFFIX) else csv1
+    output_path = _resolve_output_interactive(report_base, output, ".csv", "Output drift report filename")
     df_report.to_csv(output_path, index=False)
     click.echo(click.style(f"✅ Drift report saved to {output_path}", fg="green"))
 
+
+@eda_cli.command("profile")
+@click.argument("csv_file", type=click.Path(exists=True))
+@click.option("-o", "--output", type=click.Path(dir_okay=False), help="Profile path (default: <file>.profile.json)")
+@click.option("--chunksize", type=int, default=100_000, show_default=True, help="Rows read per chunk")
+@click.option("-w", "--workers", type=int, default=1, show_default=True, help="Processes profiling chunks")
+@click.option("--top-k", type=click.IntRange(min=1), default=1000, show_default=True,
+              help="Values kept per column for frequency tables")
+def profile(csv_file, output, chunksize, workers, top_k):
+    """Build a compact reference profile once; check batches with `drift <file>.profile.json batch.csv`."""
+    from rosdl import eda_profile
+    path = eda_profile.build_reference(csv_file, output, chunksize=chunksize, workers=workers, top_k=top_k)
+    click.echo(click.style(f"✅ Reference profile saved to {path} ({os.path.getsize(path):,} bytes)", fg="green"))
+
+
+@eda_cli.command("monitor")
+@click.argument("files", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option("--time-column", "-T", required=True, help="Timestamp column used for windowing")
+@click.option("--window", default="1D", show_default=True, help="Window length: 1D, 6h, W, MS, ...")
+@click.option("-r", "--reference", "reference_windows", type=int, default=30, show_default=True,
+              help="Preceding windows merged into each window's reference")
+@click.option("--cache", "cache_dir", type=click.Path(file_okay=False),
+              help="Sketch cache folder (default: <first file>.drift_cache)")
+@click.option("-c", "--columns", multiple=True, help="Only monitor these columns (repeatable or comma-separated)")
+@click.option("--chunksize", type=int, default=100_000, show_default=True, help="Rows read per chunk")
+@click.option("--categorical-test", type=click.Choice(sorted(eda.CATEGORICAL_TESTS)), default="chi2",
+              show_default=True, help="Test on categorical frequency vectors: Pearson chi-square or G-test")
+@click.option("-o", "--output", type=click.Path(), help="Optional path to save the time series as CSV")
+def monitor(files, time_column, window, reference_windows, cache_dir, columns, chunksize, categorical_test, output):
+    """Drift per time window against the windows before it.
+
+    Window sketches are cached, so re-running after a new daily file or
+    appended rows only reads the new data.
+    """
+    from rosdl import eda_monitor
+    usecols = [c.strip() for group in columns for c in group.split(",") if c.strip()] or None
+    try:
+        df_report = eda_monitor.monitor_drift(list(files), time_column, window=window,
+                                              reference_windows=reference_windows, cache_dir=cache_dir,
+                                              columns=usecols, chunksize=chunksize, categorical_test=categorical_test)
+    except (KeyError, ValueError) as e:
+        raise click.UsageError(e.args[0] if e.args else str(e))
+    df_report["Drift_Detected"] = df_report["Drift_Detected"].map({True: "YES", False: "NO"})
+
+    click.echo("\n--- Drift Monitor ---")
+    click.echo(df_report.to_string(index=False))
+    drifted = df_report.loc[df_report["Drift_Detected"] == "YES", "Window"].nunique()
+    click.echo(click.style(f"ℹ️ {drifted} of {df_report['Window'].nunique()} windows show drift", fg="cyan"))
+
+    output_path = _resolve_output_interactive(files[0], output, ".csv", "Output drift time series filename")
+    df_report.to_csv(output_path, index=False)
+    click.echo(click.style(f"✅ Drift time series saved to {output_path}", fg="green"))
+
 # Register CLI group
 cli.add_command(eda_cli, name="eda_cli")
 
@@ -15,6 +15,7 @@ import string
 import numpy as np
 import pandas as pd
 from faker import Faker
+from rosdl.table_loader import read_table
 from datetime import datetime, timedelta
 
 fake = Faker('en_IN')
@@ -132,7 +133,7 @@ def generate_from_prompt(prompt, output_path=None):
 
 def augment_dataset(path, n_add, output_path=None):
     """Augment an existing dataset by adding synthetic rows."""
-    df = pd.read_csv(path)
+    df = read_table(path)
     existing_pids = set(df['pid'].dropna().astype(int)) if 'pid' in df.columns else set()
     numeric_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
     cat_cols = [c for c in df.columns if pd.api.types.is_object_dtype(df[c])]
@@ -0,0 +1,118 @@
+# rosdl/core/duplicate_finder.py
+"""
+Tiered duplicate-file detection.
+
+1. Group files by size (from the scandir stat, no file is opened)
+2. Within equal-size groups, hash the first and last block of each file
+3. Fully hash only files that still collide
+
+Hashing runs on a thread pool (hashlib releases the GIL on large buffers)
+and reads through mmap or large reusable buffers.
+"""
+
+import os
+import mmap
+import hashlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from rosdl.metadata_extractor import iter_files, DEFAULT_WORKERS
+
+PARTIAL_BLOCK = 64 * 1024
+READ_BUFFER = 4 * 1024 * 1024
+
+
+def partial_hash(path, size, block=PARTIAL_BLOCK):
+    """Hash of the first and last `block` bytes (the whole file when it is small)."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        h.update(f.read(block))
+        if size > block:
+            f.seek(max(block, size - block))
+            h.update(f.read(block))
+    return h.hexdigest()
+
+
+def full_hash(path, use_mmap=True, buffer_size=READ_BUFFER):
+    """Hash the full file content via mmap, or with a reusable read buffer."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if use_mmap and size:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for start in range(0, size, buffer_size):
+                        h.update(mm[start:start + buffer_size])
+                return h.hexdigest()
+            except (OSError, ValueError):
+                f.seek(0)
+        buf = bytearray(buffer_size)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.hexdigest()
+
+
+def _safe(func, *args):
+    try:
+        return func(*args)
+    except OSError:
+        return None
+
+
+def _regroup(groups, key_func, pool):
+    """
+    Split each (size, paths) group by key_func(path, size) computed on the pool.
+    Returns {(size, key): paths} for sub-groups that still have >1 member.
+    """
+    jobs = [(p, size) for size, paths in groups for p in paths]
+    out = defaultdict(list)
+    for (p, size), key in zip(jobs, pool.map(lambda job: key_func(*job), jobs)):
+        if key is not None:
+            out[(size, key)].append(p)
+    return {k: v for k, v in out.items() if len(v) > 1}
+
+
+def find_duplicates(folder, recursive=True, workers=DEFAULT_WORKERS, min_size=1,
+                    block=PARTIAL_BLOCK, use_mmap=True):
+    """
+    Find groups of files with identical content. Hardlinks and symlinks to
+    the same file are not duplicates: each inode is considered once.
+
+    Args:
+        folder: Folder to scan.
+        recursive: Scan subfolders.
+        workers: Threads used for hashing.
+        min_size: Ignore files smaller than this many bytes.
+        block: Size of the head/tail blocks hashed in the partial pass.
+        use_mmap: Use mmap for full hashes (falls back to buffered reads).
+
+    Returns:
+        list[dict]: {"size", "hash", "paths", "wasted_bytes"} per duplicate
+        group, largest wasted space first.
+    """
+    # hardlinks and symlinks to one file share its inode: count it once, under its first path
+    inodes = {}
+    for path, st in iter_files(folder, recursive):
+        if st.st_size >= min_size:
+            key = (st.st_dev, st.st_ino)
+            if key not in inodes or path < inodes[key][0]:
+                inodes[key] = (path, st.st_size)
+    by_size = defaultdict(list)
+    for path, size in inodes.values():
+        by_size[size].append(path)
+    candidates = [(size, paths) for size, paths in by_size.items() if len(paths) > 1]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        partial = _regroup(candidates, lambda p, size: _safe(partial_hash, p, size, block), pool)
+        # files no bigger than two blocks were read completely by the partial pass
+        dupes = {k: g for k, g in partial.items() if k[0] <= 2 * block}
+        remaining = [(size, g) for (size, _), g in partial.items() if size > 2 * block]
+        dupes.update(_regroup(remaining, lambda p, size: _safe(full_hash, p, use_mmap), pool))
+
+    result = [{"size": size, "hash": h, "paths": sorted(paths), "wasted_bytes": size * (len(paths) - 1)}
+              for (size, h), paths in dupes.items()]
+    return sorted(result, key=lambda g: (-g["wasted_bytes"], g["paths"][0]))
@@ -1,41 +1,646 @@
 # rosdl/core/eda_drift_module.py
 
+import copy
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
 import pandas as pd
 import numpy as np
-from scipy.stats import ks_2samp, chi2_contingency
+from scipy.stats import ks_2samp, chi2_contingency, kstwo, norm
+
+PROFILE_LEVELS = ("minimal", "standard", "full")
+DEFAULT_CONFIDENCE = 0.95
+_NUMERIC_SUMMARY = ("mean", "std", "min", "max")
+
+
+def quick_eda(df: pd.DataFrame, level: str = "full", sample=None, seed: int = 0,
+              confidence: float = DEFAULT_CONFIDENCE, total_rows: int = None):
+    """
+    Perform quick EDA on a DataFrame.
+
+    Args:
+        df: Data to profile.
+        level: What to compute:
+            "minimal"  - shape, dtypes, missing and unique counts
+            "standard" - plus count/mean/std/min/max (numeric) and
+                         count/unique/top/freq (other columns), no quantiles
+            "full"     - plus quartiles: df.describe(include='all')
+        sample: Profile a random sample of rows instead: a row count, or a
+            fraction of the rows when below 1.
+        seed: Random seed for sampling.
+        confidence: Confidence level of the reported error bounds.
+        total_rows: Row count of the whole table when df is already a sample
+            of it, e.g. from table_loader.read_sample.
+
+    Returns:
+        dict: shape, dtypes, missing, unique_values and (standard/full)
+        basic_stats. When sampled, counts are scaled to the full table and a
+        "sample" entry holds the sample size and per-statistic error bounds.
+    """
+    if level not in PROFILE_LEVELS:
+        raise ValueError(f"Unknown profile level '{level}'; choose from {', '.join(PROFILE_LEVELS)}")
+    total = max(total_rows or 0, len(df))
+    if sample is not None:
+        n = int(round(sample * total)) if sample < 1 else int(sample)
+        if n < total:
+            df = df.sample(n=max(n, 1), random_state=seed)
 
-def quick_eda(df: pd.DataFrame):
-    """Perform quick EDA on a DataFrame."""
     report = {
-        "shape": df.shape,
+        "shape": (total, df.shape[1]),
         "dtypes": df.dtypes.to_dict(),
         "missing": df.isnull().sum().to_dict(),
-        "basic_stats": df.describe(include='all').transpose().round(2).to_dict(),
-        "unique_values": {col: df[col].nunique() for col in df.columns}
     }
+    if level == "full":
+        report["basic_stats"] = df.describe(include='all').transpose().round(2).to_dict()
+    elif level == "standard":
+        report["basic_stats"] = _standard_stats(df)
+    report["unique_values"] = {col: df[col].nunique() for col in df.columns}
+    if len(df) < total:
+        _scale_sampled(report, df, total, confidence)
     return report
 
 
-def detect_drift(df1: pd.DataFrame, df2: pd.DataFrame):
-    """Compare two DataFrames and detect data drift."""
-    drift_report = []
+def _standard_stats(df: pd.DataFrame) -> dict:
+    """describe()-shaped statistics without the quantiles (no sorting)."""
+    numeric = [c for c in df.columns if _is_numeric(df[c])]
+    other = [c for c in df.columns if c not in numeric]
+    stats = {"count": df.count().astype(np.float64).to_dict()}
+    if other:
+        tops = {c: df[c].value_counts() for c in other}
+        stats["unique"] = {c: len(v) for c, v in tops.items()}
+        stats["top"] = {c: v.index[0] if len(v) else np.nan for c, v in tops.items()}
+        stats["freq"] = {c: v.iloc[0] if len(v) else np.nan for c, v in tops.items()}
+    if numeric:
+        num = df[numeric]
+        for name, values in zip(_NUMERIC_SUMMARY, (num.mean(), num.std(), num.min(), num.max())):
+            stats[name] = values.round(2).to_dict()
+    return {k: {c: v.get(c, np.nan) for c in df.columns} for k, v in stats.items()}
 
-    for col in df1.columns:
-        if col not in df2.columns:
-            continue
 
-        if df1[col].equals(df2[col]):
-            drift_report.append((col, "No Change", 1.0))
-            continue
+def _wilson(k, n: int, z: float):
+    """Wilson score interval of a binomial proportion k/n (sensible at k = 0 or n)."""
+    p = np.asarray(k, dtype=np.float64) / n
+    centre = (p + z * z / (2 * n)) / (1 + z * z / n)
+    half = z / (1 + z * z / n) * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+    return np.clip(centre - half, 0, 1), np.clip(centre + half, 0, 1)
+
+
+def _scale_sampled(report: dict, sample: pd.DataFrame, total: int, confidence: float):
+    """
+    Scale the counts of a sampled report to the full table and add error bounds.
+
+    - missing, count, freq: Wilson interval of the sampled proportion
+    - mean: normal interval with finite-population correction
+    - quartiles: distribution-free DKW bound, the sample quantiles at q +/- eps
+    - unique: GEE estimate (Charikar et al.), sqrt(N/n) * f1 + sum of f_j for
+      j >= 2, within its guaranteed ratio error sqrt(N/n)
+    std, min and max are reported as seen in the sample (min/max bound the
+    true values from the inside).
+    """
+    n = len(sample)
+    z = float(norm.ppf(0.5 + confidence / 2))
+    fpc = np.sqrt((total - n) / (total - 1))
+    ratio = np.sqrt(total / n)
+    cols = list(sample.columns)
+
+    def scaled(k):
+        lo, hi = _wilson(k, n, z)
+        observed = np.asarray(k, dtype=np.float64)
+        # the unsampled rows can only add to what was seen; with very few hits
+        # (e.g. the "top" of an all-distinct column) only that hard floor holds
+        lo = np.where(observed < 5, observed, np.maximum(lo * total, observed))
+        return lo.round(), np.minimum(hi * total, total - (n - observed)).round()
+
+    bounds = {}
+    missing = np.array([report["missing"][c] for c in cols])
+    lo, hi = scaled(missing)
+    bounds["missing"] = {c: (int(a), int(b)) for c, a, b in zip(cols, lo, hi)}
+    report["missing"] = {c: int(round(m * total / n)) for c, m in zip(cols, missing)}
+
+    bounds["unique_values"] = {}
+    for c in cols:
+        freq = sample[c].value_counts().to_numpy()
+        seen, singletons = len(freq), int((freq == 1).sum())
+        most = total - bounds["missing"][c][0]  # at most one distinct value per non-null row
+        estimate = min(max(ratio * singletons + (seen - singletons), seen), most)
+        report["unique_values"][c] = int(round(estimate))
+        bounds["unique_values"][c] = (seen, int(round(min(max(estimate * ratio, seen), most))))
+
+    stats = report.get("basic_stats")
+    if stats is not None:
+        present = n - missing
+        lo, hi = scaled(present)
+        bounds["count"] = {c: (float(a), float(b)) for c, a, b in zip(cols, lo, hi)}
+        stats["count"] = {c: round(float(k) * total / n, 2) for c, k in zip(cols, present)}
+        for c in cols:
+            valid = sample[c].dropna()
+            if "freq" in stats and pd.notna(stats["freq"].get(c, np.nan)):
+                k = float(stats["freq"][c])
+                a, b = scaled(k)
+                bounds.setdefault("freq", {})[c] = (float(a), float(b))
+                stats["freq"][c] = round(k * total / n, 2)
+            if "unique" in stats and pd.notna(stats["unique"].get(c, np.nan)):
+                stats["unique"][c] = report["unique_values"][c]
+            if not _is_numeric(sample[c]) or not len(valid):
+                continue
+            x = valid.to_numpy(dtype=np.float64)
+            if "mean" in stats and len(x) > 1:
+                half = z * x.std(ddof=1) / np.sqrt(len(x)) * fpc
+                bounds.setdefault("mean", {})[c] = (round(float(x.mean() - half), 2), round(float(x.mean() + half), 2))
+            if "25%" in stats:
+                eps = np.sqrt(np.log(2 / (1 - confidence)) / (2 * len(x)))
+                for q, name in ((0.25, "25%"), (0.5, "50%"), (0.75, "75%")):
+                    a, b = np.quantile(x, [max(q - eps, 0), min(q + eps, 1)])
+                    bounds.setdefault(name, {})[c] = (round(float(a), 2), round(float(b), 2))
+
+    report["sample"] = {"rows": n, "total_rows": total, "confidence": confidence, "error_bounds": bounds}
+
+
+# -----------------------------
+# Per-column tests
+# -----------------------------
+def _numeric_drift(col, a: np.ndarray, b: np.ndarray):
+    """KS test on two float arrays (NaN = missing)."""
+    if len(a) == len(b) and np.array_equal(a, b, equal_nan=True):
+        return (col, "No Change", 1.0)
+    a, b = a[~np.isnan(a)], b[~np.isnan(b)]
+    if not len(a) or not len(b):
+        return (col, "Numerical", 1.0)
+    stat, p_val = ks_2samp(a, b)
+    return (col, "Numerical", float(p_val))
+
+
+DEFAULT_TOP_CATEGORIES = 50
+CATEGORICAL_TESTS = {"chi2": "pearson", "g": "log-likelihood"}
+
+
+def _check_top_k(top_k: int):
+    # with no category kept, everything pools into "other" and no drift can ever show
+    if top_k < 1:
+        raise ValueError(f"top_k must be at least 1, got {top_k}")
+
+
+def frequency_vectors(s1: pd.Series, s2: pd.Series, top_k: int = DEFAULT_TOP_CATEGORIES) -> np.ndarray:
+    """
+    (2 x categories) counts of two series, aligned on the union of their values.
+
+    Only the top_k (>= 1) categories by combined share are kept; the rest are
+    summed into a final "other" column, so the size is bounded by top_k + 1
+    and the work is linear in the number of distinct values.
+    """
+    _check_top_k(top_k)
+    v1, v2 = s1.value_counts(), s2.value_counts()
+    both = pd.concat([v1[v1 > 0], v2[v2 > 0]], axis=1, sort=False).fillna(0).to_numpy(dtype=np.float64).T
+    return _top_k_table(both, top_k)
+
+
+def _top_k_table(both: np.ndarray, top_k: int, other=(0.0, 0.0)) -> np.ndarray:
+    """Keep the top_k columns of a (2 x categories) table by combined share; pool the rest (plus `other`)."""
+    if both.shape[1] > top_k:
+        share = both / np.maximum(both.sum(axis=1, keepdims=True), 1)
+        keep = np.argpartition(-(share[0] + share[1]), top_k - 1)[:top_k]
+        rest = np.ones(both.shape[1], dtype=bool)
+        rest[keep] = False
+        both = np.concatenate([both[:, keep], both[:, rest].sum(axis=1, keepdims=True)], axis=1)
+        both[:, -1] += other
+    elif any(other):
+        both = np.concatenate([both, np.asarray(other, dtype=np.float64)[:, None]], axis=1)
+    return both
+
+
+def _contingency_p(table: np.ndarray, test: str = "chi2") -> float:
+    """Chi-square ("chi2") or G-test ("g") p-value of a (2 x categories) count table."""
+    table = table[:, table.sum(axis=0) > 0]
+    if table.shape[1] < 2 or not table.sum(axis=1).all():
+        return 1.0
+    chi2, p_val, _, _ = chi2_contingency(table, lambda_=CATEGORICAL_TESTS[test])
+    return float(p_val)
+
+
+def _categorical_drift(col, s1: pd.Series, s2: pd.Series, top_k=DEFAULT_TOP_CATEGORIES, test="chi2"):
+    s1, s2 = _categorical_pair(s1, s2)
+    if s1.equals(s2):
+        return (col, "No Change", 1.0)
+    return (col, "Categorical", _contingency_p(frequency_vectors(s1, s2, top_k), test))
+
+
+def _is_numeric(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+
+
+def _as_float(series: pd.Series) -> np.ndarray:
+    return pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _numeric_columns(df1: pd.DataFrame, df2: pd.DataFrame, cols) -> list:
+    """Columns numeric in both frames; one numeric in only one frame is compared as categorical text."""
+    return [c for c in cols if _is_numeric(df1[c]) and _is_numeric(df2[c])]
+
+
+def _categorical_pair(s1: pd.Series, s2: pd.Series):
+    """Both series with numbers written as text ("3", "2.5") when only one of them is numeric."""
+    if _is_numeric(s1) == _is_numeric(s2):
+        return s1, s2
+    from rosdl.eda_profile import _number_text
+    return tuple(s.map(_number_text, na_action="ignore") if _is_numeric(s) else s for s in (s1, s2))
+
+
+# -----------------------------
+# Shared-memory numeric block for worker processes
+# -----------------------------
+def _to_shared(df: pd.DataFrame, cols):
+    """Copy numeric columns into one shared (columns x rows) float64 block; returns (shm, spec)."""
+    shape = (len(cols), len(df))
+    shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * 8, 1))
+    block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    for i, col in enumerate(cols):
+        block[i] = _as_float(df[col])
+    return shm, (shm.name, shape)
+
+
+def _attach(spec):
+    # workers share the parent's resource tracker, which unlinks the block once the parent is done
+    name, shape = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+
+
+def _numeric_drift_shared(spec1, spec2, indices, names):
+    shm1, block1 = _attach(spec1)
+    shm2, block2 = _attach(spec2)
+    try:
+        return [_numeric_drift(name, block1[i], block2[i]) for i, name in zip(indices, names)]
+    finally:
+        del block1, block2
+        shm1.close()
+        shm2.close()
+
+
+def detect_drift(df1: pd.DataFrame, df2: pd.DataFrame, columns=None, workers: int = 1,
+                 top_k: int = DEFAULT_TOP_CATEGORIES, categorical_test: str = "chi2"):
+    """
+    Compare two DataFrames and detect data drift.
+
+    Args:
+        df1, df2: Reference and current data.
+        columns: Optional subset of columns to test (default: all shared columns).
+        workers: With more than one, numeric columns are tested in worker
+            processes that read both tables from shared memory (no pickled
+            copies), while categorical columns run in a thread pool.
+        top_k: Categories compared per categorical column; rarer ones are
+            pooled into "other" (see frequency_vectors).
+        categorical_test: "chi2" (Pearson chi-square) or "g" (G-test).
+
+    Returns:
+        list of (column, type, p_value) in column order.
+    """
+    if categorical_test not in CATEGORICAL_TESTS:
+        raise ValueError(f"categorical_test must be one of {', '.join(CATEGORICAL_TESTS)}")
+    _check_top_k(top_k)
+    cols = [c for c in (columns if columns is not None else df1.columns) if c in df1.columns and c in df2.columns]
+    numeric = _numeric_columns(df1, df2, cols)
+    categorical = [c for c in cols if c not in set(numeric)]
+    results = {}
+
+    if workers <= 1 or len(cols) <= 1:
+        for col in numeric:
+            results[col] = _numeric_drift(col, _as_float(df1[col]), _as_float(df2[col]))
+        for col in categorical:
+            results[col] = _categorical_drift(col, df1[col], df2[col], top_k, categorical_test)
+        return [results[c] for c in cols]
 
-        if np.issubdtype(df1[col].dropna().dtype, np.number):
-            stat, p_val = ks_2samp(df1[col].dropna(), df2[col].dropna())
-            drift_report.append((col, "Numerical", p_val))
+    shms, futures = [], []
+    pool = ProcessPoolExecutor(max_workers=workers) if numeric else None
+    try:
+        if numeric:
+            for df in (df1, df2):
+                shm, spec = _to_shared(df, numeric)
+                shms.append((shm, spec))
+            (_, spec1), (_, spec2) = shms
+            step = max(1, -(-len(numeric) // (4 * workers)))  # ~4 tasks per worker
+            for start in range(0, len(numeric), step):
+                idx = list(range(start, min(start + step, len(numeric))))
+                futures.append(pool.submit(_numeric_drift_shared, spec1, spec2, idx, [numeric[i] for i in idx]))
+        with ThreadPoolExecutor(max_workers=workers) as threads:
+            for res in threads.map(lambda c: _categorical_drift(c, df1[c], df2[c], top_k, categorical_test),
+                                   categorical):
+                results[res[0]] = res
+        for fut in futures:
+            for res in fut.result():
+                results[res[0]] = res
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        for shm, _ in shms:
+            shm.close()
+            shm.unlink()
+    return [results[c] for c in cols]
+
+
+# -----------------------------
+# Drift against a saved reference profile
+# -----------------------------
+def _ks_against_profile(ref, x: np.ndarray) -> float:
+    """Two-sample KS p-value of x against a reference ColumnProfile, from its exact counts or t-digest CDF."""
+    values, counts = np.unique(x, return_counts=True)
+    hi = np.cumsum(counts) / len(x)
+    lo = hi - counts / len(x)
+    exact = ref.value_counts
+    if exact:
+        ref_values = np.array(sorted(exact), dtype=np.float64)
+        ref_cum = np.cumsum([exact[v] for v in sorted(exact)]) / ref.count
+        idx = np.searchsorted(ref_values, values, side="right")
+        f_hi = np.r_[0.0, ref_cum][idx]
+        f_lo = np.r_[0.0, ref_cum][np.searchsorted(ref_values, values, side="left")]
+        d = max(np.max(np.abs(f_hi - hi)), np.max(np.abs(f_lo - lo)))
+    else:
+        f = ref.digest.cdf(values)
+        d = max(np.max(np.abs(f - hi)), np.max(np.abs(f - lo)))
+    n = ref.count * len(x) / (ref.count + len(x))
+    return float(kstwo.sf(d, max(int(round(n)), 1)))
+
+
+def _chi2_against_profile(ref, s: pd.Series, test: str = "chi2") -> float:
+    """Chi-square/G-test of the reference frequency table (top values + "other") against a batch."""
+    ref_counts = pd.Series({k: c - ref.top.error(k) for k, c in ref.top.counts.items()}, dtype=np.float64)
+    ref_other = max(ref.count - ref_counts.sum(), 0)
+    batch = s.value_counts()
+    batch_known = batch.reindex(ref_counts.index, fill_value=0).to_numpy(dtype=np.float64)
+    table = np.array([np.r_[ref_counts.to_numpy(), ref_other], np.r_[batch_known, batch.sum() - batch_known.sum()]])
+    return _contingency_p(table, test)
+
+
+def _batch_pair(ref, s: pd.Series):
+    """
+    A reference column profile and batch column of the same kind, following
+    ColumnProfile.update: numbers stored as text stay numeric, any other text
+    makes the pair categorical (on a copy of the profile), and numbers
+    compared with categories are written as text ("3", "2.5").
+    """
+    from rosdl.eda_profile import _number_text
+    if ref.numeric and not _is_numeric(s):
+        converted = pd.to_numeric(s, errors="coerce")
+        if converted.count() == s.count():
+            return ref, converted
+        ref = copy.deepcopy(ref)._to_categorical()
+        # the values that are numbers must read like the profile's converted keys
+        return ref, converted.map(_number_text, na_action="ignore").fillna(s)
+    if not ref.numeric and _is_numeric(s):
+        s = s.map(_number_text, na_action="ignore")
+    return ref, s
+
+
+def profile_drift(reference, df: pd.DataFrame, columns=None, categorical_test: str = "chi2"):
+    """
+    Compare a batch against a saved reference profile (eda_profile.TableProfile or its path).
+
+    Only the batch is scanned, so the cost grows with batch size, not
+    reference size. Numeric columns get a KS test against the reference CDF
+    (exact for low-cardinality columns, t-digest otherwise); categorical ones a
+    chi-square test against the reference frequency table.
+
+    Returns:
+        list of (column, type, p_value) as detect_drift.
+    """
+    from rosdl.eda_profile import TableProfile
+    if not isinstance(reference, TableProfile):
+        reference = TableProfile.load(reference)
+    cols = [c for c in (columns if columns is not None else df.columns) if c in reference.columns and c in df.columns]
+    report = []
+    for col in cols:
+        ref, s = _batch_pair(reference.columns[col], df[col])
+        if ref.numeric:
+            x = _as_float(s)
+            x = x[~np.isnan(x)]
+            p_val = _ks_against_profile(ref, x) if len(x) and ref.count else 1.0
+            report.append((col, "Numerical", p_val))
         else:
-            contingency = pd.crosstab(df1[col].dropna(), df2[col].dropna())
-            if contingency.shape[0] > 1 and contingency.shape[1] > 1:
-                chi2, p_val, _, _ = chi2_contingency(contingency)
-                drift_report.append((col, "Categorical", p_val))
-            else:
-                drift_report.append((col, "Categorical", 1.0))
-    return drift_report
+            p_val = _chi2_against_profile(ref, s, categorical_test) if ref.count else 1.0
+            report.append((col, "Categorical", p_val))
+    return report
+
+
+def _profile_cdf(prof, x: np.ndarray) -> np.ndarray:
+    """CDF of a numeric ColumnProfile at x: exact from its value counts when available, else its t-digest."""
+    exact = prof.value_counts
+    if exact:
+        values = np.array(sorted(exact), dtype=np.float64)
+        cum = np.cumsum([exact[v] for v in sorted(exact)]) / prof.count
+        return np.r_[0.0, cum][np.searchsorted(values, x, side="right")]
+    return prof.digest.cdf(x)
+
+
+def _profile_support(prof) -> np.ndarray:
+    exact = prof.value_counts
+    return np.array(list(exact), dtype=np.float64) if exact else np.r_[prof.digest.min, prof.digest.means, prof.digest.max]
+
+
+def _profile_pair(ref, cur):
+    """Both column profiles categorical when only one is numeric (as ColumnProfile.merge does), left unmodified."""
+    if ref.numeric is None or cur.numeric is None or ref.numeric == cur.numeric:
+        return ref, cur
+    return tuple(copy.deepcopy(p)._to_categorical() if p.numeric else p for p in (ref, cur))
+
+
+def compare_profiles(reference, current, columns=None, bins: int = 10,
+                     top_k: int = DEFAULT_TOP_CATEGORIES, categorical_test: str = "chi2") -> pd.DataFrame:
+    """
+    Drift between two eda_profile.TableProfile summaries, without the underlying rows.
+
+    Numeric columns: KS statistic between the two profile CDFs (exact counts or
+    t-digests), evaluated on the union of their support points, and PSI over
+    the reference quantile bins. Categorical columns: chi-square/G-test and
+    PSI on the aligned top-value tables plus "other".
+
+    Returns:
+        DataFrame with Column, Type, p_value and PSI.
+    """
+    _check_top_k(top_k)
+    cols = [c for c in (columns if columns is not None else reference.columns)
+            if c in reference.columns and c in current.columns]
+    rows = []
+    for col in cols:
+        ref, cur = _profile_pair(reference.columns[col], current.columns[col])
+        if not ref.count or not cur.count:
+            rows.append((col, "Numerical" if ref.numeric else "Categorical", 1.0, np.nan))
+        elif ref.numeric:
+            x = np.unique(np.r_[_profile_support(ref), _profile_support(cur)])
+            d = float(np.max(np.abs(_profile_cdf(ref, x) - _profile_cdf(cur, x))))
+            n = ref.count * cur.count / (ref.count + cur.count)
+            ref_sorted = np.sort(_profile_support(ref))
+            edges = np.unique(np.interp(np.linspace(0, 1, bins + 1)[1:-1],
+                                        _profile_cdf(ref, ref_sorted), ref_sorted))
+            probs = np.array([np.diff(np.r_[0.0, _profile_cdf(p, edges), 1.0]) for p in (ref, cur)])
+            psi, _ = _psi_js(probs[:1], probs[1:])
+            rows.append((col, "Numerical", float(kstwo.sf(d, max(int(round(n)), 1))), float(psi[0])))
+        else:
+            keys = list(ref.top.counts.keys() | cur.top.counts.keys())
+            both = np.array([[p.top.counts.get(k, 0) - (p.top.error(k) if k in p.top.counts else 0) for k in keys]
+                             for p in (ref, cur)], dtype=np.float64).reshape(2, len(keys))
+            other = tuple(max(p.count - row.sum(), 0) for p, row in zip((ref, cur), both))
+            table = _top_k_table(both, top_k, other)
+            psi, _ = _psi_js(table[:1], table[1:])
+            rows.append((col, "Categorical", _contingency_p(table, categorical_test), float(psi[0])))
+    return pd.DataFrame(rows, columns=["Column", "Type", "p_value", "PSI"])
+
+
+# -----------------------------
+# Distance metrics (PSI / Jensen-Shannon / Wasserstein)
+# -----------------------------
+DRIFT_METRICS = ("psi", "js", "wasserstein")
+DEFAULT_THRESHOLDS = {"psi": 0.2, "js": 0.1, "wasserstein": 0.1}
+DEFAULT_BINS = 10
+_EPS = 1e-6
+
+
+def _stratified_sample(df: pd.DataFrame, size, stratify=None, seed=0) -> pd.DataFrame:
+    """
+    About `size` rows of df.
+
+    With a stratify column every group keeps its share of rows; otherwise one
+    row is drawn from each of `size` equal slices of the row order, so
+    sorted or time-ordered data stays evenly covered.
+    """
+    if not size or len(df) <= size:
+        return df
+    rng = np.random.default_rng(seed)
+    if stratify is not None:
+        frac = size / len(df)
+        return df.groupby(stratify, group_keys=False, dropna=False).sample(frac=frac, random_state=seed)
+    pos = ((np.arange(size) + rng.random(size)) * (len(df) / size)).astype(np.int64)
+    return df.iloc[np.minimum(pos, len(df) - 1)]
+
+
+def _sorted_block(df: pd.DataFrame, cols):
+    """(columns x rows) float64 matrix, each row sorted (NaN last), and the valid count per column."""
+    X = np.array(df[cols].to_numpy(dtype=np.float64, na_value=np.nan).T, order="C")  # own, writable copy
+    X.sort(axis=1)
+    return X, (~np.isnan(X)).sum(axis=1)
+
+
+def _quantiles(X: np.ndarray, valid: np.ndarray, qs: np.ndarray) -> np.ndarray:
+    """(columns x len(qs)) linear-interpolated quantiles of a row-sorted matrix, all columns at once."""
+    last = np.maximum(valid - 1, 0)[:, None]
+    pos = qs[None, :] * last
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.minimum(lo + 1, last)
+    a, b = np.take_along_axis(X, lo, axis=1), np.take_along_axis(X, hi, axis=1)
+    out = a + (b - a) * (pos - lo)
+    out[valid == 0] = np.nan
+    return out
+
+
+def _count_le(X: np.ndarray, valid: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Number of values <= each edge, for every column: a binary search run on
+    all (column, edge) pairs at once, O(columns * edges * log rows).
+    """
+    lo = np.zeros(edges.shape, dtype=np.int64)
+    hi = np.repeat(valid[:, None], edges.shape[1], axis=1).astype(np.int64)
+    top = max(X.shape[1] - 1, 0)
+    while True:
+        active = lo < hi
+        if not active.any():
+            return lo
+        mid = (lo + hi) // 2
+        below = np.take_along_axis(X, np.minimum(mid, top), axis=1) <= edges
+        lo = np.where(active & below, mid + 1, lo)
+        hi = np.where(active & ~below, mid, hi)
+
+
+def _bin_counts(X: np.ndarray, valid: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """(columns x len(edges)+1) histogram over per-column inner edges; outer bins are open-ended."""
+    cum = np.concatenate([np.zeros((len(valid), 1), dtype=np.int64), _count_le(X, valid, edges), valid[:, None]], axis=1)
+    return np.diff(cum, axis=1)
+
+
+def _psi_js(p: np.ndarray, q: np.ndarray):
+    """Row-wise PSI and Jensen-Shannon distance (base 2) of two (rows x bins) count matrices."""
+    p = np.maximum(p / np.maximum(p.sum(axis=1, keepdims=True), 1), _EPS)
+    q = np.maximum(q / np.maximum(q.sum(axis=1, keepdims=True), 1), _EPS)
+    p /= p.sum(axis=1, keepdims=True)
+    q /= q.sum(axis=1, keepdims=True)
+    psi = ((q - p) * np.log(q / p)).sum(axis=1)
+    m = (p + q) / 2
+    js = np.sqrt(np.maximum(0.5 * (p * np.log2(p / m)).sum(axis=1) + 0.5 * (q * np.log2(q / m)).sum(axis=1), 0))
+    return psi, js
+
+
+def drift_metrics(df1: pd.DataFrame, df2: pd.DataFrame, columns=None, bins: int = DEFAULT_BINS,
+                  sample: int = None, stratify=None, thresholds: dict = None, seed: int = 0,
+                  top_k: int = DEFAULT_TOP_CATEGORIES) -> pd.DataFrame:
+    """
+    PSI, Jensen-Shannon distance and Wasserstein distance per column.
+
+    Numeric columns are binned at the reference (df1) deciles (or `bins`
+    quantiles) of each column, shared by both tables; binning, histograms and
+    quantiles are 2-D NumPy operations over all numeric columns at once
+    instead of per-column scipy calls. Categorical columns use their aligned
+    frequency vectors (top_k categories + "other") as bins and have no
+    Wasserstein distance. Unlike p-values these effect sizes do not flag
+    every tiny shift on big samples.
+
+    Args:
+        df1, df2: Reference and current data.
+        columns: Optional subset of columns.
+        bins: Number of quantile bins for numeric columns.
+        sample: Draw at most this many rows from each table (stratified) first.
+        stratify: Column whose groups keep their share of rows when sampling.
+        thresholds: Per-metric limits, e.g. {"psi": 0.25}; missing ones use DEFAULT_THRESHOLDS.
+        seed: Sampling seed.
+        top_k: Categories compared per categorical column.
+
+    Returns:
+        DataFrame with Column, Type, PSI, JS, Wasserstein (in reference
+        standard deviations), a <metric>_drift flag per metric and Drift_Detected.
+    """
+    _check_top_k(top_k)
+    limits = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+    unknown = set(limits) - set(DRIFT_METRICS)
+    if unknown:
+        raise ValueError(f"Unknown drift metric(s): {', '.join(sorted(unknown))}")
+    if stratify is not None and (stratify not in df1.columns or stratify not in df2.columns):
+        raise ValueError(f"Stratify column '{stratify}' is not in both tables")
+    cols = [c for c in (columns if columns is not None else df1.columns) if c in df1.columns and c in df2.columns]
+    out_cols = ["Column", "Type", "PSI", "JS", "Wasserstein"] + [f"{m}_drift" for m in DRIFT_METRICS] + ["Drift_Detected"]
+    if not cols:
+        return pd.DataFrame(columns=out_cols)
+
+    keep = cols + [stratify] if stratify is not None and stratify not in cols else cols
+    df1 = _stratified_sample(df1[keep], sample, stratify, seed)
+    df2 = _stratified_sample(df2[keep], sample, stratify, seed)
+    numeric = _numeric_columns(df1, df2, cols)
+    rows = {}
+
+    if numeric:
+        X1, n1 = _sorted_block(df1, numeric)
+        X2, n2 = _sorted_block(df2, numeric)
+        edges = _quantiles(X1, n1, np.linspace(0, 1, bins + 1))[:, 1:-1]
+        psi, js = _psi_js(_bin_counts(X1, n1, edges).astype(np.float64), _bin_counts(X2, n2, edges).astype(np.float64))
+
+        # W1 = integral over u of |Q1(u) - Q2(u)|, on a shared grid of quantile levels
+        grid = (np.arange(200) + 0.5) / 200
+        w = np.abs(_quantiles(X1, n1, grid) - _quantiles(X2, n2, grid)).mean(axis=1)
+        mean = np.nansum(X1, axis=1) / np.maximum(n1, 1)
+        std = np.sqrt(np.nansum((X1 - mean[:, None]) ** 2, axis=1) / np.maximum(n1, 1))
+        wasserstein = w / np.where(std > 0, std, 1.0)
+        empty = (n1 == 0) | (n2 == 0)
+        for j, col in enumerate(numeric):
+            values = (np.nan,) * 3 if empty[j] else (psi[j], js[j], wasserstein[j])
+            rows[col] = (col, "Numerical", *values)
+
+    for col in cols:
+        if col in rows:
+            continue
+        table = frequency_vectors(*_categorical_pair(df1[col], df2[col]), top_k)
+        if not table.size or not table.sum(axis=1).all():
+            rows[col] = (col, "Categorical", np.nan, np.nan, np.nan)
+            continue
+        psi, js = _psi_js(table[:1], table[1:])
+        rows[col] = (col, "Categorical", psi[0], js[0], np.nan)
+
+    report = pd.DataFrame([rows[c] for c in cols], columns=out_cols[:5])
+    for metric, name in zip(DRIFT_METRICS, ("PSI", "JS", "Wasserstein")):
+        report[f"{metric}_drift"] = report[name] > limits[metric]
+    report["Drift_Detected"] = report[[f"{m}_drift" for m in DRIFT_METRICS]].any(axis=1)
+    return report[out_cols]
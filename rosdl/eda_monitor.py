@@ -0,0 +1,278 @@
+# rosdl/core/eda_monitor.py
+"""
+Windowed drift monitoring over a time column.
+
+Rows are bucketed into time windows (e.g. daily) and each window is reduced
+to a mergeable eda_profile.TableProfile. Window profiles are cached on disk
+per source file, so a new daily file, or rows appended to a growing CSV, only
+costs reading that new data. Each window is compared with the merged profiles
+of the windows before it (eda_drift_module.compare_profiles), and those
+results are cached as well, so only windows whose inputs changed are
+recomputed. The output is a long time-series table: one row per window and
+column.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from rosdl import table_loader
+from rosdl import eda_drift_module as eda
+from rosdl.eda_profile import TableProfile, DEFAULT_CHUNKSIZE
+
+DEFAULT_WINDOW = "1D"
+DEFAULT_REFERENCE_WINDOWS = 30
+DEFAULT_ALPHA = 0.05
+CACHE_SUFFIX = ".drift_cache"
+MANIFEST = "manifest.json"
+PROFILE_OPTIONS = dict(top_k=100, hll_p=12)  # smaller sketches: there is one profile per window and source
+_TAIL_BYTES = 1 << 16
+
+
+def window_starts(times: pd.Series, window: str) -> pd.Series:
+    """Start of the window each timestamp falls in: fixed frequencies ("1D", "6h") or calendar ones ("W", "MS")."""
+    try:
+        return times.dt.floor(window)
+    except ValueError:
+        return times.dt.to_period(window).dt.start_time
+
+
+def _parse_times(values: pd.Series) -> pd.Series:
+    times = pd.to_datetime(values, errors="coerce", utc=True)
+    return times.dt.tz_convert(None)  # timezone-aware data is windowed in UTC
+
+
+def _window_key(ts: pd.Timestamp) -> str:
+    return ts.strftime("%Y%m%dT%H%M%S")
+
+
+def _tail_hash(path: str, end: int) -> str:
+    with open(path, "rb") as f:
+        f.seek(max(end - _TAIL_BYTES, 0))
+        return hashlib.blake2b(f.read(end - max(end - _TAIL_BYTES, 0)), digest_size=16).hexdigest()
+
+
+class WindowCache:
+    """
+    On-disk cache of per-window profiles for a set of source files.
+
+    Layout: <cache_dir>/manifest.json plus <source id>/<window>.profile.json.
+    The cache is reset when the time column, window or column selection changes.
+    """
+
+    def __init__(self, cache_dir: str, time_column: str, window: str = DEFAULT_WINDOW, columns=None):
+        self.cache_dir = cache_dir
+        self.params = {"time_column": time_column, "window": window, "columns": list(columns) if columns else None}
+        os.makedirs(cache_dir, exist_ok=True)
+        self.manifest = self._load_manifest()
+        if self.manifest.get("params") != self.params:
+            for entry in os.listdir(cache_dir):
+                full = os.path.join(cache_dir, entry)
+                if os.path.isdir(full):
+                    shutil.rmtree(full)
+            self.manifest = {"params": self.params, "sources": {}, "drift": {}}
+
+    def _load_manifest(self) -> dict:
+        try:
+            with open(os.path.join(self.cache_dir, MANIFEST), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        tmp = os.path.join(self.cache_dir, MANIFEST + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f)
+        os.replace(tmp, os.path.join(self.cache_dir, MANIFEST))
+
+    def _source_dir(self, path: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.blake2b(path.encode("utf-8"), digest_size=8).hexdigest())
+
+    def _profile_path(self, path: str, key: str) -> str:
+        return os.path.join(self._source_dir(path), key + ".profile.json")
+
+    # -----------------------------
+    # Reading sources
+    # -----------------------------
+    def _chunks(self, path: str, offset: int, layout, chunksize: int):
+        usecols = self.params["columns"]
+        if usecols is not None:
+            usecols = list(dict.fromkeys(usecols + [self.params["time_column"]]))
+        if not offset:
+            yield from table_loader.read_table(path, usecols=usecols, chunksize=chunksize)
+            return
+        # appended rows only: continue after the bytes already profiled, parsed
+        # with the full header and the dtypes the first read used
+        dtypes = {c: t for c, t in layout["dtypes"].items() if usecols is None or c in usecols}
+        with open(path, "rb") as f:
+            f.seek(offset)
+            yield from table_loader._iter_csv(f, dtypes, chunksize, False, None, header=None,
+                                              names=layout["header"], usecols=usecols)
+
+    @staticmethod
+    def _csv_layout(path: str) -> dict:
+        """Full header and table_loader dtype map of a CSV, kept to parse rows appended later."""
+        schema = table_loader.load_schema(path) or table_loader.infer_schema(path)
+        return {"header": list(pd.read_csv(path, nrows=0).columns), "dtypes": schema["dtypes"]}
+
+    def _profile_source(self, path: str, offset: int, layout, chunksize: int):
+        """Profile rows of path (from offset) into {window start: TableProfile}; returns (profiles, rows)."""
+        time_column = self.params["time_column"]
+        windows, rows = {}, 0
+        for chunk in self._chunks(path, offset, layout, chunksize):
+            if time_column not in chunk.columns:
+                raise KeyError(f"Time column '{time_column}' not found in {path}")
+            starts = window_starts(_parse_times(chunk[time_column]), self.params["window"])
+            data = chunk.drop(columns=[time_column])
+            rows += len(chunk)
+            for start, idx in starts.groupby(starts).groups.items():
+                windows.setdefault(start, TableProfile(**PROFILE_OPTIONS)).update(data.loc[idx])
+        return windows, rows
+
+    def refresh(self, paths, chunksize: int = DEFAULT_CHUNKSIZE) -> dict:
+        """
+        Bring the cache in line with `paths`: new or changed files are profiled,
+        appended CSV rows are profiled on their own, vanished files are dropped.
+
+        A CSV counts as appended to when it grew and the bytes before the old
+        end are unchanged (checked on its last 64 KiB); it should end with a
+        newline between writes.
+
+        Returns:
+            dict: "rows_read" and "windows_updated" (sorted window start keys).
+        """
+        sources = self.manifest["sources"]
+        paths = [os.path.abspath(p) for p in paths]
+        updated, rows_read = set(), 0
+        for gone in set(sources) - set(paths):
+            updated.update(sources.pop(gone)["windows"])
+            shutil.rmtree(self._source_dir(gone), ignore_errors=True)
+
+        for path in paths:
+            st = os.stat(path)
+            entry = sources.get(path)
+            if entry and (entry["size"], entry["mtime_ns"]) == (st.st_size, st.st_mtime_ns):
+                continue
+            is_csv = not path.lower().endswith((".parquet", ".pq"))
+            appended = (entry is not None and is_csv and entry.get("layout") and st.st_size > entry["offset"] > 0
+                        and _tail_hash(path, entry["offset"]) == entry["tail"])
+            if not appended and entry:
+                updated.update(entry["windows"])
+                shutil.rmtree(self._source_dir(path), ignore_errors=True)
+                entry = None
+
+            windows, rows = self._profile_source(path, entry["offset"] if appended else 0,
+                                                 entry["layout"] if appended else None, chunksize)
+            layout = entry["layout"] if appended else self._csv_layout(path) if is_csv else None
+            os.makedirs(self._source_dir(path), exist_ok=True)
+            for start, prof in windows.items():
+                key = _window_key(start)
+                target = self._profile_path(path, key)
+                if appended and os.path.exists(target):
+                    prof = TableProfile.load(target).merge(prof)
+                prof.save(target)
+                updated.add(key)
+            # per-window stamps change only for windows that received rows
+            stamps = dict(entry["windows"]) if appended else {}
+            stamps.update({_window_key(s): f"{st.st_size}:{st.st_mtime_ns}" for s in windows})
+            sources[path] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "offset": st.st_size if is_csv else 0,
+                             "tail": _tail_hash(path, st.st_size) if is_csv else "", "layout": layout,
+                             "windows": stamps}
+            rows_read += rows
+        self.save()
+        return {"rows_read": rows_read, "windows_updated": sorted(updated)}
+
+    # -----------------------------
+    # Window profiles
+    # -----------------------------
+    def window_keys(self):
+        return sorted({k for entry in self.manifest["sources"].values() for k in entry["windows"]})
+
+    def window_profile(self, key: str) -> TableProfile:
+        """Profile of one window, merged over all sources."""
+        total = TableProfile(**PROFILE_OPTIONS)
+        for path, entry in self.manifest["sources"].items():
+            if key in entry["windows"]:
+                total.merge(TableProfile.load(self._profile_path(path, key)))
+        return total
+
+    def window_version(self, key: str) -> str:
+        """Changes whenever any source data of the window changes."""
+        parts = sorted(f"{p}:{e['windows'][key]}" for p, e in self.manifest["sources"].items()
+                       if key in e["windows"])
+        return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def monitor_drift(paths, time_column: str, window: str = DEFAULT_WINDOW,
+                  reference_windows: int = DEFAULT_REFERENCE_WINDOWS, cache_dir: str = None, columns=None,
+                  chunksize: int = DEFAULT_CHUNKSIZE, categorical_test: str = "chi2", alpha: float = DEFAULT_ALPHA,
+                  psi_threshold: float = eda.DEFAULT_THRESHOLDS["psi"]) -> pd.DataFrame:
+    """
+    Drift of every window against the `reference_windows` windows with data before it.
+
+    Args:
+        paths: One data file or a list of them (CSV/Parquet), e.g. one file per day.
+        time_column: Timestamp column used for windowing.
+        window: Window length as a pandas frequency ("1D", "6h", "W", "MS").
+        reference_windows: Number of preceding windows merged into the reference.
+        cache_dir: Sketch cache (default: <first file>.drift_cache).
+        columns: Optional subset of columns to monitor.
+        chunksize: Rows read per chunk.
+        categorical_test: "chi2" or "g" for categorical columns.
+        alpha: p-value below which a column counts as drifted.
+        psi_threshold: PSI above which a column counts as drifted.
+
+    Returns:
+        DataFrame with Window, Column, Type, Rows, Reference_Rows, p_value, PSI
+        and Drift_Detected, ordered by window.
+    """
+    paths = [paths] if isinstance(paths, (str, os.PathLike)) else list(paths)
+    cache = WindowCache(cache_dir or os.fspath(paths[0]) + CACHE_SUFFIX, time_column, window, columns)
+    cache.refresh(paths, chunksize=chunksize)
+
+    keys = cache.window_keys()
+    cached = cache.manifest.setdefault("drift", {})
+    settings = f"{reference_windows}:{categorical_test}"
+    profiles = {}
+
+    def profile(key):
+        if key not in profiles:
+            profiles[key] = cache.window_profile(key)
+        return profiles[key]
+
+    results = []
+    for i, key in enumerate(keys):
+        ref_keys = keys[max(0, i - reference_windows):i]
+        if not ref_keys:
+            continue
+        signature = hashlib.blake2b("|".join([settings] + [f"{k}:{cache.window_version(k)}" for k in ref_keys + [key]])
+                                    .encode("utf-8"), digest_size=8).hexdigest()
+        hit = cached.get(key)
+        if hit and hit["signature"] == signature:
+            results.extend(hit["rows"])
+            continue
+        reference = TableProfile(**PROFILE_OPTIONS)
+        for k in ref_keys:
+            reference.merge(profile(k))
+        current = profile(key)
+        table = eda.compare_profiles(reference, current, categorical_test=categorical_test)
+        rows = [[key, r.Column, r.Type, current.rows, reference.rows, r.p_value, r.PSI] for r in table.itertuples()]
+        cached[key] = {"signature": signature, "rows": rows}
+        results.extend(rows)
+        # windows far behind are no longer needed as reference
+        for old in [k for k in profiles if k < keys[max(0, i + 1 - reference_windows)]]:
+            del profiles[old]
+    for stale in set(cached) - set(keys):
+        del cached[stale]
+    cache.save()
+
+    report = pd.DataFrame(results, columns=["Window", "Column", "Type", "Rows", "Reference_Rows", "p_value", "PSI"])
+    report["Window"] = pd.to_datetime(report["Window"], format="%Y%m%dT%H%M%S")
+    report["p_value"] = report["p_value"].astype(np.float64)
+    report["PSI"] = report["PSI"].astype(np.float64)
+    report["Drift_Detected"] = (report["p_value"] < alpha) | (report["PSI"] > psi_threshold)
+    return report
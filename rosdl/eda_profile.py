@@ -0,0 +1,346 @@
+# rosdl/core/eda_profile.py
+"""
+Chunked, mergeable profiling for tables larger than memory.
+
+A CSV or Parquet file is read in chunks (table_loader.read_table) and every
+column keeps small accumulators that are updated per chunk:
+
+- null and value counts
+- Welford mean/variance, combined across chunks with Chan's parallel update
+- min/max and t-digest quantiles for numeric columns
+- HyperLogLog distinct counts
+- Space-Saving top-k values for non-numeric columns, and exact value counts
+  for numeric columns with at most top_k distinct values
+
+Profiles of different chunks merge into one, so chunks can be profiled in
+worker processes. report() has the same shape as eda_drift_module.quick_eda;
+quantiles and distinct counts are estimates. Profiles are saved as compact
+JSON (PROFILE_SUFFIX) and serve as drift references, see
+eda_drift_module.profile_drift.
+"""
+
+import copy
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from rosdl import table_loader
+from rosdl.sketches import SpaceSaving, HyperLogLog, TDigest
+
+DEFAULT_CHUNKSIZE = 100_000
+DEFAULT_TOP_K = 100
+DEFAULT_COMPRESSION = 200
+DEFAULT_HLL_P = 14
+PROFILE_SUFFIX = ".profile.json"
+PROFILE_VERSION = 1
+NUMERIC_STATS = ("mean", "std", "min", "25%", "50%", "75%", "max")
+CATEGORY_STATS = ("unique", "top", "freq")
+
+
+def _is_numeric(dtype) -> bool:
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def _number_text(v) -> str:
+    """A number as it would read in a CSV ("3", "2.5"), so it matches the same value seen as text."""
+    v = float(v)
+    return str(int(v)) if v.is_integer() else repr(v)
+
+
+def _common_dtype(a, b):
+    if a is None or a == b:
+        return b
+    if _is_numeric(a) and _is_numeric(b):
+        try:
+            return np.promote_types(a, b)
+        except TypeError:
+            pass
+    return np.dtype(object)
+
+
+class ColumnProfile:
+    """Mergeable summary of one column."""
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K, compression: int = DEFAULT_COMPRESSION, hll_p: int = DEFAULT_HLL_P):
+        self.dtype = None
+        self.numeric = None
+        self.count = 0
+        self.nulls = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.digest = TDigest(compression)
+        self.distinct = HyperLogLog(hll_p)
+        self.top = SpaceSaving(top_k)
+        self.overflow = False  # more distinct values than top_k (numeric) or counts lost on a type switch
+
+    def _add_moments(self, n, mean, m2):
+        # Chan et al. pairwise update of Welford's running mean and M2
+        total = self.count + n
+        if not n or not total:
+            return
+        delta = mean - self.mean
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.mean += delta * n / total
+
+    def _to_categorical(self) -> "ColumnProfile":
+        """
+        Turn a numeric profile categorical, after a chunk held values that are
+        not numbers. Known value counts carry over as text ("3", "2.5"); once a
+        numeric column has overflowed they are gone, and the frequency table
+        covers only the later chunks (value_counts/unique become estimates).
+        """
+        counts = {} if self.overflow else {_number_text(v): c for v, c in self.top.counts.items()}
+        self.numeric, self.dtype = False, np.dtype(object)
+        self.mean, self.m2 = 0.0, 0.0
+        self.digest = TDigest(self.digest.compression)
+        self.top = SpaceSaving(self.top.capacity).update_counts(counts)
+        if counts:
+            self.distinct = HyperLogLog(self.distinct.p)
+            self.distinct.update_hashes(pd.util.hash_array(np.array(list(counts), dtype=object)))
+        return self
+
+    def update(self, series: pd.Series) -> "ColumnProfile":
+        if self.numeric is None:
+            self.numeric = _is_numeric(series.dtype)
+        self.dtype = _common_dtype(self.dtype, series.dtype)
+        if self.numeric and not _is_numeric(series.dtype):
+            # chunk parsed differently: numbers stored as text stay numeric, anything else makes the column categorical
+            converted = pd.to_numeric(series, errors="coerce")
+            if converted.count() == series.count():
+                series = converted
+            else:
+                self._to_categorical()
+        if not self.numeric and _is_numeric(series.dtype):
+            series = series.map(_number_text, na_action="ignore")
+        valid = series.dropna()
+        n = len(valid)
+        self.nulls += len(series) - n
+        if self.numeric:
+            x = valid.to_numpy(dtype=np.float64)
+            if n:
+                mean = float(x.mean())
+                self._add_moments(n, mean, float(((x - mean) ** 2).sum()))
+                self.digest.update(x)
+                values, counts = np.unique(x, return_counts=True)
+                self.distinct.update_hashes(pd.util.hash_array(values))
+                self._count_numeric(dict(zip(values.tolist(), counts.tolist())))
+        else:
+            counts = valid.value_counts(sort=False)
+            counts = counts[counts > 0]  # unused categories of a categorical dtype
+            self.top.update_counts(counts.to_dict())
+            self.distinct.update_hashes(pd.util.hash_array(counts.index.astype(str).to_numpy(dtype=object)))
+        self.count += n
+        return self
+
+    def merge(self, other: "ColumnProfile") -> "ColumnProfile":
+        if self.numeric is None:
+            self.numeric = other.numeric
+        elif other.numeric is not None and self.numeric != other.numeric:
+            # one side saw non-numeric values: the merged column is categorical
+            if self.numeric:
+                self._to_categorical()
+            else:
+                other = copy.deepcopy(other)._to_categorical()
+        self.dtype = _common_dtype(self.dtype, other.dtype)
+        self._add_moments(other.count, other.mean, other.m2)
+        self.count += other.count
+        self.nulls += other.nulls
+        self.digest.merge(other.digest)
+        self.distinct.merge(other.distinct)
+        self.overflow = self.overflow or other.overflow
+        if self.numeric:
+            self._count_numeric(other.top.counts)
+        else:
+            self.top.merge(other.top)
+        return self
+
+    def _count_numeric(self, counts):
+        if not self.overflow and len(self.top.counts.keys() | counts.keys()) > self.top.capacity:
+            self.overflow = True
+            self.top = SpaceSaving(self.top.capacity)
+        if not self.overflow:
+            self.top.update_counts(counts)
+
+    @property
+    def value_counts(self):
+        """Exact {value: count} when every distinct value fits in top_k, else None."""
+        if self.overflow or (not self.numeric and self.top.floor):
+            return None
+        return dict(self.top.counts)
+
+    @property
+    def unique(self) -> int:
+        """Distinct non-null values: exact while the top-k sketch holds them all, else a HyperLogLog estimate."""
+        if self.value_counts is not None:
+            return len(self.top)
+        return min(self.distinct.count(), self.count)
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan
+
+    def stats(self) -> dict:
+        """describe()-style statistics for this column."""
+        out = {"count": float(self.count)}
+        if self.numeric:
+            q25, q50, q75 = self.digest.quantile([0.25, 0.5, 0.75]) if self.count else (np.nan,) * 3
+            out.update({"mean": self.mean if self.count else np.nan, "std": self.std,
+                        "min": self.digest.min if self.count else np.nan, "25%": q25, "50%": q50, "75%": q75,
+                        "max": self.digest.max if self.count else np.nan})
+        else:
+            # guaranteed counts (estimate - error); exact until the sketch overflows
+            top = max(((v, c - self.top.error(v)) for v, c in self.top.counts.items()), key=lambda t: t[1], default=None)
+            out.update({"unique": self.unique, "top": top[0] if top else np.nan, "freq": top[1] if top else np.nan})
+        return out
+
+    def to_dict(self) -> dict:
+        return {"dtype": str(self.dtype), "numeric": self.numeric, "count": self.count, "nulls": self.nulls,
+                "mean": self.mean, "m2": self.m2, "overflow": self.overflow, "digest": self.digest.to_dict(),
+                "distinct": self.distinct.to_dict(),
+                "top": self.top.to_dict() if self.numeric else _json_keys(self.top).to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ColumnProfile":
+        prof = cls()
+        prof.dtype, prof.numeric, prof.overflow = data["dtype"], data["numeric"], data["overflow"]
+        prof.count, prof.nulls, prof.mean, prof.m2 = data["count"], data["nulls"], data["mean"], data["m2"]
+        prof.digest = TDigest.from_dict(data["digest"])
+        prof.distinct = HyperLogLog.from_dict(data["distinct"])
+        prof.top = SpaceSaving.from_dict(data["top"])
+        return prof
+
+
+def _json_keys(sketch: SpaceSaving) -> SpaceSaving:
+    """Copy of a top-k sketch whose items are JSON scalars (other values, e.g. timestamps, as str)."""
+    def key(v):
+        if isinstance(v, (str, bool)) or v is None:
+            return v
+        if isinstance(v, (int, float, np.integer, np.floating, np.bool_)):
+            return v.item() if hasattr(v, "item") else v
+        return str(v)
+
+    out = SpaceSaving(sketch.capacity)
+    for v, c in sketch.counts.items():
+        k = key(v)
+        out.counts[k] = out.counts.get(k, 0) + int(c)
+        out.errors[k] = out.errors.get(k, 0) + int(sketch.errors.get(v, 0))
+    return out
+
+
+class TableProfile:
+    """Per-column profiles of a table, updated chunk by chunk and mergeable."""
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K, compression: int = DEFAULT_COMPRESSION, hll_p: int = DEFAULT_HLL_P):
+        self.options = dict(top_k=top_k, compression=compression, hll_p=hll_p)
+        self.rows = 0
+        self.columns = {}
+
+    def _column(self, name) -> ColumnProfile:
+        if name not in self.columns:
+            self.columns[name] = ColumnProfile(**self.options)
+        return self.columns[name]
+
+    def update(self, df: pd.DataFrame) -> "TableProfile":
+        self.rows += len(df)
+        for col in df.columns:
+            self._column(col).update(df[col])
+        return self
+
+    def merge(self, other: "TableProfile") -> "TableProfile":
+        self.rows += other.rows
+        for name, prof in other.columns.items():
+            self._column(name).merge(prof)
+        return self
+
+    def report(self) -> dict:
+        """Report in the shape of eda_drift_module.quick_eda."""
+        cols = list(self.columns)
+        stats = {c: p.stats() for c, p in self.columns.items()}
+        keys = ["count"]
+        if any(not p.numeric for p in self.columns.values()):
+            keys += CATEGORY_STATS
+        if any(p.numeric for p in self.columns.values()):
+            keys += NUMERIC_STATS
+
+        def fmt(v):
+            return round(float(v), 2) if isinstance(v, (float, np.floating)) else v
+
+        return {
+            "shape": (self.rows, len(cols)),
+            "dtypes": {c: self.columns[c].dtype for c in cols},
+            "missing": {c: self.columns[c].nulls for c in cols},
+            "basic_stats": {k: {c: fmt(stats[c].get(k, np.nan)) for c in cols} for k in keys},
+            "unique_values": {c: self.columns[c].unique for c in cols},
+        }
+
+    # -----------------------------
+    # Persistence
+    # -----------------------------
+    def save(self, path: str) -> str:
+        """Write the profile as JSON; returns the path."""
+        data = {"version": PROFILE_VERSION, "rows": self.rows, "options": self.options,
+                "columns": [[name, prof.to_dict()] for name, prof in self.columns.items()]}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "TableProfile":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != PROFILE_VERSION:
+            raise ValueError(f"{path} is not a rosdl profile (version {PROFILE_VERSION})")
+        profile = cls(**data["options"])
+        profile.rows = data["rows"]
+        profile.columns = {name: ColumnProfile.from_dict(col) for name, col in data["columns"]}
+        return profile
+
+
+def _profile_chunk(df, options):
+    return TableProfile(**options).update(df)
+
+
+def profile_chunks(chunks, workers: int = 1, **options) -> TableProfile:
+    """Profile an iterable of DataFrames, optionally in worker processes, and merge the results."""
+    total = TableProfile(**options)
+    if workers <= 1:
+        for df in chunks:
+            total.update(df)
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for df in chunks:
+            pending.append(pool.submit(_profile_chunk, df, total.options))
+            if len(pending) >= 2 * workers:  # bound the chunks held in memory
+                total.merge(pending.popleft().result())
+        while pending:
+            total.merge(pending.popleft().result())
+    return total
+
+
+def profile_table(path, chunksize: int = DEFAULT_CHUNKSIZE, workers: int = 1, usecols=None, **options) -> TableProfile:
+    """Profile a CSV or Parquet file in chunks of `chunksize` rows."""
+    chunks = table_loader.read_table(path, usecols=usecols, chunksize=chunksize)
+    return profile_chunks(chunks, workers=workers, **options)
+
+
+def streaming_eda(path, chunksize: int = DEFAULT_CHUNKSIZE, workers: int = 1, **options) -> dict:
+    """quick_eda for files that do not fit in memory; same report shape, approximate quantiles and uniques."""
+    return profile_table(path, chunksize=chunksize, workers=workers, **options).report()
+
+
+def build_reference(path, output: str = None, chunksize: int = DEFAULT_CHUNKSIZE, workers: int = 1,
+                    usecols=None, top_k: int = 1000, **options) -> str:
+    """
+    Profile a reference table once and save it for drift checks.
+
+    A larger top_k than for EDA keeps exact frequency tables for categorical
+    and low-cardinality numeric columns. Returns the saved profile path
+    (default: <path>.profile.json).
+    """
+    output = output or str(path) + PROFILE_SUFFIX
+    return profile_table(path, chunksize=chunksize, workers=workers, usecols=usecols,
+                         top_k=top_k, **options).save(output)
@@ -1,6 +1,13 @@
 # rosdl/core/file_converter.py
 
 import os
+import glob
+import json
+import time
+import hashlib
+import multiprocessing
+from collections import deque
+from multiprocessing.connection import wait
 import pandas as pd
 from openpyxl import Workbook
 from moviepy import VideoFileClip
@@ -8,6 +15,12 @@ from pdf2docx import Converter
 from docx import Document
 from fpdf import FPDF
 from PIL import Image
+from rosdl.table_loader import read_table
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
 
 
 # ------------------------------
@@ -18,7 +31,7 @@ def csv_to_xlsx(input_csv, output_xlsx=None):
         output_xlsx = os.path.splitext(input_csv)[0] + ".xlsx"
 
     try:
-        df = pd.read_csv(input_csv)
+        df = read_table(input_csv)
         df.to_excel(output_xlsx, index=False)
         return f"✅ CSV converted to Excel: {output_xlsx}"
     except Exception as e:
@@ -89,3 +102,302 @@ def image_format_convert(input_image, output_image=None):
         return f"✅ Image converted: {output_image}"
     except Exception as e:
         return f"❌ Error converting image: {e}"
+
+
+# ------------------------------
+# Batch Conversion
+# ------------------------------
+# name -> (converter function, default output extension)
+BATCH_CONVERTERS = {
+    "csv-to-xlsx": (csv_to_xlsx, ".xlsx"),
+    "xlsx-to-csv": (xlsx_to_csv, ".csv"),
+    "pdf-to-word": (pdf_to_word, ".docx"),
+    "mp4-to-mp3": (mp4_to_mp3, ".mp3"),
+    "image-format": (image_format_convert, ".png"),
+}
+
+EXTENSION_CONVERTERS = {
+    ".csv": "csv-to-xlsx",
+    ".xlsx": "xlsx-to-csv",
+    ".xls": "xlsx-to-csv",
+    ".pdf": "pdf-to-word",
+    ".mp4": "mp4-to-mp3",
+    ".jpg": "image-format", ".jpeg": "image-format", ".png": "image-format",
+    ".bmp": "image-format", ".gif": "image-format", ".tiff": "image-format",
+    ".tif": "image-format", ".webp": "image-format",
+}
+
+BATCH_STATE_FILE = ".rosdl_batch_state.json"
+
+
+def _make_job(input_path, output=None, converter=None, to=None, output_dir=None):
+    """Build a job dict, picking the converter from the input extension if not given."""
+    ext = os.path.splitext(input_path)[1].lower()
+    converter = converter or EXTENSION_CONVERTERS.get(ext)
+    if converter not in BATCH_CONVERTERS:
+        raise ValueError(f"No converter for {input_path!r} (converter={converter!r})")
+    if output is None:
+        out_ext = to or BATCH_CONVERTERS[converter][1]
+        if not out_ext.startswith("."):
+            out_ext = "." + out_ext
+        base = os.path.splitext(os.path.basename(input_path))[0]
+        out_dir = output_dir or os.path.dirname(os.path.abspath(input_path))
+        output = os.path.join(out_dir, base + out_ext.lower())
+        if os.path.abspath(output) == os.path.abspath(input_path):
+            output = os.path.join(out_dir, base + "_converted" + out_ext.lower())
+    return {"input": input_path, "output": output, "converter": converter}
+
+
+def load_manifest(manifest_path):
+    """
+    Load a JSON/YAML job manifest.
+
+    The manifest is either a list of jobs or a mapping with ``jobs`` and an
+    optional ``output_dir``. Each job is a path/glob string or a mapping with
+    ``input`` and optional ``output``, ``converter`` and ``to`` keys.
+    Relative paths are resolved against the manifest folder.
+    """
+    with open(manifest_path, encoding="utf-8") as f:
+        if manifest_path.lower().endswith((".yaml", ".yml")):
+            if not yaml:
+                raise ImportError("PyYAML is not installed. Install it with: pip install pyyaml")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    resolve = lambda p: p if p is None or os.path.isabs(p) else os.path.join(base_dir, p)
+    if isinstance(data, dict):
+        entries, output_dir = data.get("jobs", []), resolve(data.get("output_dir"))
+    else:
+        entries, output_dir = data or [], None
+
+    jobs = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {"input": entry}
+        pattern = resolve(entry["input"])
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        for path in matches:
+            jobs.append(_make_job(
+                path,
+                output=resolve(entry.get("output")) if len(matches) == 1 else None,
+                converter=entry.get("converter"),
+                to=entry.get("to"),
+                output_dir=resolve(entry.get("output_dir")) or output_dir,
+            ))
+    return jobs
+
+
+def _mark_feedback_jobs(jobs):
+    """
+    Flag jobs that would feed on or overwrite each other within one plan.
+
+    Round-trip converters (csv-to-xlsx / xlsx-to-csv) writing next to their
+    inputs would otherwise, on a re-run, convert their own outputs back over
+    the source files. Both jobs of such a pair, and any job reading a file
+    that another job writes, get a "skip_reason"; run_batch reports them as
+    skipped with it.
+    """
+    by_output = {os.path.abspath(j["output"]): j for j in jobs}
+    for job in jobs:
+        writer = by_output.get(os.path.abspath(job["input"]))
+        if writer is None:
+            continue
+        if os.path.abspath(writer["input"]) == os.path.abspath(job["output"]):
+            for j, other in ((job, writer), (writer, job)):
+                j["skip_reason"] = (f"round trip with {other['input']}; pass an output folder "
+                                    "to convert both directions")
+        else:
+            job.setdefault("skip_reason", f"input is written by this batch (from {writer['input']})")
+    return jobs
+
+
+def plan_batch(source, output_dir=None, recursive=False, to=None):
+    """
+    Build conversion jobs from a folder, a glob pattern or a JSON/YAML manifest.
+    Files without a known converter are ignored for folders and globs. Jobs
+    that would read another job's output, or convert a round trip back over
+    its source, carry a "skip_reason" (see _mark_feedback_jobs); pass
+    output_dir to convert those.
+    """
+    if os.path.isfile(source) and source.lower().endswith((".json", ".yaml", ".yml")):
+        return _mark_feedback_jobs(load_manifest(source))
+
+    if os.path.isdir(source):
+        paths = []
+        for r, _, fs in os.walk(source):
+            paths.extend(os.path.join(r, f) for f in sorted(fs))
+            if not recursive:
+                break
+    else:
+        paths = sorted(glob.glob(source, recursive=recursive))
+
+    jobs = []
+    for path in paths:
+        converter = EXTENSION_CONVERTERS.get(os.path.splitext(path)[1].lower())
+        if os.path.isfile(path) and converter:
+            to_ext = to if converter == "image-format" else None
+            jobs.append(_make_job(path, converter=converter, to=to_ext, output_dir=output_dir))
+    return _mark_feedback_jobs(jobs)
+
+
+def file_sha256(path, block_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _is_up_to_date(job, skip, state):
+    src, dst = job["input"], job["output"]
+    if skip == "none" or not os.path.exists(dst):
+        return False
+    if skip == "mtime":
+        return os.path.getmtime(dst) >= os.path.getmtime(src)
+    if skip == "hash":
+        entry = state.get(os.path.abspath(src))
+        return bool(entry) and entry.get("output") == os.path.abspath(dst) \
+            and entry.get("sha256") == job.setdefault("sha256", file_sha256(src))
+    raise ValueError(f"Unknown skip mode: {skip}")
+
+
+def _batch_worker(conn):
+    """Worker loop: receive jobs over a pipe until None, send back results."""
+    while True:
+        job = conn.recv()
+        if job is None:
+            break
+        func = BATCH_CONVERTERS[job["converter"]][0]
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(job["output"])), exist_ok=True)
+            msg = str(func(job["input"], job["output"]))
+            status = "failed" if msg.startswith("❌") else "converted"
+        except Exception as e:
+            msg, status = f"❌ {e}", "failed"
+        conn.send((status, msg))
+
+
+class _BatchWorker:
+    """One pool process plus the pipe used to hand it jobs."""
+
+    def __init__(self, ctx):
+        self.conn, child = ctx.Pipe()
+        self.proc = ctx.Process(target=_batch_worker, args=(child,), daemon=True)
+        self.proc.start()
+        child.close()
+        self.job, self.started = None, None
+
+    def assign(self, job):
+        self.job, self.started = job, time.monotonic()
+        self.conn.send(job)
+
+    def kill(self):
+        self.proc.kill()
+        self.proc.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.proc.join(timeout=5)
+        if self.proc.is_alive():
+            self.kill()
+
+
+def run_batch(jobs, workers=None, timeout=None, skip="mtime", state_file=None):
+    """
+    Run conversion jobs on a pool of worker processes.
+
+    Args:
+        jobs: Job dicts from plan_batch/load_manifest.
+        workers: Number of worker processes (default: CPU count).
+        timeout: Per-job timeout in seconds; a job running longer has its
+            worker killed and replaced, and is reported as "timeout".
+        skip: "mtime" skips jobs whose output is newer than the input,
+            "hash" skips jobs whose input content is unchanged since the last
+            successful run (tracked in state_file), "none" converts everything.
+        state_file: JSON file holding input hashes for skip="hash"
+            (default: .rosdl_batch_state.json in the current folder).
+
+    Returns:
+        dict: Machine-readable summary with per-status counts and per-job results.
+    """
+    t_start = time.monotonic()
+    state_file = state_file or BATCH_STATE_FILE
+    state = {}
+    if skip == "hash" and os.path.exists(state_file):
+        with open(state_file, encoding="utf-8") as f:
+            state = json.load(f)
+
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    results, queue = [], deque()
+    for job in jobs:
+        if job.get("skip_reason"):
+            results.append({**job, "status": "skipped", "message": job["skip_reason"], "seconds": 0.0})
+        elif _is_up_to_date(job, skip, state):
+            results.append({**job, "status": "skipped", "message": "up to date", "seconds": 0.0})
+        else:
+            queue.append(job)
+
+    ctx = multiprocessing.get_context()
+    pool = [_BatchWorker(ctx) for _ in range(min(workers or os.cpu_count() or 1, len(queue)))]
+
+    def finish(worker, status, message):
+        job = worker.job
+        results.append({**job, "status": status, "message": message,
+                        "seconds": round(time.monotonic() - worker.started, 3)})
+        if status == "converted" and skip == "hash":
+            state[os.path.abspath(job["input"])] = {
+                "sha256": job.get("sha256") or file_sha256(job["input"]),
+                "output": os.path.abspath(job["output"]),
+            }
+        worker.job = None
+
+    try:
+        while queue or any(w.job for w in pool):
+            for w in pool:
+                if w.job is None and queue:
+                    w.assign(queue.popleft())
+            busy = [w for w in pool if w.job]
+            wait_for = None
+            if timeout:
+                wait_for = max(0.0, min(w.started + timeout for w in busy) - time.monotonic())
+            for conn in wait([w.conn for w in busy], timeout=wait_for):
+                w = next(w for w in busy if w.conn is conn)
+                try:
+                    finish(w, *w.conn.recv())
+                except EOFError:
+                    finish(w, "failed", f"❌ Worker exited with code {w.proc.exitcode}")
+                    w.kill()
+                    pool[pool.index(w)] = _BatchWorker(ctx)
+            if timeout:
+                now = time.monotonic()
+                for i, w in enumerate(pool):
+                    if w.job and now - w.started >= timeout:
+                        finish(w, "timeout", f"❌ Timed out after {timeout}s")
+                        w.kill()
+                        pool[i] = _BatchWorker(ctx) if queue else w
+    finally:
+        for w in pool:
+            if w.job:
+                w.kill()
+            elif w.proc.is_alive():
+                w.stop()
+
+    if skip == "hash":
+        with open(state_file, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+
+    counts = {s: 0 for s in ("converted", "skipped", "failed", "timeout")}
+    for r in results:
+        counts[r["status"]] += 1
+    order = {(j["input"], j["output"]): i for i, j in enumerate(jobs)}
+    results.sort(key=lambda r: order[(r["input"], r["output"])])
+    return {"total": len(results), **counts,
+            "seconds": round(time.monotonic() - t_start, 3), "jobs": results}
+
@@ -1,5 +1,7 @@
 # rosdl/core/metadata_extractor.py
-import os, sys, datetime
+import os, sys, stat, csv, json, tarfile, zipfile, datetime
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 try:
     import magic
@@ -17,80 +19,425 @@ try:
     from mutagen import File as MutagenFile
 except ImportError:
     MutagenFile = None
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa, pq = None, None
+
+
+# threads used for per-file extraction; work is I/O bound so this exceeds the CPU count
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
 
 
 def fmt_time(ts): 
     return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S") if ts else "N/A"
 
-def get_ctime(path):
-    if sys.platform.startswith("win"): return os.path.getctime(path)
+def get_ctime(path, st=None):
+    """Creation time; pass an existing stat result to avoid another syscall."""
     try:
-        st = os.stat(path)
-        return getattr(st, "st_birthtime", None)
-    except: return None
-
-def get_mime(path):
-    if magic:
-        try: return magic.from_file(path, mime=True)
-        except: pass
-    return {
-        ".pdf":"application/pdf",".txt":"text/plain",".md":"text/markdown",
-        ".jpg":"image/jpeg",".jpeg":"image/jpeg",".png":"image/png",".gif":"image/gif",
-        ".bmp":"image/bmp",".csv":"text/csv",".mp3":"audio/mpeg",".wav":"audio/wav",".flac":"audio/flac"
-    }.get(os.path.splitext(path)[1].lower(),"unknown")
-
-def pdf_meta(path):
+        st = st or os.stat(path)
+    except OSError: return None
+    if sys.platform.startswith("win"): return st.st_ctime
+    return getattr(st, "st_birthtime", None)
+
+# -----------------------------
+# Format sniffing
+# -----------------------------
+HEADER_BYTES = 512  # enough for every signature below, including tar's "ustar" at offset 257
+
+_SIGNATURES = [  # (offset, magic bytes, mime)
+    (0, b"%PDF-", "application/pdf"),
+    (0, b"\x89PNG\r\n\x1a\n", "image/png"),
+    (0, b"\xff\xd8\xff", "image/jpeg"),
+    (0, b"GIF87a", "image/gif"), (0, b"GIF89a", "image/gif"),
+    (0, b"II*\x00", "image/tiff"), (0, b"MM\x00*", "image/tiff"),
+    (0, b"fLaC", "audio/flac"),
+    (0, b"ID3", "audio/mpeg"),
+    (0, b"OggS", "audio/ogg"),
+    (0, b"\x1aE\xdf\xa3", "video/x-matroska"),
+    (0, b"PK\x03\x04", "application/zip"), (0, b"PK\x05\x06", "application/zip"),
+    (0, b"\x1f\x8b", "application/gzip"),
+    (0, b"BZh", "application/x-bzip2"),
+    (0, b"\xfd7zXZ\x00", "application/x-xz"),
+    (0, b"7z\xbc\xaf\x27\x1c", "application/x-7z-compressed"),
+    (0, b"Rar!\x1a\x07", "application/vnd.rar"),
+    (257, b"ustar", "application/x-tar"),
+    (0, b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "application/x-ole-storage"),
+    (0, b"SQLite format 3\x00", "application/vnd.sqlite3"),
+    (0, b"{\\rtf", "application/rtf"),
+    (0, b"\x7fELF", "application/x-executable"),
+]
+
+_RIFF_TYPES = {b"WAVE": "audio/wav", b"AVI ": "video/x-msvideo", b"WEBP": "image/webp"}
+_FTYP_BRANDS = {b"M4A ": "audio/mp4", b"M4B ": "audio/mp4", b"qt  ": "video/quicktime",
+                b"heic": "image/heic", b"avif": "image/avif"}
+
+_OOXML = "application/vnd.openxmlformats-officedocument."
+_EXT_MIME = {
+    ".pdf":"application/pdf",".txt":"text/plain",".md":"text/markdown",
+    ".jpg":"image/jpeg",".jpeg":"image/jpeg",".png":"image/png",".gif":"image/gif",
+    ".bmp":"image/bmp",".csv":"text/csv",".mp3":"audio/mpeg",".wav":"audio/wav",".flac":"audio/flac",
+    ".json":"application/json",".xml":"application/xml",".html":"text/html",".htm":"text/html",
+    ".tsv":"text/tab-separated-values",".mp4":"video/mp4",".mov":"video/quicktime",".mkv":"video/x-matroska",
+    ".webm":"video/webm",".avi":"video/x-msvideo",".m4a":"audio/mp4",".ogg":"audio/ogg",
+    ".docx":_OOXML+"wordprocessingml.document",".xlsx":_OOXML+"spreadsheetml.sheet",
+    ".pptx":_OOXML+"presentationml.presentation",
+    ".odt":"application/vnd.oasis.opendocument.text",".ods":"application/vnd.oasis.opendocument.spreadsheet",
+    ".odp":"application/vnd.oasis.opendocument.presentation",".epub":"application/epub+zip",
+    ".doc":"application/msword",".xls":"application/vnd.ms-excel",".ppt":"application/vnd.ms-powerpoint",
+    ".zip":"application/zip",".tar":"application/x-tar",".gz":"application/gzip",".tgz":"application/gzip",
+}
+# container formats whose concrete type is told apart by extension
+_CONTAINER_SUBTYPES = {
+    "application/zip": (".docx", ".xlsx", ".pptx", ".odt", ".ods", ".odp", ".epub"),
+    "application/x-ole-storage": (".doc", ".xls", ".ppt"),
+    "video/x-matroska": (".webm",),
+}
+
+def sniff_mime(header, ext=""):
+    """Identify a MIME type from the first bytes of a file, falling back to the extension."""
+    ext = ext.lower()
+    mime = None
+    for offset, sig, m in _SIGNATURES:
+        if header[offset:offset + len(sig)] == sig:
+            mime = m
+            break
+    if mime is None and header[:4] == b"RIFF":
+        mime = _RIFF_TYPES.get(header[8:12])
+    if mime is None and header[4:8] == b"ftyp":
+        mime = _FTYP_BRANDS.get(header[8:12], "video/mp4")
+    if mime is None and header[:2] == b"BM" and header[6:10] == b"\x00\x00\x00\x00":
+        mime = "image/bmp"
+    if mime is None and len(header) > 1 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0:
+        mime = "audio/mpeg"  # MPEG audio frame sync
+    if mime in _CONTAINER_SUBTYPES:
+        return _EXT_MIME[ext] if ext in _CONTAINER_SUBTYPES[mime] else mime
+    if mime:
+        return mime
+    if header and b"\x00" not in header and _looks_utf8(header):
+        m = _EXT_MIME.get(ext, "")
+        return m if m.startswith("text/") or m in ("application/json", "application/xml") else "text/plain"
+    return _EXT_MIME.get(ext, "unknown")
+
+def _looks_utf8(data):
+    try: data.decode("utf-8")
+    except UnicodeDecodeError as e: return e.start >= len(data) - 3  # tolerate a character cut by the header limit
+    return True
+
+def read_header(src, n=HEADER_BYTES):
+    """First n bytes of a path or a seekable binary file object (position restored)."""
+    if hasattr(src, "read"):
+        pos = src.tell()
+        try: return src.read(n)
+        finally: src.seek(pos)
+    with open(src, "rb") as f:
+        return f.read(n)
+
+def mime_from_header(header, ext=""):
+    """sniff_mime, asking libmagic about the same buffer only when nothing matched."""
+    mime = sniff_mime(header, ext)
+    if mime == "unknown" and magic:
+        try: return magic.from_buffer(header, mime=True)
+        except Exception: pass
+    return mime
+
+def get_mime(path, header=None):
+    try: header = read_header(path) if header is None else header
+    except OSError: return _EXT_MIME.get(os.path.splitext(path)[1].lower(), "unknown")
+    return mime_from_header(header, os.path.splitext(path)[1])
+
+# -----------------------------
+# Extractor registry
+# -----------------------------
+# Each extractor takes (src, mime), where src is a path or a seekable binary
+# file object, and returns a dict. Extractors are selected by MIME prefix.
+_EXTRACTORS = []  # (name, mime prefixes, func, key)
+BASE_FIELDS = ("stat", "format")
+
+def register_extractor(name, mimes, key=None):
+    """
+    Decorator registering an extractor for MIME types starting with any of `mimes`.
+    Its result is stored under meta[key], or merged into the top level when key is None.
+    """
+    def deco(func):
+        _EXTRACTORS[:] = [e for e in _EXTRACTORS if e[0] != name]
+        _EXTRACTORS.append((name, tuple(mimes), func, key))
+        return func
+    return deco
+
+def available_fields():
+    return BASE_FIELDS + tuple(e[0] for e in _EXTRACTORS)
+
+def parse_fields(fields):
+    """Normalise a comma string or iterable of field names; None means everything."""
+    if fields is None: return None
+    if isinstance(fields, str): fields = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = set(fields) - set(available_fields())
+    if unknown: raise ValueError(f"Unknown metadata fields: {', '.join(sorted(unknown))}")
+    return frozenset(fields) | {"stat"}
+
+@register_extractor("pdf", ["application/pdf"])
+def pdf_meta(path, mime=None):
     if not PdfReader: return {}
     try:
         info = PdfReader(path).metadata
         return {k.strip("/").lower(): str(v) for k,v in info.items()}
     except: return {}
 
-def img_exif(path):
+@register_extractor("exif", ["image/"], key="exif")
+def img_exif(path, mime=None):
     if not Image: return {}
     try:
         exif = Image.open(path)._getexif() or {}
         return {ExifTags.TAGS.get(k,k): str(v) for k,v in exif.items()}
     except: return {}
 
-def audio_meta(path):
+@register_extractor("audio", ["audio/"], key="audio")
+def audio_meta(path, mime=None):
     if not MutagenFile: return {}
     try:
         a = MutagenFile(path)
         return {k: str(v) for k,v in (a.items() if a else {})}
     except: return {}
 
-def extract(path):
-    if not os.path.isfile(path): return None
-    st = os.stat(path)
+@register_extractor("video", ["video/"], key="video")
+def video_meta(path, mime=None):
+    """Duration/bitrate and tags for MP4/MOV family files (via mutagen)."""
+    if not MutagenFile: return {}
+    try:
+        v = MutagenFile(path)
+        if not v: return {}
+        info = {k: getattr(v.info, k) for k in ("length", "bitrate") if getattr(v.info, k, None)}
+        return {**info, **{k: str(t) for k, t in v.items()}}
+    except: return {}
+
+_DC = {"dc": "http://purl.org/dc/elements/1.1/", "cp": "http://schemas.openxmlformats.org/package/2006/metadata/core-properties",
+       "dcterms": "http://purl.org/dc/terms/", "meta": "urn:oasis:names:tc:opendocument:xmlns:meta:1.0",
+       "office": "urn:oasis:names:tc:opendocument:xmlns:office:1.0"}
+
+@register_extractor("office", [_OOXML, "application/vnd.oasis.opendocument.", "application/epub+zip"], key="office")
+def office_meta(path, mime=None):
+    """Document properties of OOXML (docx/xlsx/pptx) and OpenDocument files."""
+    try:
+        with zipfile.ZipFile(path) as z:
+            names = set(z.namelist())
+            props = {}
+            if "docProps/core.xml" in names:
+                for el in ET.fromstring(z.read("docProps/core.xml")):
+                    if el.text: props[el.tag.rsplit("}", 1)[-1]] = el.text
+            if "docProps/app.xml" in names:
+                for el in ET.fromstring(z.read("docProps/app.xml")):
+                    tag = el.tag.rsplit("}", 1)[-1]
+                    if el.text and tag in ("Application", "Pages", "Words", "Slides", "Company"):
+                        props[tag.lower()] = el.text
+            if "meta.xml" in names:
+                m = ET.fromstring(z.read("meta.xml")).find("office:meta", _DC)
+                for el in (m if m is not None else []):
+                    if el.text: props[el.tag.rsplit("}", 1)[-1]] = el.text
+            return props
+    except: return {}
+
+@register_extractor("archive", ["application/zip", "application/x-tar", "application/gzip",
+                                "application/x-bzip2", "application/x-xz"], key="archive")
+def archive_meta(path, mime=None):
+    """Member count and uncompressed size of ZIP/TAR archives (headers only)."""
+    try:
+        if mime == "application/zip":
+            with zipfile.ZipFile(path) as z:
+                infos = z.infolist()
+                return {"members": len(infos), "uncompressed_bytes": sum(i.file_size for i in infos)}
+        opener = tarfile.open(fileobj=path) if hasattr(path, "read") else tarfile.open(path)
+        with opener as t:
+            members = [m for m in t if m.isfile()]
+            return {"members": len(members), "uncompressed_bytes": sum(m.size for m in members)}
+    except: return {}
+
+def run_extractors(src, mime, fields=None):
+    """Run every requested extractor matching mime; returns (merged, keyed) dicts."""
+    merged, keyed = {}, {}
+    for name, prefixes, func, key in _EXTRACTORS:
+        if (fields is None or name in fields) and mime.startswith(prefixes):
+            if hasattr(src, "seek"): src.seek(0)
+            res = func(src, mime)
+            if key is None: merged.update(res)
+            else: keyed[key] = res
+    return merged, keyed
+
+def extract(path, st=None, fields=None):
+    """
+    Extract metadata for one file.
+
+    `st` may be a stat result already at hand (e.g. from os.scandir).
+    `fields` limits the work: "stat" never opens the file, "format" reads only
+    the header, and extractor names ("pdf", "exif", "audio", "video", "office",
+    "archive", ...) opt into richer parsing. None runs everything.
+    """
+    fields = parse_fields(fields)
+    if st is None:
+        try: st = os.stat(path)
+        except OSError: return None
+    if not stat.S_ISREG(st.st_mode): return None
     meta = {
         "filepath": path,
         "size_bytes": st.st_size,
-        "created": fmt_time(get_ctime(path)),
+        "created": fmt_time(get_ctime(path, st)),
         "modified": fmt_time(st.st_mtime),
-        "format": get_mime(path),
-        "extension": os.path.splitext(path)[1].lower()
     }
-    if meta["format"]=="application/pdf": meta.update(pdf_meta(path))
-    elif meta["format"].startswith("image/"): meta["exif"]=img_exif(path)
-    elif meta["format"].startswith("audio/"): meta["audio"]=audio_meta(path)
+    ext = os.path.splitext(path)[1].lower()
+    if fields is not None and fields <= {"stat"}:
+        meta["extension"] = ext
+        return meta
+    meta["format"] = get_mime(path)
+    meta["extension"] = ext
+    merged, keyed = run_extractors(path, meta["format"], fields)
+    meta.update(merged)
+    meta.update(keyed)
     return meta
 
-def scan_folder(folder, recursive=True):
-    metas=[]
-    for r,_,fs in os.walk(folder):
-        for f in fs:
-            m=extract(os.path.join(r,f))
-            if m: metas.append(m)
-        if not recursive: break
-    return metas
+# -----------------------------
+# Archive members
+# -----------------------------
+ARCHIVE_MIMES = ("application/zip", "application/x-tar", "application/gzip", "application/x-bzip2", "application/x-xz")
+ARCHIVE_SEP = "!/"
+
+def _zip_members(src):
+    with zipfile.ZipFile(src) as z:
+        for info in z.infolist():
+            if info.is_dir(): continue
+            try: mtime = datetime.datetime(*info.date_time).timestamp()
+            except (ValueError, OverflowError): mtime = None  # invalid DOS timestamp, e.g. month 0
+            yield info.filename, info.file_size, mtime, (lambda info=info: z.open(info))
+
+def _tar_members(src):
+    with (tarfile.open(fileobj=src) if hasattr(src, "read") else tarfile.open(src)) as t:
+        for m in t:
+            if m.isfile():
+                yield m.name, m.size, m.mtime, (lambda m=m: t.extractfile(m))
+
+def iter_archive(src, name=None, depth=1, fields=None, mime=None):
+    """
+    Yield metadata for the members of a ZIP/TAR archive without unpacking it to disk.
+
+    Members are streamed in memory: only each member's header is read to
+    identify it, and the registered extractors (PDF, EXIF, audio, ...) run on
+    the member stream. Member paths look like "archive.zip!/folder/file.pdf".
+    Archives inside the archive are opened recursively while depth > 1.
+    A member that cannot be read is yielded with its listing data and an
+    "error" field, and the remaining members are still listed.
+
+    Args:
+        src: Archive path or seekable binary file object.
+        name: Display path of the archive (default: src's path).
+        depth: How many archive levels to open (1 = only this archive).
+        fields: As in extract(); "stat" lists members without reading them.
+        mime: Archive MIME type if already known.
+    """
+    fields = parse_fields(fields)
+    name = name or (os.fspath(src) if not hasattr(src, "read") else getattr(src, "name", "archive"))
+    if mime is None:
+        mime = sniff_mime(read_header(src), os.path.splitext(name)[1])
+    if depth < 1 or mime not in ARCHIVE_MIMES:
+        return
+    members = _zip_members(src) if mime == "application/zip" else _tar_members(src)
+    try:
+        for member, size, mtime, open_member in members:
+            path = name + ARCHIVE_SEP + member
+            try: modified = fmt_time(mtime)
+            except (ValueError, OverflowError, OSError): modified = "N/A"
+            meta = {"filepath": path, "size_bytes": size, "created": "N/A", "modified": modified}
+            ext = os.path.splitext(member)[1].lower()
+            if fields is not None and fields <= {"stat"}:
+                yield {**meta, "extension": ext, "container": name}
+                continue
+            nested = []
+            try:
+                with open_member() as f:
+                    meta["format"] = mime_from_header(f.read(HEADER_BYTES), ext)
+                    meta["extension"] = ext
+                    meta["container"] = name
+                    merged, keyed = run_extractors(f, meta["format"], fields)
+                    meta.update(merged)
+                    meta.update(keyed)
+                    if depth > 1 and meta["format"] in ARCHIVE_MIMES:
+                        f.seek(0)
+                        nested = list(iter_archive(f, path, depth - 1, fields, meta["format"]))
+            except Exception as e:  # corrupt or encrypted member: report it, keep listing the rest
+                yield {**meta, "extension": ext, "container": name, "error": str(e)}
+                continue
+            yield meta
+            yield from nested
+    except (zipfile.BadZipFile, tarfile.TarError, OSError, EOFError, ValueError):
+        return  # unreadable archive directory: nothing more can be listed
+
+
+def _with_members(path, m, fields, archive_depth):
+    """Yield m and then, for archives and archive_depth > 0, its members one at a time."""
+    if not m: return
+    yield m
+    if archive_depth > 0:
+        mime = m.get("format") or _EXT_MIME.get(m["extension"], "unknown")
+        if mime in ARCHIVE_MIMES:
+            yield from iter_archive(path, path, archive_depth, fields, mime)
+
+def extract_with_members(path, st=None, fields=None, archive_depth=0):
+    """extract() plus, for archives and archive_depth > 0, metadata of every member (yielded lazily)."""
+    yield from _with_members(path, extract(path, st, fields), fields, archive_depth)
+
+def iter_files(folder, recursive=True):
+    """Yield (path, stat) for regular files under folder, reusing os.scandir entries."""
+    dirs = [folder]
+    while dirs:
+        try: it = os.scandir(dirs.pop())
+        except OSError: continue
+        with it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        if recursive: dirs.append(e.path)
+                    elif e.is_file():
+                        yield e.path, e.stat()
+                except OSError: continue
+
+def extract_many(entries, workers=DEFAULT_WORKERS, fields=None, archive_depth=0):
+    """
+    Extract metadata for an iterable of (path, stat) pairs, yielding results in
+    completion order. Runs on a thread pool with at most workers*4 files in
+    flight, so memory stays bounded however many entries there are.
+    With archive_depth > 0, archive members are yielded after their archive,
+    streamed one at a time by the consuming thread rather than collected.
+    """
+    fields = parse_fields(fields)
+    if workers <= 1:
+        for path, st in entries:
+            yield from extract_with_members(path, st, fields, archive_depth)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        pending = {}
+        for path, st in entries:
+            pending[ex.submit(extract, path, st, fields)] = path
+            if len(pending) >= workers * 4:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for f in done: yield from _with_members(pending.pop(f), f.result(), fields, archive_depth)
+        for f in list(pending):
+            yield from _with_members(pending.pop(f), f.result(), fields, archive_depth)
+
+def iter_scan(folder, recursive=True, workers=DEFAULT_WORKERS, fields=None, archive_depth=0):
+    """Yield metadata dicts for every file under folder as they become available."""
+    return extract_many(iter_files(folder, recursive), workers, fields, archive_depth)
+
+def scan_folder(folder, recursive=True, workers=DEFAULT_WORKERS, fields=None, archive_depth=0):
+    return sorted(iter_scan(folder, recursive, workers, fields, archive_depth), key=lambda m: m["filepath"])
+
+def _report_lines(m):
+    lines=[f"\nFile: {m['filepath']}"]
+    for k,v in m.items():
+        if k!="filepath": lines.append(f"  {k}: {v}")
+    return lines
 
 def build_report(metas):
     lines=[]
-    for m in metas:
-        lines.append(f"\nFile: {m['filepath']}")
-        for k,v in m.items():
-            if k!="filepath": lines.append(f"  {k}: {v}")
+    for m in metas: lines.extend(_report_lines(m))
     return "\n".join(lines)
 
 def ask_path(default_dir, default_name):
@@ -99,17 +446,177 @@ def ask_path(default_dir, default_name):
     return p if p else os.path.join(default_dir,default_name)
 
 def export_report(metas, output=None, interactive=True):
-    if not metas: return None
-    d=os.path.dirname(metas[0]["filepath"])
+    metas=iter(metas)
+    first=next(metas, None)
+    if not first: return None
+    d=os.path.dirname(first["filepath"])
     def_name="metadata_report.txt"
     path=output or (ask_path(d,def_name) if interactive else os.path.join(d,def_name))
-    with open(path,"w",encoding="utf-8") as f: f.write(build_report(metas))
+    with open(path,"w",encoding="utf-8") as f:
+        f.write("\n".join(_report_lines(first)))
+        for m in metas: f.write("\n"+"\n".join(_report_lines(m)))
     return path
 
-def extract_file(file_path, output=None, interactive=True):
-    m=extract(file_path)
-    return export_report([m], output, interactive)
+# -----------------------------
+# Streaming structured export
+# -----------------------------
+EXPORT_FORMATS = ("jsonl", "csv", "parquet", "txt")
+CORE_FIELDS = ["filepath", "size_bytes", "created", "modified", "format", "extension"]
+FLUSH_EVERY = 1000
+
+def flatten_meta(m):
+    """Core fields as columns plus every other field JSON-encoded in an "extra" column."""
+    row = {k: m.get(k) for k in CORE_FIELDS}
+    extra = {k: v for k, v in m.items() if k not in CORE_FIELDS}
+    row["extra"] = json.dumps(extra, default=str, ensure_ascii=False) if extra else ""
+    return row
+
+def _truncate_partial_line(path):
+    """Drop a trailing half-written line left by an interrupted run."""
+    with open(path, "rb+") as f:
+        data_end = f.seek(0, os.SEEK_END)
+        if not data_end: return
+        pos = data_end
+        while pos > 0:
+            step = min(65536, pos)
+            f.seek(pos - step)
+            chunk = f.read(step)
+            i = chunk.rfind(b"\n")
+            if i != -1:
+                if pos - step + i + 1 != data_end: f.truncate(pos - step + i + 1)
+                return
+            pos -= step
+        f.truncate(0)
+
+class _JsonlExporter:
+    def __init__(self, path, resume):
+        if resume and os.path.exists(path): _truncate_partial_line(path)
+        self.f = open(path, "a" if resume else "w", encoding="utf-8")
+    @staticmethod
+    def done(path):
+        seen = set()
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try: seen.add(json.loads(line)["filepath"])
+                except (ValueError, KeyError): pass
+        return seen
+    def write(self, m): self.f.write(json.dumps(m, default=str, ensure_ascii=False) + "\n")
+    def flush(self): self.f.flush(); os.fsync(self.f.fileno())
+    def close(self): self.flush(); self.f.close()
+
+class _CsvExporter:
+    def __init__(self, path, resume):
+        append = resume and os.path.exists(path)
+        if append: _truncate_partial_line(path)
+        append = append and os.path.getsize(path) > 0
+        self.f = open(path, "a" if append else "w", encoding="utf-8", newline="")
+        self.w = csv.DictWriter(self.f, fieldnames=CORE_FIELDS + ["extra"])
+        if not append: self.w.writeheader()
+    @staticmethod
+    def done(path):
+        with open(path, encoding="utf-8", newline="") as f:
+            return {r["filepath"] for r in csv.DictReader(f) if r.get("filepath")}
+    def write(self, m): self.w.writerow(flatten_meta(m))
+    def flush(self): self.f.flush(); os.fsync(self.f.fileno())
+    def close(self): self.flush(); self.f.close()
+
+class _ParquetExporter:
+    """Writes a directory of part files; each flush atomically adds one part."""
+    def __init__(self, path, resume):
+        if pa is None: raise ImportError("pyarrow is not installed. Install it with: pip install pyarrow")
+        os.makedirs(path, exist_ok=True)
+        parts = self._parts(path)
+        if not resume:
+            for p in parts: os.remove(p)
+            parts = []
+        self.path, self.n, self.rows = path, len(parts), []
+        self.schema = pa.schema([(k, pa.int64() if k == "size_bytes" else pa.string()) for k in CORE_FIELDS + ["extra"]])
+    @staticmethod
+    def _parts(path):
+        return sorted(os.path.join(path, f) for f in os.listdir(path) if f.startswith("part-") and f.endswith(".parquet"))
+    @classmethod
+    def done(cls, path):
+        seen = set()
+        for p in cls._parts(path): seen.update(pq.read_table(p, columns=["filepath"]).column(0).to_pylist())
+        return seen
+    def write(self, m): self.rows.append(flatten_meta(m))
+    def flush(self):
+        if not self.rows: return
+        final = os.path.join(self.path, f"part-{self.n:05d}.parquet")
+        tmp = os.path.join(self.path, f".part-{self.n:05d}.parquet.tmp")  # dot-files are ignored by readers
+        pq.write_table(pa.Table.from_pylist(self.rows, schema=self.schema), tmp)
+        os.replace(tmp, final)
+        self.n, self.rows = self.n + 1, []
+    def close(self): self.flush()
+
+class _TxtExporter:
+    def __init__(self, path, resume):
+        if resume: raise ValueError("Resume is only supported for jsonl, csv and parquet exports")
+        self.f, self.first = open(path, "w", encoding="utf-8"), True
+    def write(self, m):
+        self.f.write(("" if self.first else "\n") + "\n".join(_report_lines(m)))
+        self.first = False
+    def flush(self): self.f.flush()
+    def close(self): self.f.close()
+
+_EXPORTERS = {"jsonl": _JsonlExporter, "csv": _CsvExporter, "parquet": _ParquetExporter, "txt": _TxtExporter}
+
+def export_format(path):
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    return {"json": "jsonl", "ndjson": "jsonl", "pq": "parquet"}.get(ext, ext if ext in EXPORT_FORMATS else "txt")
+
+def exported_paths(path, fmt=None):
+    """Filepaths already present in an export, so an interrupted run can resume."""
+    fmt = fmt or export_format(path)
+    if fmt == "txt" or not os.path.exists(path): return set()
+    if fmt in ("jsonl", "csv"): _truncate_partial_line(path)
+    return _EXPORTERS[fmt].done(path)
+
+def stream_export(metas, path, fmt=None, flush_every=FLUSH_EVERY, resume=False):
+    """
+    Write metadata dicts to path as they arrive, flushing every `flush_every` records.
+
+    Formats: "jsonl" (one JSON object per line), "csv" and "parquet" (core
+    columns plus a JSON "extra" column; parquet is a folder of part files),
+    or "txt" (the human-readable report). All but txt load directly with
+    pandas (read_json(lines=True), read_csv, read_parquet).
+    With resume=True, the existing output is kept and appended to.
+    Records are written in the order `metas` yields them; from extract_many
+    that is completion order, so the row order can differ between runs
+    (use scan_folder/extract_folder for a path-sorted report).
+
+    Returns the number of records written.
+    """
+    fmt = fmt or export_format(path)
+    if fmt not in _EXPORTERS: raise ValueError(f"Unsupported export format: {fmt}")
+    out = _EXPORTERS[fmt](path, resume)
+    n = 0
+    try:
+        for m in metas:
+            out.write(m)
+            n += 1
+            if n % flush_every == 0: out.flush()
+    finally:
+        out.close()
+    return n
+
+def export_folder(folder_path, output, fmt=None, recursive=True, workers=DEFAULT_WORKERS,
+                  flush_every=FLUSH_EVERY, resume=False, fields=None, archive_depth=0):
+    """
+    Scan folder and stream results to output in completion order (not sorted);
+    with resume, already exported files are skipped before extraction.
+    """
+    fmt = fmt or export_format(output)
+    done = exported_paths(output, fmt) if resume else set()
+    out_abs = os.path.abspath(output)
+    is_output = lambda p: os.path.abspath(p) == out_abs or os.path.abspath(p).startswith(out_abs + os.sep)
+    entries = ((p, st) for p, st in iter_files(folder_path, recursive) if p not in done and not is_output(p))
+    return stream_export(extract_many(entries, workers, fields, archive_depth), output, fmt, flush_every, resume)
+
+def extract_file(file_path, output=None, interactive=True, fields=None, archive_depth=0):
+    return export_report(extract_with_members(file_path, fields=fields, archive_depth=archive_depth), output, interactive)
 
-def extract_folder(folder_path, output=None, recursive=True, interactive=True):
-    metas=scan_folder(folder_path,recursive)
-    return export_report(metas, output, interactive)
+def extract_folder(folder_path, output=None, recursive=True, interactive=True, workers=DEFAULT_WORKERS, fields=None,
+                   archive_depth=0):
+    # sorted by path so re-runs of the same folder produce identical reports
+    return export_report(scan_folder(folder_path,recursive,workers,fields,archive_depth), output, interactive)
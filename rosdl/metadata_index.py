@@ -0,0 +1,226 @@
+# rosdl/core/metadata_index.py
+"""
+Incremental, persistent metadata index backed by SQLite.
+
+Files are keyed by absolute path and re-extracted only when their size,
+mtime or inode changed since the last scan, or when a scan asks for fields
+that the stored row was not extracted with. Deleted files are pruned, and
+queries (format, extension, modification time, any extracted field such as
+a PDF author) are answered from the database without touching the filesystem.
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import datetime
+
+from rosdl import metadata_extractor as me
+
+DEFAULT_DB = "rosdl_meta.db"
+_COMMIT_EVERY = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER,
+    mtime REAL NOT NULL,
+    format TEXT,
+    extension TEXT,
+    meta TEXT NOT NULL,
+    indexed_at REAL NOT NULL,
+    fields TEXT  -- JSON list of the extracted field groups; NULL = all
+);
+CREATE INDEX IF NOT EXISTS idx_files_format ON files(format);
+CREATE INDEX IF NOT EXISTS idx_files_extension ON files(extension);
+CREATE INDEX IF NOT EXISTS idx_files_mtime ON files(mtime);
+"""
+
+
+def parse_since(value):
+    """
+    Convert "7d", "12h", "30m", "45s" or an ISO date/datetime into an epoch timestamp.
+    """
+    if value is None:
+        return None
+    m = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw])\s*", str(value).lower())
+    if m:
+        unit = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}[m.group(2)]
+        return time.time() - float(m.group(1)) * unit
+    return datetime.datetime.fromisoformat(str(value)).timestamp()
+
+
+class MetadataIndex:
+    """SQLite-backed metadata catalogue. Use as a context manager or call close()."""
+
+    def __init__(self, db_path=DEFAULT_DB, use_inode=True):
+        self.db_path = os.path.abspath(db_path)
+        self.use_inode = use_inode
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        if "fields" not in {r[1] for r in self.conn.execute("PRAGMA table_info(files)")}:
+            self.conn.execute("ALTER TABLE files ADD COLUMN fields TEXT")  # indexes built before field tracking
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    # -----------------------------
+    # Writing
+    # -----------------------------
+    def _changed(self, known, st, fields=None):
+        if known is None:
+            return True
+        size, mtime_ns, inode, stored = known
+        if size != st.st_size or mtime_ns != st.st_mtime_ns:
+            return True
+        if stored is not None and (fields is None or not fields <= set(json.loads(stored))):
+            return True  # extracted with fewer fields than now requested
+        return bool(self.use_inode and inode and st.st_ino and inode != st.st_ino)
+
+    def upsert(self, meta, st, fields=None):
+        """Insert or replace one file's metadata, extracted with `fields` (None = all)."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO files (path, size, mtime_ns, inode, mtime, format, extension, meta, indexed_at, "
+            "fields) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (os.path.abspath(meta["filepath"]), st.st_size, st.st_mtime_ns, st.st_ino or None,
+             st.st_mtime, meta.get("format"), meta.get("extension"),
+             json.dumps(meta, default=str, ensure_ascii=False), time.time(),
+             json.dumps(sorted(fields)) if fields is not None else None),
+        )
+
+    def remove(self, path):
+        """Drop a file from the index. Returns True if it was present."""
+        cur = self.conn.execute("DELETE FROM files WHERE path = ?", (os.path.abspath(path),))
+        return cur.rowcount > 0
+
+    def remove_under(self, folder):
+        """Drop every file indexed below folder. Returns the number of removed rows."""
+        prefix = os.path.abspath(folder).rstrip(os.sep) + os.sep
+        cur = self.conn.execute("DELETE FROM files WHERE substr(path, 1, ?) = ?", (len(prefix), prefix))
+        return cur.rowcount
+
+    def update_file(self, path, fields=None):
+        """Re-index a single path (or remove it if it no longer exists). Returns the new status."""
+        fields = me.parse_fields(fields)
+        meta = me.extract(path, fields=fields)
+        if meta is None:
+            return "removed" if self.remove(path) else "missing"
+        self.upsert(meta, os.stat(path), fields)
+        self.conn.commit()
+        return "updated"
+
+    def _is_own_file(self, path):
+        return path in (self.db_path, self.db_path + "-wal", self.db_path + "-shm", self.db_path + "-journal")
+
+    def update(self, folder, recursive=True, workers=me.DEFAULT_WORKERS, prune=True, fields=None):
+        """
+        Bring the index up to date for folder.
+
+        Only new or changed files are re-extracted; with prune=True, indexed
+        files under folder that no longer exist are removed. `fields` limits
+        extraction as in metadata_extractor.extract; rows extracted with fewer
+        fields than requested are re-extracted.
+
+        Returns:
+            dict: counts of "added", "updated", "unchanged" and "removed" files.
+        """
+        fields = me.parse_fields(fields)
+        folder = os.path.abspath(folder)
+        prefix = folder.rstrip(os.sep) + os.sep
+        rows = self.conn.execute(
+            "SELECT path, size, mtime_ns, inode, fields FROM files WHERE substr(path, 1, ?) = ?",
+            (len(prefix), prefix),
+        )
+        known = {p: (size, mtime_ns, inode, stored) for p, size, mtime_ns, inode, stored in rows}
+        if not recursive:
+            known = {p: v for p, v in known.items() if os.sep not in p[len(prefix):]}
+
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+        changed = {}
+        for path, st in me.iter_files(folder, recursive):
+            if self._is_own_file(path):
+                continue
+            previous = known.pop(path, None)
+            if self._changed(previous, st, fields):
+                changed[path] = st
+                stats["added" if previous is None else "updated"] += 1
+            else:
+                stats["unchanged"] += 1
+
+        for i, meta in enumerate(me.extract_many(changed.items(), workers, fields), 1):
+            self.upsert(meta, changed[meta["filepath"]], fields)
+            if i % _COMMIT_EVERY == 0:
+                self.conn.commit()
+
+        if prune and known:
+            self.conn.executemany("DELETE FROM files WHERE path = ?", ((p,) for p in known))
+            stats["removed"] = len(known)
+        self.conn.commit()
+        return stats
+
+    # -----------------------------
+    # Reading
+    # -----------------------------
+    def get(self, path):
+        row = self.conn.execute("SELECT meta FROM files WHERE path = ?", (os.path.abspath(path),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def query(self, format=None, extension=None, modified_since=None, modified_before=None,
+              path_prefix=None, limit=None, fields=None):
+        """
+        Query indexed metadata without touching the filesystem.
+
+        Args:
+            format: MIME type; SQL LIKE patterns are allowed (e.g. "image/%").
+            extension: File extension, with or without the leading dot.
+            modified_since / modified_before: Epoch seconds, ISO dates or
+                relative spans such as "7d" (see parse_since).
+            path_prefix: Only files under this folder.
+            limit: Maximum number of results.
+            fields: {name: pattern} matched against extracted fields
+                case-insensitively with SQL LIKE, e.g. {"author": "Jane%"}.
+
+        Returns:
+            list[dict]: Stored metadata, most recently modified first.
+        """
+        where, params = [], []
+        if format:
+            where.append("format LIKE ?")
+            params.append(format)
+        if extension:
+            where.append("extension = ?")
+            params.append(extension.lower() if extension.startswith(".") else "." + extension.lower())
+        for op, value in ((">=", modified_since), ("<", modified_before)):
+            if value is not None:
+                where.append(f"mtime {op} ?")
+                params.append(value if isinstance(value, (int, float)) else parse_since(value))
+        if path_prefix:
+            prefix = os.path.abspath(path_prefix).rstrip(os.sep) + os.sep
+            where.append("substr(path, 1, ?) = ?")
+            params.extend([len(prefix), prefix])
+        for key, value in (fields or {}).items():
+            where.append("json_extract(meta, ?) LIKE ?")
+            params.extend([f'$."{key}"', str(value)])
+
+        sql = "SELECT meta FROM files"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY mtime DESC"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return [json.loads(r[0]) for r in self.conn.execute(sql, params)]
@@ -0,0 +1,177 @@
+# rosdl/core/metadata_watch.py
+"""
+Keep a metadata index current by watching a folder.
+
+Filesystem events come from watchdog (inotify on Linux, FSEvents/ReadDirectoryChangesW
+elsewhere) when it is installed; otherwise, or with poll=True for network
+mounts, the tree is snapshotted with os.scandir every few seconds. Events are
+debounced per path so a file being written is re-extracted once it has been
+quiet for `debounce` seconds, and only the affected files go through extract().
+"""
+
+import os
+import time
+import threading
+
+from rosdl import metadata_extractor as me
+from rosdl.metadata_index import MetadataIndex, DEFAULT_DB
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+DEFAULT_DEBOUNCE = 1.0
+DEFAULT_INTERVAL = 5.0
+
+
+class Debouncer:
+    """Thread-safe set of pending paths, released once each has been quiet for `delay` seconds."""
+
+    def __init__(self, delay=DEFAULT_DEBOUNCE):
+        self.delay = delay
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def touch(self, path):
+        with self._lock:
+            self._pending[path] = time.monotonic()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def ready(self, now=None, force=False):
+        """Pop and return the paths whose last event is older than the delay."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            done = [p for p, t in self._pending.items() if force or now - t >= self.delay]
+            for p in done:
+                del self._pending[p]
+        return sorted(done)
+
+
+def snapshot(folder, recursive=True):
+    """{path: (size, mtime_ns, inode)} for every file under folder, from scandir stats."""
+    return {p: (st.st_size, st.st_mtime_ns, st.st_ino) for p, st in me.iter_files(folder, recursive)}
+
+
+def diff_snapshots(old, new):
+    """Paths that were added, removed or changed between two snapshots."""
+    changed = {p for p, sig in new.items() if old.get(p) != sig}
+    changed.update(p for p in old if p not in new)
+    return changed
+
+
+class _EventHandler(FileSystemEventHandler):
+    def __init__(self, debouncer):
+        super().__init__()
+        self.debouncer = debouncer
+
+    def on_any_event(self, event):
+        kind = getattr(event, "event_type", None)
+        if kind in ("opened", "closed_no_write") or (event.is_directory and kind == "modified"):
+            return  # a folder's own mtime changes with every file event inside it
+        for path in (getattr(event, "src_path", None), getattr(event, "dest_path", None)):
+            if path:
+                self.debouncer.touch(os.path.abspath(os.fsdecode(path)))
+
+
+def apply_changes(index, paths, fields=None, recursive=True):
+    """
+    Bring the index in line with the current state of `paths`.
+
+    Existing files are re-extracted, vanished paths are removed (together with
+    everything indexed below them, for deleted or moved-away folders) and
+    folders that appeared are indexed as a whole.
+
+    Returns:
+        dict: counts of "updated" and "removed" entries.
+    """
+    stats = {"updated": 0, "removed": 0}
+    for path in paths:
+        if index._is_own_file(path):
+            continue
+        if os.path.isfile(path):
+            index.update_file(path, fields=fields)
+            stats["updated"] += 1
+        elif os.path.isdir(path):
+            if recursive:
+                res = index.update(path, recursive=True, fields=fields)
+                stats["updated"] += res["added"] + res["updated"]
+                stats["removed"] += res["removed"]
+        else:
+            stats["removed"] += index.remove(path) + index.remove_under(path)
+    index.conn.commit()
+    return stats
+
+
+def watch(folder, db=DEFAULT_DB, recursive=True, debounce=DEFAULT_DEBOUNCE, poll=False,
+          interval=DEFAULT_INTERVAL, fields=None, on_change=None, stop=None):
+    """
+    Watch folder and keep the metadata index in `db` current until interrupted.
+
+    The index is first brought up to date with an incremental scan, so changes
+    made while nothing was watching are caught as well.
+
+    Args:
+        folder: Folder to watch.
+        db: Index database (see metadata_index.MetadataIndex).
+        recursive: Watch subfolders.
+        debounce: Seconds a path must be quiet before it is re-extracted.
+        poll: Force scandir polling (network mounts, or watchdog missing).
+        interval: Seconds between polling snapshots (> 0).
+        fields: Limit extraction as in metadata_extractor.extract.
+        on_change: Optional callback(paths, stats) after each batch is applied.
+        stop: Optional threading.Event that ends the watch when set.
+
+    Returns:
+        str: The backend that was used, "events" or "poll".
+    """
+    if interval <= 0:
+        raise ValueError("interval must be positive")
+    folder = os.path.abspath(folder)
+    stop = stop or threading.Event()
+    debouncer = Debouncer(debounce)
+    use_events = Observer is not None and not poll
+    tick = min(debounce, interval) / 2 if debounce else 0.1
+
+    with MetadataIndex(db) as index:
+        def poll_once(previous):
+            current = snapshot(folder, recursive)
+            for path in diff_snapshots(previous, current):
+                debouncer.touch(path)
+            return current
+
+        def drain(force):
+            paths = debouncer.ready(force=force)
+            if paths:
+                stats = apply_changes(index, paths, fields, recursive)
+                if on_change:
+                    on_change(paths, stats)
+
+        index.update(folder, recursive=recursive, fields=fields)
+        observer = None
+        if use_events:
+            observer = Observer()
+            observer.schedule(_EventHandler(debouncer), folder, recursive=recursive)
+            observer.start()
+        else:
+            previous, next_poll = snapshot(folder, recursive), time.monotonic() + interval
+        try:
+            while not stop.wait(tick):
+                if not use_events and time.monotonic() >= next_poll:
+                    previous, next_poll = poll_once(previous), time.monotonic() + interval
+                drain(force=False)
+        except KeyboardInterrupt:
+            pass  # Ctrl+C: the pending changes are still applied below
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+        # changes still inside the debounce window, or since the last snapshot
+        if not use_events:
+            poll_once(previous)
+        drain(force=True)
+    return "events" if use_events else "poll"
@@ -0,0 +1,239 @@
+# rosdl/core/sketches.py
+"""
+Small, mergeable streaming sketches.
+
+- SpaceSaving: approximate top-k heavy hitters in bounded memory
+- HyperLogLog: approximate distinct counts in a fixed number of registers
+- TDigest: approximate quantiles from a bounded number of weighted centroids
+
+All can be updated in batches and merged, so partial results computed by
+parallel workers (or over chunks of a file) combine into one summary, and
+round-trip through JSON-friendly dicts (to_dict/from_dict) to be saved. Hashing
+uses BLAKE2b instead of Python's per-process salted hash(), so sketches built
+in different processes stay compatible.
+"""
+
+import zlib
+import heapq
+import base64
+import hashlib
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+import numpy as np
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitter sketch holding at most `capacity` counters.
+
+    Counts are overestimates by at most error(item); when fewer than
+    `capacity` distinct items have been seen they are exact.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self.counts: Dict[Hashable, int] = {}
+        self.errors: Dict[Hashable, int] = {}
+
+    def __len__(self):
+        return len(self.counts)
+
+    @property
+    def floor(self) -> int:
+        """Count an unmonitored item may have had (0 until the sketch is full)."""
+        return min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+
+    def update(self, items: Iterable[Hashable]) -> "SpaceSaving":
+        """Add a batch of items (counted exactly first, then folded into the sketch)."""
+        return self.update_counts(Counter(items))
+
+    def update_counts(self, counts: Dict[Hashable, int]) -> "SpaceSaving":
+        floor = self.floor
+        new_counts, new_errors = dict(self.counts), dict(self.errors)
+        for item, c in counts.items():
+            if item in new_counts:
+                new_counts[item] += c
+            else:
+                new_counts[item] = floor + c
+                new_errors[item] = floor
+        self._prune(new_counts, new_errors)
+        return self
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """Combine with another sketch (mergeable summaries, Agarwal et al. 2012)."""
+        f_self, f_other = self.floor, other.floor
+        counts, errors = {}, {}
+        for item in self.counts.keys() | other.counts.keys():
+            counts[item] = self.counts.get(item, f_self) + other.counts.get(item, f_other)
+            errors[item] = self.errors.get(item, f_self) + other.errors.get(item, f_other)
+        self.capacity = max(self.capacity, other.capacity)
+        self._prune(counts, errors)
+        return self
+
+    def _prune(self, counts, errors):
+        if len(counts) > self.capacity:
+            keep = heapq.nlargest(self.capacity, counts.items(), key=lambda kv: kv[1])
+            counts = dict(keep)
+            errors = {item: errors.get(item, 0) for item in counts}
+        self.counts, self.errors = counts, errors
+
+    def error(self, item) -> int:
+        return self.errors.get(item, self.floor)
+
+    def top(self, n: int = 10) -> List[Tuple[Hashable, int]]:
+        """The n items with the highest estimated counts, highest first."""
+        return heapq.nlargest(n, self.counts.items(), key=lambda kv: kv[1])
+
+    def to_dict(self) -> dict:
+        """JSON-friendly state; items must be JSON scalars (str, int, float, bool)."""
+        return {"capacity": self.capacity,
+                "items": [[item, int(c), int(self.errors.get(item, 0))] for item, c in self.counts.items()]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SpaceSaving":
+        sketch = cls(data["capacity"])
+        sketch.counts = {item: c for item, c, _ in data["items"]}
+        sketch.errors = {item: e for item, _, e in data["items"]}
+        return sketch
+
+
+def _hash64(item) -> int:
+    data = item.encode('utf-8') if isinstance(item, str) else repr(item).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct counter with 2**p registers (p=14: 16 KiB, ~0.8% error).
+    """
+
+    def __init__(self, p: int = 14):
+        if not 4 <= p <= 18:
+            raise ValueError("p must be between 4 and 18")
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def add(self, item) -> None:
+        self.update([item])
+
+    def update(self, items: Iterable) -> "HyperLogLog":
+        return self.update_hashes(np.fromiter((_hash64(i) for i in items), dtype=np.uint64))
+
+    def update_hashes(self, hashes: np.ndarray) -> "HyperLogLog":
+        """Add precomputed 64-bit hashes (e.g. pandas.util.hash_array); do not mix hash functions in one sketch."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if not len(hashes):
+            return self
+        idx = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = (hashes << np.uint64(self.p)) | np.uint64(1 << (self.p - 1))  # guard bit caps the rank
+        # rank = leading zeros of the remaining bits + 1
+        bits = np.clip(64 - np.floor(np.log2(rest.astype(np.float64))).astype(np.int64), 1, 64 - self.p + 1)
+        np.maximum.at(self.registers, idx, bits.astype(np.uint8))
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.p != self.p:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self) -> int:
+        m = self.m
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)  # linear counting for small cardinalities
+        return int(round(estimate))
+
+    def __len__(self):
+        return self.count()
+
+    def to_dict(self) -> dict:
+        return {"p": self.p, "registers": base64.b64encode(zlib.compress(self.registers.tobytes())).decode("ascii")}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HyperLogLog":
+        sketch = cls(data["p"])
+        sketch.registers = np.frombuffer(zlib.decompress(base64.b64decode(data["registers"])), dtype=np.uint8).copy()
+        return sketch
+
+
+class TDigest:
+    """
+    Merging t-digest (Dunning & Ertl) for quantiles of a numeric stream.
+
+    Points are folded into at most about `compression` centroids, small at the
+    tails and larger around the median, so extreme quantiles stay accurate.
+    Compression is vectorised: sorted centroids are grouped by the integer
+    part of the arcsine scale function of their cumulative weight.
+    """
+
+    def __init__(self, compression: int = 200):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min, self.max = np.inf, -np.inf
+
+    def __len__(self):
+        return len(self.means)
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def update(self, values) -> "TDigest":
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.min, self.max = min(self.min, values.min()), max(self.max, values.max())
+            self._compress(np.concatenate([self.means, values]), np.concatenate([self.weights, np.ones(len(values))]))
+        return self
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        if len(other):
+            self.min, self.max = min(self.min, other.min), max(self.max, other.max)
+            self._compress(np.concatenate([self.means, other.means]), np.concatenate([self.weights, other.weights]))
+        return self
+
+    def _compress(self, means, weights):
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        cum = np.cumsum(weights)
+        q = (cum - weights / 2) / cum[-1]
+        k = np.floor(self.compression * (np.arcsin(2 * q - 1) / np.pi + 0.5))
+        starts = np.flatnonzero(np.r_[True, k[1:] != k[:-1]])
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def quantile(self, q):
+        """Estimated quantile(s) for q in [0, 1]; NaN for an empty digest."""
+        if not len(self.means):
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        cum = np.cumsum(self.weights)
+        xp = np.r_[0.0, cum - self.weights / 2, cum[-1]]
+        fp = np.r_[self.min, self.means, self.max]
+        return np.interp(np.asarray(q, dtype=np.float64) * cum[-1], xp, fp)
+
+    def cdf(self, x):
+        """Estimated fraction of values <= x (inverse of quantile())."""
+        if not len(self.means):
+            return np.full(np.shape(x), np.nan) if np.ndim(x) else np.nan
+        cum = np.cumsum(self.weights)
+        xp = np.r_[0.0, cum - self.weights / 2, cum[-1]] / cum[-1]
+        fp = np.r_[self.min, self.means, self.max]
+        return np.interp(x, fp, xp, left=0.0, right=1.0)
+
+    def to_dict(self) -> dict:
+        return {"compression": self.compression, "means": self.means.tolist(), "weights": self.weights.tolist(),
+                "min": float(self.min), "max": float(self.max)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TDigest":
+        digest = cls(data["compression"])
+        digest.means = np.asarray(data["means"], dtype=np.float64)
+        digest.weights = np.asarray(data["weights"], dtype=np.float64)
+        digest.min, digest.max = data["min"], data["max"]
+        return digest
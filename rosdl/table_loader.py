@@ -0,0 +1,300 @@
+# rosdl/core/table_loader.py
+"""
+Shared tabular loader used by the EDA, drift, synthetic data and converter modules.
+
+- Uses the pyarrow CSV engine when available
+- Infers dtypes from a row sample once and caches them (in the rosdl cache
+  folder, or optionally a ``<file>.schema.json`` sidecar) so later loads skip
+  type inference; types that do not hold past the sample fall back to full
+  inference, also when reading in chunks
+- Optional categorical conversion and numeric downcasting
+- Chunked iteration for CSV and Parquet
+"""
+
+import io
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    import pyarrow.parquet as pq
+except ImportError:
+    pyarrow, pq = None, None
+
+SCHEMA_SUFFIX = ".schema.json"
+SAMPLE_ROWS = 10000
+CATEGORY_RATIO = 0.5
+_CONVERSION_ERRORS = (ValueError, TypeError, OverflowError)
+
+
+def cache_dir():
+    """Folder for cached schemas: $ROSDL_CACHE_DIR, else ~/.cache/rosdl."""
+    return os.environ.get("ROSDL_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "rosdl")
+
+
+def _kwargs_key(read_kwargs):
+    return json.dumps(read_kwargs or {}, sort_keys=True, default=repr)
+
+
+def schema_path(path, read_kwargs=None, sidecar=False):
+    """
+    Where the schema of path is cached: a ``<file>.schema.json`` sidecar when
+    sidecar=True, else a file in cache_dir() keyed by the absolute path and
+    the read_csv options.
+    """
+    if sidecar:
+        return str(path) + SCHEMA_SUFFIX
+    key = os.path.abspath(os.fspath(path)) + "\0" + _kwargs_key(read_kwargs)
+    name = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(cache_dir(), "schemas", name + SCHEMA_SUFFIX)
+
+
+def _source_key(path):
+    st = os.stat(path)
+    return {"source_size": st.st_size, "source_mtime_ns": st.st_mtime_ns}
+
+
+def load_schema(path, read_kwargs=None, sidecar=False):
+    """Return the cached schema dict for path, or None if missing or stale."""
+    try:
+        with open(schema_path(path, read_kwargs, sidecar), encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if {k: cached.get(k) for k in ("source_size", "source_mtime_ns")} != _source_key(path):
+        return None
+    if cached.get("read_kwargs", _kwargs_key(read_kwargs)) != _kwargs_key(read_kwargs):
+        return None
+    return cached
+
+
+def save_schema(path, schema, read_kwargs=None, sidecar=False):
+    """Write the cached schema; silently skipped if the folder is not writable."""
+    target = schema_path(path, read_kwargs, sidecar)
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+        with open(target, "w", encoding="utf-8") as f:
+            json.dump({**_source_key(path), "read_kwargs": _kwargs_key(read_kwargs), **schema}, f, indent=2)
+    except OSError:
+        pass
+
+
+def infer_schema(path, sample_rows=SAMPLE_ROWS, **read_kwargs):
+    """
+    Infer column dtypes from the first ``sample_rows`` rows of a CSV.
+
+    Returns a dict with "dtypes" ({column: dtype}) and "categories", the
+    string columns whose sampled distinct ratio is at most CATEGORY_RATIO.
+    """
+    sample = pd.read_csv(path, nrows=sample_rows, **read_kwargs)
+    dtypes, categories = {}, []
+    for col in sample.columns:
+        dtype = sample[col].dtype
+        dtypes[col] = str(dtype)
+        if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            n = sample[col].count()
+            if n and sample[col].nunique() / n <= CATEGORY_RATIO:
+                categories.append(col)
+    return {"sample_rows": sample_rows, "dtypes": dtypes, "categories": categories}
+
+
+def downcast_numeric(df):
+    """Downcast integer and float columns to the smallest dtype that holds their values."""
+    for col in df.columns:
+        if pd.api.types.is_bool_dtype(df[col]):
+            continue
+        if pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+        elif pd.api.types.is_float_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast="float")
+    return df
+
+
+def _resolve_engine(engine, chunksize):
+    if engine != "auto":
+        return engine
+    return "pyarrow" if pyarrow is not None and chunksize is None else "c"
+
+
+def _iter_parquet(path, usecols, chunksize, downcast):
+    if pq is None:
+        raise ImportError("pyarrow is not installed. Install it with: pip install pyarrow")
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=usecols):
+        df = batch.to_pandas()
+        yield downcast_numeric(df) if downcast else df
+
+
+def _iter_csv(path, dtypes, chunksize, downcast, categories, **kwargs):
+    """
+    Chunks of a CSV read with the sampled dtypes. If a later value does not fit
+    them, the read restarts without them (pandas infers types per chunk) and
+    skips the rows already delivered. path may also be an open binary file;
+    the restart then seeks back to where it was positioned.
+    """
+    start = path.tell() if hasattr(path, "seek") else None
+    done = 0
+    try:
+        for chunk in pd.read_csv(path, dtype=dtypes, chunksize=chunksize, **kwargs):
+            done += len(chunk)
+            yield downcast_numeric(chunk) if downcast else chunk
+        return
+    except _CONVERSION_ERRORS:
+        pass
+    if start is not None:
+        path.seek(start)
+    seen = 0
+    for chunk in pd.read_csv(path, chunksize=chunksize, **kwargs):
+        if seen < done:  # count records, not lines: quoted fields may span lines
+            skip = min(done - seen, len(chunk))
+            seen += skip
+            chunk = chunk.iloc[skip:]
+            if chunk.empty:
+                continue
+        if categories:
+            chunk = chunk.astype({c: "category" for c in categories if c in chunk.columns})
+        yield downcast_numeric(chunk) if downcast else chunk
+
+
+def read_table(path, usecols=None, engine="auto", categorical=False, downcast=False,
+               sample_rows=SAMPLE_ROWS, schema_cache=True, chunksize=None, **read_kwargs):
+    """
+    Load a CSV or Parquet file into a DataFrame.
+
+    Args:
+        path: CSV or Parquet file.
+        usecols: Optional list of columns to load.
+        engine: "auto" (pyarrow when installed, else "c"), "pyarrow", "c" or "python".
+        categorical: Store low-cardinality string columns as "category".
+        downcast: Downcast numeric columns after loading.
+        sample_rows: Rows used for dtype inference.
+        schema_cache: Cache the inferred dtypes: True (in cache_dir()),
+            "sidecar" (a <file>.schema.json next to the data) or False.
+        chunksize: If given, return an iterator of DataFrames of this many rows.
+        **read_kwargs: Passed through to pandas.read_csv.
+
+    Returns:
+        DataFrame, or an iterator of DataFrames when chunksize is set.
+    """
+    path = os.fspath(path)
+    if path.lower().endswith((".parquet", ".pq")):
+        if chunksize:
+            return _iter_parquet(path, usecols, chunksize, downcast)
+        df = pd.read_parquet(path, columns=usecols)
+        return downcast_numeric(df) if downcast else df
+
+    sidecar = schema_cache == "sidecar"
+    schema = load_schema(path, read_kwargs, sidecar) if schema_cache else None
+    if schema is None:
+        schema = infer_schema(path, sample_rows=sample_rows, **read_kwargs)
+        if schema_cache:
+            save_schema(path, schema, read_kwargs, sidecar)
+    dtypes = dict(schema["dtypes"])
+    if categorical:
+        dtypes.update({c: "category" for c in schema["categories"]})
+    if usecols is not None:
+        dtypes = {c: t for c, t in dtypes.items() if c in usecols}
+
+    engine = _resolve_engine(engine, chunksize)
+    kwargs = dict(usecols=usecols, engine=engine, **read_kwargs)
+    if chunksize:
+        return _iter_csv(path, dtypes, chunksize, downcast, schema["categories"] if categorical else None, **kwargs)
+
+    try:
+        df = pd.read_csv(path, dtype=dtypes, **kwargs)
+    except _CONVERSION_ERRORS:
+        # sampled types did not hold for the whole file; infer over everything once
+        df = pd.read_csv(path, **kwargs)
+        if schema_cache and usecols is None:
+            save_schema(path, {**schema, "sample_rows": None,
+                               "dtypes": {c: str(t) for c, t in df.dtypes.items()}}, read_kwargs, sidecar)
+        if categorical:
+            df = df.astype({c: "category" for c in schema["categories"] if c in df.columns})
+    return downcast_numeric(df) if downcast else df
+
+
+
+def _sample_batches(batches, sample, seed, take, concat):
+    """
+    Uniform random rows of a stream of batches, keeping only the drawn rows.
+
+    A fraction keeps each row with that probability; a row count keeps the
+    rows with the smallest random keys (bottom-k), pruned whenever twice the
+    count has been kept. Returns (sampled rows in file order, total rows).
+    """
+    rng = np.random.default_rng(seed)
+    size = None if sample < 1 else int(sample)
+    pieces, keys, rows, total = [], [], [], 0
+    threshold = 1.0
+    for batch in batches:
+        n = len(batch)
+        u = rng.random(n)
+        sel = np.flatnonzero(u < (sample if size is None else threshold))
+        pieces.append(take(batch, sel))
+        keys.append(u[sel])
+        rows.append(sel + total)
+        total += n
+        if size is not None and sum(map(len, keys)) > 2 * size:
+            pieces, keys, rows = [concat(pieces)], [np.concatenate(keys)], [np.concatenate(rows)]
+            best = np.sort(np.argpartition(keys[0], size)[:size])
+            pieces, keys, rows = [take(pieces[0], best)], [keys[0][best]], [rows[0][best]]
+            threshold = keys[0].max()
+    if not pieces:
+        return None, 0
+    kept, keys, rows = concat(pieces), np.concatenate(keys), np.concatenate(rows)
+    if size is not None and len(keys) > size:
+        kept = take(kept, np.sort(np.argpartition(keys, size)[:size]))
+    return kept, total
+
+
+def read_sample(path, sample, seed=0, usecols=None, chunksize=100_000, **read_kwargs):
+    """
+    Load a uniform random sample of rows in one streaming pass.
+
+    The file is parsed in chunks with every field as text and only the drawn
+    rows are kept, so memory stays at about one chunk plus the sample; the
+    sample is then typed like a normal read_csv. CSV batches come from the
+    pyarrow streaming reader when it is installed and no read_csv options
+    are given, else from pandas. Parquet is read and then sampled.
+
+    Args:
+        path: CSV or Parquet file.
+        sample: Number of rows, or a fraction of the rows when below 1 (each
+            row is kept with that probability).
+        seed: Random seed.
+        usecols: Optional list of columns to load.
+        chunksize: Rows parsed per chunk by the pandas reader.
+        **read_kwargs: Passed through to pandas.read_csv.
+
+    Returns:
+        (DataFrame, total_rows) - the sample and the row count of the whole file.
+    """
+    path = os.fspath(path)
+    if path.lower().endswith((".parquet", ".pq")):
+        df = pd.read_parquet(path, columns=usecols)
+        n = int(round(sample * len(df))) if sample < 1 else int(sample)
+        return (df.sample(n=max(n, 1), random_state=seed).sort_index() if n < len(df) else df), len(df)
+
+    header = pd.read_csv(path, nrows=0, usecols=usecols, **read_kwargs)
+    if pyarrow is not None and not read_kwargs:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+        names = list(header.columns)
+        reader = pacsv.open_csv(path, convert_options=pacsv.ConvertOptions(
+            column_types={c: pa.string() for c in names}, include_columns=names, strings_can_be_null=True))
+        batches = (pa.Table.from_batches([b]) for b in reader)
+        kept, total = _sample_batches(batches, sample, seed, lambda t, idx: t.take(idx), pa.concat_tables)
+        kept = kept.to_pandas() if kept is not None else header
+    else:
+        chunks = pd.read_csv(path, usecols=usecols, dtype=str, keep_default_na=False, chunksize=chunksize,
+                             **read_kwargs)
+        kept, total = _sample_batches(chunks, sample, seed, lambda b, idx: b.iloc[idx],
+                                      lambda parts: pd.concat(parts))
+        kept = kept if kept is not None else header
+    # type the sampled text the way read_csv types a file
+    buffer = io.StringIO()
+    kept.to_csv(buffer, index=False)
+    buffer.seek(0)
+    return pd.read_csv(buffer)[list(header.columns)], total
@@ -0,0 +1,225 @@
+# rosdl/core/text_dedup.py
+"""
+Near-duplicate document detection with MinHash and LSH.
+
+Documents are normalised with TextUtilities.clean_text and cut into word
+shingles. A MinHash signature is computed for each document in one vectorised
+numpy pass over all of its shingles and all hash functions. The signature is
+then split into LSH bands, and only documents that share a band bucket are
+compared, so the work grows near-linearly with corpus size instead of
+quadratically.
+
+Signatures and band buckets live in SQLite, so new batches can be checked
+incrementally against everything indexed before.
+"""
+
+import os
+import zlib
+import sqlite3
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from rosdl.text_utils_module import TextUtilities
+
+DEFAULT_PERM = 128
+DEFAULT_BANDS = 32
+DEFAULT_SHINGLE = 5
+DEFAULT_THRESHOLD = 0.8
+_COMMIT_EVERY = 1000
+_WORD_CACHE_SIZE = 1_000_000
+_SHINGLE_BASE = np.uint64(0x100000001B3)  # FNV-64 prime
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS params (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS docs (id TEXT PRIMARY KEY, signature BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS buckets (key BLOB NOT NULL, doc TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS idx_buckets_key ON buckets(key);
+CREATE INDEX IF NOT EXISTS idx_buckets_doc ON buckets(doc);
+"""
+
+
+class MinHashIndex:
+    """
+    Persistent MinHash/LSH index. Use as a context manager or call close().
+
+    With num_perm = bands * rows, two documents become candidates with
+    probability 1 - (1 - J**rows)**bands for Jaccard similarity J (defaults:
+    32 bands of 4 rows, about 50% at J=0.42 and over 99.9% at J=0.8), and are
+    reported when their estimated similarity reaches the threshold.
+    """
+
+    def __init__(self, path: str = ":memory:", num_perm: int = DEFAULT_PERM, bands: int = DEFAULT_BANDS,
+                 shingle_size: int = DEFAULT_SHINGLE, seed: int = 1):
+        self.conn = sqlite3.connect(path)
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        stored = dict(self.conn.execute("SELECT name, value FROM params"))
+        if stored:  # an existing index keeps the parameters it was built with
+            num_perm, bands, shingle_size, seed = (stored[k] for k in ("num_perm", "bands", "shingle_size", "seed"))
+        else:
+            self.conn.executemany("INSERT INTO params VALUES (?, ?)", [
+                ("num_perm", num_perm), ("bands", bands), ("shingle_size", shingle_size), ("seed", seed)])
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm, self.bands, self.shingle_size, self.seed = num_perm, bands, shingle_size, seed
+        self.rows = num_perm // bands
+        rng = np.random.default_rng(seed)
+        # multiply-shift hashing: h(x) = ((a * x + b) mod 2**64) >> 32 with odd a
+        self._a = rng.integers(0, 2 ** 63, num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, num_perm, dtype=np.uint64)
+        self._util = TextUtilities()
+        self._word_cache = {}
+        self._pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    # -----------------------------
+    # Signatures
+    # -----------------------------
+    def _word_hashes(self, words: List[str]) -> np.ndarray:
+        cache = self._word_cache
+        if len(cache) > _WORD_CACHE_SIZE:
+            cache.clear()
+        out = np.empty(len(words), dtype=np.uint64)
+        for i, w in enumerate(words):
+            h = cache.get(w)
+            if h is None:
+                h = cache[w] = zlib.crc32(w.encode('utf-8'))
+            out[i] = h
+        return out
+
+    def shingles(self, text: str) -> np.ndarray:
+        """
+        32-bit hashes of the distinct word shingles of the cleaned text.
+
+        Each word is hashed once; shingle hashes are then combined from
+        shifted word-hash arrays (a polynomial rolling hash) without building
+        the shingle strings.
+        """
+        words = self._util.clean_text(text, remove_stopwords=False).split() or ['']
+        h = self._word_hashes(words)
+        k = min(self.shingle_size, len(h))
+        n = len(h) - k + 1
+        acc = h[:n].copy()
+        for j in range(1, k):
+            acc = acc * _SHINGLE_BASE + h[j:j + n]
+        return np.unique((acc >> np.uint64(32)) ^ (acc & np.uint64(0xFFFFFFFF)))
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature (num_perm uint32 values) of a document."""
+        x = self.shingles(text)
+        hashed = (x[:, None] * self._a + self._b) >> np.uint64(32)
+        return hashed.min(axis=0).astype(np.uint32)
+
+    def _band_keys(self, sig: np.ndarray) -> List[bytes]:
+        rows = self.rows
+        return [band.to_bytes(2, 'little') + sig[band * rows:(band + 1) * rows].tobytes()
+                for band in range(self.bands)]
+
+    @staticmethod
+    def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return float(np.mean(sig_a == sig_b))
+
+    # -----------------------------
+    # Index operations
+    # -----------------------------
+    def query(self, text: str = None, threshold: float = DEFAULT_THRESHOLD,
+              signature: np.ndarray = None) -> List[Tuple[str, float]]:
+        """Indexed documents whose estimated similarity to text reaches threshold, best first."""
+        sig = self.signature(text) if signature is None else signature
+        keys = self._band_keys(sig)
+        rows = self.conn.execute(
+            "SELECT id, signature FROM docs WHERE id IN "
+            f"(SELECT DISTINCT doc FROM buckets WHERE key IN ({','.join('?' * len(keys))}))", keys)
+        matches = []
+        for doc_id, blob in rows:
+            sim = self.similarity(sig, np.frombuffer(blob, dtype=np.uint32))
+            if sim >= threshold:
+                matches.append((doc_id, sim))
+        return sorted(matches, key=lambda m: (-m[1], m[0]))
+
+    def add(self, doc_id: str, text: str = None, threshold: float = DEFAULT_THRESHOLD,
+            signature: np.ndarray = None) -> List[Tuple[str, float]]:
+        """Index a document and return the already indexed near-duplicates of it."""
+        doc_id = str(doc_id)
+        sig = self.signature(text) if signature is None else signature
+        matches = [m for m in self.query(threshold=threshold, signature=sig) if m[0] != doc_id]
+        self.remove(doc_id)
+        self.conn.execute("INSERT INTO docs VALUES (?, ?)", (doc_id, sig.tobytes()))
+        self.conn.executemany("INSERT INTO buckets VALUES (?, ?)", ((k, doc_id) for k in self._band_keys(sig)))
+        self._pending += 1
+        if self._pending >= _COMMIT_EVERY:
+            self.conn.commit()
+            self._pending = 0
+        return matches
+
+    def remove(self, doc_id: str) -> bool:
+        """Drop a document from the index. Returns True if it was present."""
+        if not self.conn.execute("DELETE FROM docs WHERE id = ?", (str(doc_id),)).rowcount:
+            return False
+        self.conn.execute("DELETE FROM buckets WHERE doc = ?", (str(doc_id),))
+        return True
+
+    def add_many(self, documents: Iterable[Tuple[str, str]],
+                 threshold: float = DEFAULT_THRESHOLD) -> Iterator[Tuple[str, List[Tuple[str, float]]]]:
+        """Index (id, text) pairs, yielding (id, near-duplicates) for each as it is added."""
+        for doc_id, text in documents:
+            yield str(doc_id), self.add(doc_id, text, threshold)
+        self.conn.commit()
+
+
+def cluster_pairs(matches: Iterable[Tuple[str, List[Tuple[str, float]]]]) -> List[List[str]]:
+    """Union-find over (id, near-duplicates) results; returns clusters of 2+ ids, largest first."""
+    parent: Dict[str, str] = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for doc_id, dups in matches:
+        for other, _ in dups:
+            ra, rb = find(doc_id), find(other)
+            if ra != rb:
+                parent[max(ra, rb)] = min(ra, rb)
+    groups: Dict[str, List[str]] = {}
+    for x in parent:
+        groups.setdefault(find(x), []).append(x)
+    return sorted((sorted(g) for g in groups.values() if len(g) > 1), key=lambda g: (-len(g), g[0]))
+
+
+def find_near_duplicates(documents: Iterable[Tuple[str, str]], index_path: str = ":memory:",
+                         threshold: float = DEFAULT_THRESHOLD, **index_kwargs) -> List[List[str]]:
+    """
+    Cluster near-duplicate documents.
+
+    Args:
+        documents: (id, text) pairs, e.g. from text_utils_module.iter_documents.
+        index_path: SQLite file to persist the index; documents indexed in
+            earlier runs take part in the clustering.
+        threshold: Minimum estimated Jaccard similarity of word shingles.
+
+    Returns:
+        list[list[str]]: Clusters of document ids that involve the new documents.
+    """
+    if index_path != ":memory:":
+        os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+    with MinHashIndex(index_path, **index_kwargs) as index:
+        return cluster_pairs(index.add_many(documents, threshold))
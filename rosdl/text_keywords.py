@@ -0,0 +1,149 @@
+# rosdl/core/text_keywords.py
+"""
+Out-of-core TF-IDF keyword extraction.
+
+Documents are hashed with sklearn's HashingVectorizer, so no vocabulary has to
+be held in memory to vectorise them. Document frequencies are accumulated chunk
+by chunk, and a reverse map (hash bucket -> first term seen) turns top-scoring
+columns back into words. The fitted IDF model is saved to a single .npz file
+and can be reused on new documents. Keywords are picked per document with a
+row-wise argpartition over the sparse TF-IDF matrix.
+"""
+
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+DEFAULT_FEATURES = 2 ** 20
+DEFAULT_CHUNKSIZE = 1000
+
+
+class KeywordModel:
+    """Incrementally fitted TF-IDF model over hashed features."""
+
+    def __init__(self, n_features: int = DEFAULT_FEATURES, stop_words: str = 'english',
+                 ngram_range: Tuple[int, int] = (1, 1), sublinear_tf: bool = True):
+        from sklearn.feature_extraction.text import HashingVectorizer
+        from sklearn.utils import murmurhash3_32
+        self._hash = murmurhash3_32
+        self.n_features = int(n_features)
+        self.stop_words = stop_words
+        self.ngram_range = tuple(ngram_range)
+        self.sublinear_tf = sublinear_tf
+        self.vectorizer = HashingVectorizer(n_features=self.n_features, stop_words=stop_words,
+                                            ngram_range=self.ngram_range, alternate_sign=False, norm=None)
+        self._analyzer = self.vectorizer.build_analyzer()
+        self.df = np.zeros(self.n_features, dtype=np.int64)
+        self.n_docs = 0
+        self.terms = {}  # hash bucket -> term
+
+    # -----------------------------
+    # Fitting
+    # -----------------------------
+    def _bucket(self, term: str) -> int:
+        # same bucket as HashingVectorizer: |signed murmurhash3| mod n_features
+        return abs(self._hash(term, seed=0)) % self.n_features
+
+    def partial_fit(self, documents: List[str]) -> "KeywordModel":
+        """Add a chunk of documents to the document frequencies."""
+        documents = list(documents)
+        if not documents:
+            return self
+        X = self.vectorizer.transform(documents)
+        self.df += np.bincount(X.indices, minlength=self.n_features)
+        self.n_docs += len(documents)
+        self._learn_terms(documents)
+        return self
+
+    def _learn_terms(self, documents: List[str]) -> None:
+        terms = self.terms
+        for doc in documents:
+            for term in set(self._analyzer(doc)):
+                bucket = self._bucket(term)
+                if bucket not in terms:
+                    terms[bucket] = term
+
+    def fit(self, documents: Iterable[str], chunksize: int = DEFAULT_CHUNKSIZE) -> "KeywordModel":
+        """Fit on an iterable of any size, holding only `chunksize` documents at a time."""
+        for chunk in _chunks(documents, chunksize):
+            self.partial_fit(chunk)
+        return self
+
+    @property
+    def idf(self) -> np.ndarray:
+        """Smoothed IDF, as in sklearn's TfidfTransformer: ln((1 + n) / (1 + df)) + 1."""
+        return np.log((1 + self.n_docs) / (1 + self.df)) + 1
+
+    # -----------------------------
+    # Scoring
+    # -----------------------------
+    def transform(self, documents: List[str]):
+        """L2-normalised TF-IDF matrix (scipy CSR) for documents."""
+        from sklearn.preprocessing import normalize
+        X = self.vectorizer.transform(list(documents)).astype(np.float64)
+        if self.sublinear_tf:
+            np.log1p(X.data, out=X.data)
+        X = X.multiply(self.idf).tocsr()
+        return normalize(X, copy=False)
+
+    def top_k(self, documents: List[str], k: int = 10) -> List[List[Tuple[str, float]]]:
+        """Per-document top-k (term, score) pairs, best first."""
+        documents = list(documents)
+        self._learn_terms(documents)  # so words unseen while fitting can still be named
+        X = self.transform(documents)
+        result = []
+        for i in range(X.shape[0]):
+            start, end = X.indptr[i], X.indptr[i + 1]
+            data, cols = X.data[start:end], X.indices[start:end]
+            if len(data) > k:
+                part = np.argpartition(-data, k - 1)[:k]
+                data, cols = data[part], cols[part]
+            order = np.argsort(-data, kind='stable')
+            result.append([(self.terms.get(int(c), f"#{c}"), float(d)) for c, d in zip(cols[order], data[order])])
+        return result
+
+    def iter_keywords(self, documents: Iterable[str], k: int = 10,
+                      chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[List[Tuple[str, float]]]:
+        """Stream per-document keywords for an iterable of any size."""
+        for chunk in _chunks(documents, chunksize):
+            yield from self.top_k(chunk, k)
+
+    # -----------------------------
+    # Persistence
+    # -----------------------------
+    def save(self, path: str) -> str:
+        """Write the model to a compressed .npz file; returns the path."""
+        buckets = np.fromiter(self.terms.keys(), dtype=np.int64, count=len(self.terms))
+        # one UTF-8 buffer of newline-separated terms (tokens never contain newlines); a fixed-width
+        # unicode array would pad every term to the longest one
+        words = np.frombuffer('\n'.join(self.terms.values()).encode('utf-8'), dtype=np.uint8)
+        nz = np.flatnonzero(self.df)
+        with open(path, 'wb') as f:
+            np.savez_compressed(
+                f, df_index=nz, df_count=self.df[nz], n_docs=self.n_docs, n_features=self.n_features,
+                stop_words=self.stop_words or '', ngram_range=np.array(self.ngram_range),
+                sublinear_tf=self.sublinear_tf, term_buckets=buckets, term_text=words,
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "KeywordModel":
+        with np.load(path, allow_pickle=False) as data:
+            model = cls(n_features=int(data['n_features']), stop_words=str(data['stop_words']) or None,
+                        ngram_range=tuple(int(n) for n in data['ngram_range']),
+                        sublinear_tf=bool(data['sublinear_tf']))
+            model.df[data['df_index']] = data['df_count']
+            model.n_docs = int(data['n_docs'])
+            buckets = data['term_buckets'].tolist()
+            if 'term_text' in data:
+                words = data['term_text'].tobytes().decode('utf-8').split('\n') if buckets else []
+            else:  # models saved with a fixed-width unicode array
+                words = data['term_words'].tolist()
+            model.terms = dict(zip(buckets, words))
+        return model
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    it = iter(iterable)
+    return iter(lambda: list(islice(it, size)), [])
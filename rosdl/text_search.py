@@ -0,0 +1,304 @@
+# rosdl/core/text_search.py
+"""
+Full-text inverted index with BM25 ranking over folders of TXT, DOCX and PDF files.
+
+Text is extracted once, in parallel worker processes, and normalised with
+TextUtilities (clean_text, then stemming). Postings are stored in SQLite as
+zlib-compressed, delta-encoded numpy segments, one segment per term and
+indexing batch. Re-indexing is incremental by size and mtime: changed or
+deleted files are dropped from the document table, their stale postings are
+skipped at query time, and the postings are compacted once enough of them are
+dead. Queries read only the postings of their own terms and score them
+vectorised, so they answer in milliseconds. Document lengths and the BM25
+collection statistics are cached on the TextIndex between queries and
+reloaded only after the documents change.
+"""
+
+import os
+import time
+import zlib
+import sqlite3
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+import numpy as np
+
+from rosdl import text_utils_module as tu
+from rosdl.metadata_extractor import iter_files, DEFAULT_WORKERS
+
+DEFAULT_DB = "rosdl_text.db"
+INDEXED_EXTENSIONS = (".txt", ".docx", ".pdf")
+BATCH_SIZE = 500
+K1, B = 1.2, 0.75
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,  -- never reused: stale postings must not match new documents
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    segment INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (term, segment)
+) WITHOUT ROWID;
+"""
+
+
+_util = tu.TextUtilities()
+
+
+def analyze(text: str, stem: bool = True) -> List[str]:
+    """
+    Normalise text into index terms: clean_text, then cached Porter stemming.
+
+    Stopwords are kept; BM25's IDF already gives them next to no weight, and no
+    NLTK corpus has to be installed to index.
+    """
+    words = _util.clean_text(text, remove_stopwords=False).split()
+    return _util.stem_cache.stem_many(words) if stem and words else words
+
+
+def _analyze_file(args):
+    path, stem = args
+    try:
+        terms = analyze(tu.load_text(path), stem)
+    except Exception as e:  # unreadable or corrupt file: report it, keep indexing the rest
+        return path, None, str(e)
+    return path, Counter(terms), len(terms)
+
+
+def _encode(ids: np.ndarray, tfs: np.ndarray) -> bytes:
+    deltas = np.diff(ids, prepend=0).astype(np.uint32)
+    return zlib.compress(np.concatenate([deltas, tfs.astype(np.uint32)]).tobytes())
+
+
+def _decode(n: int, data: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    arr = np.frombuffer(zlib.decompress(data), dtype=np.uint32)
+    return np.cumsum(arr[:n], dtype=np.int64), arr[n:].astype(np.float64)
+
+
+class TextIndex:
+    """SQLite-backed inverted index. Use as a context manager or call close()."""
+
+    def __init__(self, db_path: str = DEFAULT_DB, stem: bool = True):
+        self.db_path = os.path.abspath(db_path)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        stored = self._meta("stem")
+        self.stem = bool(stored) if stored is not None else stem
+        self._set_meta("stem", int(self.stem))
+        self._stats, self._stats_version = None, None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def _meta(self, name, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, name, value):
+        self.conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (name, value))
+
+    # -----------------------------
+    # Indexing
+    # -----------------------------
+    def _write_batch(self, results):
+        """Insert analysed documents and append one postings segment per term."""
+        segment = self._meta("next_segment", 0)
+        postings = {}
+        for path, st, counts, length in results:
+            cur = self.conn.execute("INSERT INTO docs (path, size, mtime_ns, length) VALUES (?, ?, ?, ?)",
+                                    (path, st.st_size, st.st_mtime_ns, length))
+            doc_id = cur.lastrowid
+            for term, tf in counts.items():
+                postings.setdefault(term, ([], []))
+                postings[term][0].append(doc_id)
+                postings[term][1].append(tf)
+        self.conn.executemany(
+            "INSERT INTO postings VALUES (?, ?, ?, ?)",
+            ((term, segment, len(ids), _encode(np.array(ids, dtype=np.int64), np.array(tfs)))
+             for term, (ids, tfs) in postings.items()))
+        self._set_meta("next_segment", segment + 1)
+        self.conn.commit()
+        self._stats = None
+
+    def update(self, folder: str, recursive: bool = True, workers: int = DEFAULT_WORKERS,
+               batch_size: int = BATCH_SIZE) -> dict:
+        """
+        Bring the index up to date for folder: only new or modified files are read.
+
+        Returns:
+            dict: counts of "added", "updated", "unchanged", "removed" and "failed" files.
+        """
+        folder = os.path.abspath(folder)
+        prefix = folder.rstrip(os.sep) + os.sep
+        known = {path: (doc_id, size, mtime_ns) for doc_id, path, size, mtime_ns in self.conn.execute(
+            "SELECT id, path, size, mtime_ns FROM docs WHERE substr(path, 1, ?) = ?", (len(prefix), prefix))}
+        if not recursive:
+            known = {p: v for p, v in known.items() if os.sep not in p[len(prefix):]}
+
+        stats = dict(added=0, updated=0, unchanged=0, removed=0, failed=0)
+        todo, stale, reindexed = {}, [], set()
+        for path, st in iter_files(folder, recursive):
+            if os.path.splitext(path)[1].lower() not in INDEXED_EXTENSIONS:
+                continue
+            previous = known.pop(path, None)
+            if previous and (previous[1], previous[2]) == (st.st_size, st.st_mtime_ns):
+                stats["unchanged"] += 1
+                continue
+            if previous:
+                stale.append(previous[0])
+                reindexed.add(path)
+            todo[path] = st
+            stats["updated" if previous else "added"] += 1
+        stale.extend(doc_id for doc_id, _, _ in known.values())
+        stats["removed"] = len(known)
+        if stale:
+            self.conn.executemany("DELETE FROM docs WHERE id = ?", ((i,) for i in stale))
+            self._set_meta("dead", self._meta("dead", 0) + len(stale))
+            self._stats = None
+
+        batch = []
+        for path, counts, length in self._analyze_all(list(todo), workers):
+            if counts is None:
+                stats["failed"] += 1
+                stats["updated" if path in reindexed else "added"] -= 1
+                continue
+            batch.append((path, todo[path], counts, length))
+            if len(batch) >= batch_size:
+                self._write_batch(batch)
+                batch = []
+        if batch:
+            self._write_batch(batch)
+        self.conn.commit()
+
+        live = len(self)
+        if self._meta("dead", 0) > 0.2 * max(live, 1) or self._meta("next_segment", 0) - self._meta("optimized_at", 0) > 32:
+            self.optimize()
+        return stats
+
+    def _analyze_all(self, paths, workers):
+        jobs = [(p, self.stem) for p in paths]
+        if workers <= 1 or len(jobs) <= 1:
+            yield from map(_analyze_file, jobs)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for job in jobs:
+                pending.append(pool.submit(_analyze_file, job))
+                if len(pending) >= 4 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def optimize(self) -> None:
+        """Merge each term's segments into one and drop postings of removed documents."""
+        live = np.array([r[0] for r in self.conn.execute("SELECT id FROM docs")], dtype=np.int64)
+        alive = np.zeros(int(live.max()) + 1 if len(live) else 1, dtype=bool)
+        alive[live] = True
+        segment = self._meta("next_segment", 0)
+        terms = [r[0] for r in self.conn.execute("SELECT DISTINCT term FROM postings")]
+        for term in terms:
+            ids, tfs = self._postings(term, alive)
+            self.conn.execute("DELETE FROM postings WHERE term = ?", (term,))
+            if len(ids):
+                self.conn.execute("INSERT INTO postings VALUES (?, ?, ?, ?)",
+                                  (term, segment, len(ids), _encode(ids, tfs)))
+        self._set_meta("next_segment", segment + 1)
+        self._set_meta("optimized_at", segment + 1)
+        self._set_meta("dead", 0)
+        self.conn.commit()
+
+    # -----------------------------
+    # Searching
+    # -----------------------------
+    def _doc_stats(self):
+        """
+        (lengths by doc id, alive mask, number of docs, average length), loaded
+        once and kept until this index writes documents or another connection
+        commits (PRAGMA data_version).
+        """
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if self._stats is None or version != self._stats_version:
+            rows = self.conn.execute("SELECT id, length FROM docs").fetchall()
+            if not rows:
+                self._stats = (np.zeros(1), np.zeros(1, dtype=bool), 0, 0.0)
+            else:
+                doc_ids = np.array([r[0] for r in rows], dtype=np.int64)
+                lengths = np.zeros(int(doc_ids.max()) + 1)
+                lengths[doc_ids] = [r[1] for r in rows]
+                alive = np.zeros(len(lengths), dtype=bool)
+                alive[doc_ids] = True
+                self._stats = (lengths, alive, len(doc_ids), max(float(np.mean(lengths[doc_ids])), 1e-9))
+            self._stats_version = version
+        return self._stats
+
+    def _postings(self, term: str, alive: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        parts = [_decode(n, data) for n, data in self.conn.execute(
+            "SELECT n, data FROM postings WHERE term = ? ORDER BY segment", (term,))]
+        if not parts:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        ids = np.concatenate([p[0] for p in parts])
+        tfs = np.concatenate([p[1] for p in parts])
+        keep = alive[np.minimum(ids, len(alive) - 1)] & (ids < len(alive))
+        return ids[keep], tfs[keep]
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """Rank indexed files for query with BM25; returns (path, score) pairs, best first."""
+        terms = list(dict.fromkeys(analyze(query, self.stem)))
+        lengths, alive, n_docs, avgdl = self._doc_stats()
+        if not terms or not n_docs:
+            return []
+
+        scores = np.zeros(len(lengths))
+        for term in terms:
+            ids, tfs = self._postings(term, alive)
+            if not len(ids):
+                continue
+            idf = np.log(1 + (n_docs - len(ids) + 0.5) / (len(ids) + 0.5))
+            norm = K1 * (1 - B + B * lengths[ids] / avgdl)
+            np.add.at(scores, ids, idf * tfs * (K1 + 1) / (tfs + norm))
+
+        hits = np.flatnonzero(scores)
+        if len(hits) > limit:
+            hits = hits[np.argpartition(-scores[hits], limit - 1)[:limit]]
+        hits = hits[np.argsort(-scores[hits], kind="stable")]
+        paths = dict(self.conn.execute(
+            f"SELECT id, path FROM docs WHERE id IN ({','.join('?' * len(hits))})", [int(i) for i in hits]))
+        return [(paths[int(i)], float(scores[i])) for i in hits]
+
+
+def index_folder(folder: str, db_path: str = DEFAULT_DB, recursive: bool = True,
+                 workers: int = DEFAULT_WORKERS, stem: bool = True) -> dict:
+    """Create or incrementally update the index in db_path for folder; returns update counts."""
+    with TextIndex(db_path, stem=stem) as index:
+        return index.update(folder, recursive=recursive, workers=workers)
+
+
+def search(query: str, db_path: str = DEFAULT_DB, limit: int = 10) -> Tuple[List[Tuple[str, float]], float]:
+    """Search the index in db_path; returns (results, seconds taken)."""
+    with TextIndex(db_path) as index:
+        if index.stem:
+            _util.stem_cache  # load the stemmer (one-off NLTK import) outside the timed query
+        start = time.perf_counter()
+        results = index.search(query, limit)
+        return results, time.perf_counter() - start
@@ -2,15 +2,13 @@
 
 import os
 import re
+import json
 import string
-from typing import List, Union
-from collections import Counter
-
-import nltk
-from nltk.corpus import stopwords
-from nltk.stem import PorterStemmer
-from nltk.tokenize import word_tokenize, sent_tokenize
-from sklearn.feature_extraction.text import TfidfVectorizer
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 
 # Optional imports for reading files
 try:
@@ -23,53 +21,543 @@ try:
 except ImportError:
     PyPDF2 = None
 
-# Download NLTK resources if not already present
-nltk.download('punkt', quiet=True)
-nltk.download('stopwords', quiet=True)
+# -----------------------------
+# NLTK resources (lazy, offline)
+# -----------------------------
+# nltk is imported and its data loaded on first use only, from local data
+# directories; nothing is ever downloaded implicitly. Point ROSDL_NLTK_DATA
+# (os.pathsep-separated) or configure_nltk() at a directory prepared with
+# download_nltk_resources() on a machine with network access.
+NLTK_DATA_ENV = "ROSDL_NLTK_DATA"
+NLTK_RESOURCES = ("punkt", "punkt_tab", "stopwords")
+
+_nltk_data_dirs: List[str] = []
+
+
+def _data_dirs() -> List[str]:
+    return _nltk_data_dirs or [d for d in os.environ.get(NLTK_DATA_ENV, "").split(os.pathsep) if d]
+
+
+def _nltk():
+    """Import nltk on first use and put the configured data directories first on its search path."""
+    try:
+        import nltk
+    except ImportError:
+        raise ImportError("nltk is not installed. Install it with: pip install nltk")
+    for d in reversed(_data_dirs()):
+        if d not in nltk.data.path:
+            nltk.data.path.insert(0, d)
+    return nltk
+
+
+def configure_nltk(data_dir: Union[str, os.PathLike, List[str], None] = None) -> None:
+    """
+    Set the local directories NLTK data is loaded from (overrides ROSDL_NLTK_DATA).
+
+    Cached stopword lists are dropped so the next use reloads them from the new location.
+    """
+    dirs = [data_dir] if isinstance(data_dir, (str, os.PathLike)) else list(data_dir or [])
+    _nltk_data_dirs[:] = [os.path.abspath(d) for d in dirs]
+    get_stopwords.cache_clear()
+
+
+def download_nltk_resources(data_dir: str = None, resources=NLTK_RESOURCES) -> str:
+    """
+    Explicitly download NLTK resources (needs network access) into data_dir.
+
+    Returns:
+        str: The directory the resources were stored in.
+    """
+    nltk = _nltk()
+    data_dir = data_dir or next(iter(_data_dirs()), None) or nltk.downloader.Downloader().default_download_dir()
+    data_dir = os.path.abspath(data_dir)
+    os.makedirs(data_dir, exist_ok=True)
+    for name in resources:
+        if not nltk.download(name, download_dir=data_dir, quiet=True, raise_on_error=True):
+            raise RuntimeError(f"Could not download NLTK resource '{name}'")
+    return data_dir
+
+
+def _missing_resource(name: str, err: Exception) -> LookupError:
+    return LookupError(
+        f"NLTK resource '{name}' was not found locally. Download it once with "
+        f"`rosdl text download-nltk --dir <folder>` and point {NLTK_DATA_ENV} at that folder.\n{err}"
+    )
+
+
+@lru_cache(maxsize=None)
+def get_stopwords(language: str = 'english') -> frozenset:
+    """Stopword set for language, loaded once per process and shared by all TextUtilities."""
+    nltk = _nltk()
+    try:
+        pointer = nltk.data.find(f"corpora/stopwords/{language}")
+    except LookupError as err:
+        raise _missing_resource("stopwords", err) from None
+    with pointer.open() as f:
+        return frozenset(f.read().decode("utf-8").split())
+
+
+STEMMERS = ('porter', 'snowball', 'lancaster')
+DEFAULT_STEM_CACHE_SIZE = 200_000
+
+
+@lru_cache(maxsize=None)
+def get_stemmer(backend: str = 'porter', language: str = 'english'):
+    """Process-wide NLTK stemmer for backend (none of them needs data files)."""
+    _nltk()
+    from nltk.stem import PorterStemmer, SnowballStemmer, LancasterStemmer
+    if backend == 'porter':
+        return PorterStemmer()
+    if backend == 'snowball':
+        return SnowballStemmer(language)
+    if backend == 'lancaster':
+        return LancasterStemmer()
+    raise ValueError(f"Unknown stemmer '{backend}'. Choose from: {', '.join(STEMMERS)}")
+
+
+class StemCache:
+    """
+    Bounded LRU cache in front of a stemmer, so each vocabulary item is stemmed once.
+
+    stem_many() dedupes its input before stemming, which makes the cost scale
+    with vocabulary size instead of token count. With `path`, the cache is
+    loaded from and saved to a JSON file (keyed by backend and language) so it
+    survives across runs.
+    """
+
+    def __init__(self, backend: str = 'porter', language: str = 'english',
+                 maxsize: int = DEFAULT_STEM_CACHE_SIZE, path: str = None):
+        self.backend = backend
+        self.language = language
+        self.maxsize = maxsize
+        self.path = path
+        self.stemmer = get_stemmer(backend, language)
+        self._cache = OrderedDict()
+        self.hits = self.misses = 0
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def stem(self, word: str) -> str:
+        return self.stem_many([word])[0]
+
+    def stem_many(self, words: Iterable[str]) -> List[str]:
+        """Stem words (in order), stemming each distinct word at most once."""
+        words = list(words)
+        cache = self._cache
+        mapping = {}
+        for w in dict.fromkeys(words):
+            stem = cache.get(w)
+            if stem is None:
+                stem = cache[w] = self.stemmer.stem(w)
+                self.misses += 1
+            else:
+                cache.move_to_end(w)
+                self.hits += 1
+            mapping[w] = stem
+        while len(cache) > self.maxsize:
+            cache.popitem(last=False)
+        return [mapping[w] for w in words]
+
+    def load(self, path: str = None) -> None:
+        with open(path or self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if (data.get('backend'), data.get('language')) == (self.backend, self.language):
+            self._cache.update(data.get('stems', {}))
+
+    def save(self, path: str = None) -> str:
+        """Write the cache (most recently used last) to path; returns the path."""
+        path = path or self.path
+        if not path:
+            raise ValueError("No path given for the stem cache")
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'backend': self.backend, 'language': self.language, 'stems': self._cache},
+                      f, ensure_ascii=False)
+        os.replace(tmp, path)
+        return path
+
+
+@lru_cache(maxsize=None)
+def get_stem_cache(backend: str = 'porter', language: str = 'english') -> StemCache:
+    """Process-wide in-memory StemCache, shared by all TextUtilities using that backend."""
+    return StemCache(backend, language)
+
+
+def word_tokenize(text: str, language: str = 'english') -> List[str]:
+    nltk = _nltk()
+    try:
+        return nltk.word_tokenize(text, language)
+    except LookupError as err:
+        raise _missing_resource("punkt_tab", err) from None
+
+
+def sent_tokenize(text: str, language: str = 'english') -> List[str]:
+    nltk = _nltk()
+    try:
+        return nltk.sent_tokenize(text, language)
+    except LookupError as err:
+        raise _missing_resource("punkt_tab", err) from None
+
+
+# -----------------------------
+# Tokenizer backends
+# -----------------------------
+class RegexTokenizer:
+    """
+    Fast tokenizer built on precompiled regexes; needs no data files.
+
+    Follows NLTK's Treebank conventions for the common cases (contractions
+    split as "do" + "n't", clitics as "'s", punctuation as separate tokens,
+    decimals and thousands kept whole) at a fraction of the cost.
+    """
+
+    name = 'regex'
+    _WORD_RE = re.compile(
+        r"(?:mrs?|ms|dr|prof|st|sr|jr|vs|etc)\.(?=\s+\w)"  # Mr. Smith
+        r"|(?:[a-z]\.){2,}"                                 # U.S. e.g.
+        r"|\d+(?:[.,]\d+)+"                                 # 3.14, 1,000
+        r"|\w+(?=n't\b)|n't\b"                             # do n't
+        r"|\w+(?='(?:s|m|d|ll|re|ve)\b)|'(?:s|m|d|ll|re|ve)\b"  # it 's
+        r"|\w+(?:[-'.]\w+)*"                                # words, hyphenated words
+        r"|\.\.\.|--|[^\w\s]",
+        re.IGNORECASE,
+    )
+    # sentence ends at . ! ? (plus closing quotes/brackets) followed by space and an upper-case/digit start
+    _SENT_END_RE = re.compile(r"""[.!?]+["')\]]*\s+(?=["'(\[]?[A-Z0-9])""")
+    _ABBREVIATIONS = frozenset(
+        "mr mrs ms dr prof sr jr st vs etc e.g i.e inc ltd co corp fig no jan feb mar apr jun jul aug sep "
+        "sept oct nov dec u.s".split()
+    )
+
+    def __init__(self, language: str = 'english'):
+        self.language = language
+
+    def tokenize(self, text: str) -> List[str]:
+        return self._WORD_RE.findall(text)
+
+    def sent_tokenize(self, text: str) -> List[str]:
+        sentences, start = [], 0
+        for m in self._SENT_END_RE.finditer(text):
+            last_word = text[start:m.start()].rsplit(None, 1)[-1:] or ['']
+            if text[m.start()] == '.' and last_word[0].lower().lstrip('("\'') in self._ABBREVIATIONS:
+                continue
+            sentences.append(text[start:m.end()].strip())
+            start = m.end()
+        tail = text[start:].strip()
+        if tail:
+            sentences.append(tail)
+        return sentences
+
+
+class NltkTokenizer:
+    """NLTK's Treebank word tokenizer and Punkt sentence splitter (needs the punkt data)."""
+
+    name = 'nltk'
+
+    def __init__(self, language: str = 'english'):
+        self.language = language
+
+    def tokenize(self, text: str) -> List[str]:
+        return word_tokenize(text, self.language)
+
+    def sent_tokenize(self, text: str) -> List[str]:
+        return sent_tokenize(text, self.language)
+
+
+TOKENIZERS = {'regex': RegexTokenizer, 'nltk': NltkTokenizer}
+DEFAULT_TOKENIZER = 'regex'
+
+
+def get_tokenizer(backend=DEFAULT_TOKENIZER, language: str = 'english'):
+    """Return a tokenizer instance for a backend name, or backend itself if it already is one."""
+    if not isinstance(backend, str):
+        return backend
+    try:
+        return TOKENIZERS[backend](language)
+    except KeyError:
+        raise ValueError(f"Unknown tokenizer '{backend}'. Choose from: {', '.join(TOKENIZERS)}") from None
+
+
+def _agreement(tokens: List[str], reference: List[str]) -> float:
+    """Share of tokens both tokenizers produce (multiset overlap over the longer token list)."""
+    longest = max(len(tokens), len(reference))
+    return sum((Counter(tokens) & Counter(reference)).values()) / longest if longest else 1.0
+
+
+def benchmark_tokenizers(texts: Iterable[str], backends=tuple(TOKENIZERS), reference: str = 'nltk',
+                         language: str = 'english') -> dict:
+    """
+    Time tokenizer backends on a corpus and measure agreement with a reference backend.
+
+    Returns:
+        dict: per backend {"tokens", "sentences", "seconds", "tokens_per_sec",
+        "token_agreement", "sentence_agreement"}. Agreement is averaged over
+        documents (1.0 = identical output) and None when the reference
+        backend is unavailable (e.g. NLTK data missing); a backend that cannot
+        run reports {"error": ...} instead.
+    """
+    import time
+    texts = list(texts)
+    results, outputs = {}, {}
+    for name in dict.fromkeys(list(backends) + [reference]):
+        tok = get_tokenizer(name, language)
+        try:
+            start = time.perf_counter()
+            words = [tok.tokenize(t) for t in texts]
+            sents = [tok.sent_tokenize(t) for t in texts]
+            seconds = time.perf_counter() - start
+        except (LookupError, ImportError) as err:
+            results[name] = {"error": str(err).splitlines()[0]}
+            continue
+        outputs[name] = (words, sents)
+        count = sum(map(len, words))
+        results[name] = {"tokens": count, "sentences": sum(map(len, sents)), "seconds": seconds,
+                         "tokens_per_sec": count / seconds if seconds else float('inf')}
+
+    ref = outputs.get(reference)
+    for name, (words, sents) in outputs.items():
+        if ref is None:
+            results[name].update(token_agreement=None, sentence_agreement=None)
+            continue
+        n = len(texts) or 1
+        results[name]["token_agreement"] = sum(map(_agreement, words, ref[0])) / n
+        results[name]["sentence_agreement"] = sum(a == b for a, b in zip(sents, ref[1])) / n
+    return {name: results[name] for name in backends if name in results}
+
+
+# -----------------------------
+# Cleaning tables (built once per process)
+# -----------------------------
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+_DIGITS_RE = re.compile(r'\d+')
+_SPACE_RE = re.compile(r'\s+')
+
+DEFAULT_CHUNKSIZE = 64
+
+
+def _clean(text: str, stop_words=None) -> str:
+    text = _SPACE_RE.sub(' ', _DIGITS_RE.sub('', text.lower().translate(_PUNCT_TABLE))).strip()
+    if stop_words:
+        # words are the whitespace-separated pieces; see TextUtilities.clean_text for how this differs
+        # from word_tokenize
+        text = ' '.join(w for w in text.split(' ') if w not in stop_words)
+    return text
+
+
+def _init_clean_worker(data_dirs: List[str]) -> None:
+    if data_dirs:
+        configure_nltk(data_dirs)
+
+
+def _clean_chunk(docs: List[str], language: str, remove_stopwords: bool) -> List[str]:
+    stop_words = get_stopwords(language) if remove_stopwords else None
+    return [_clean(d, stop_words) for d in docs]
+
+
+# -----------------------------
+# Streaming text statistics
+# -----------------------------
+DEFAULT_TEXT_CHUNK = 1 << 20  # characters read per chunk
+DEFAULT_TOP_CAPACITY = 1000
+
+
+class TextStats:
+    """
+    Mergeable running statistics over a text stream.
+
+    Word frequencies go through a Space-Saving sketch of `top_capacity`
+    entries: memory stays bounded, but once more distinct words than that
+    have been seen, top_words are estimates (counts may be overstated, and a
+    word near the cut-off may be swapped for another). top_capacity=None
+    keeps exact counts in a Counter instead. Unique words are counted exactly
+    with a set, or estimated with a HyperLogLog when unique="hll", which keeps
+    memory constant. Stats built by separate workers combine with merge().
+    """
+
+    def __init__(self, top_capacity: Optional[int] = DEFAULT_TOP_CAPACITY, unique: str = 'exact'):
+        from rosdl.sketches import SpaceSaving, HyperLogLog
+        if unique not in ('exact', 'hll'):
+            raise ValueError("unique must be 'exact' or 'hll'")
+        self.unique = unique
+        self.characters = self.words = self.sentences = 0
+        self.top = Counter() if top_capacity is None else SpaceSaving(top_capacity)
+        self.vocabulary = set() if unique == 'exact' else HyperLogLog()
+
+    def add(self, words: List[str], sentences: int = 0) -> None:
+        counts = Counter(words)
+        self.words += len(words)
+        self.sentences += sentences
+        if isinstance(self.top, Counter):
+            self.top.update(counts)
+        else:
+            self.top.update_counts(counts)
+        self.vocabulary.update(counts.keys())
+
+    def merge(self, other: "TextStats") -> "TextStats":
+        if other.unique != self.unique:
+            raise ValueError("Cannot merge exact and HyperLogLog unique counts")
+        if isinstance(self.top, Counter) != isinstance(other.top, Counter):
+            raise ValueError("Cannot merge exact and sketched word counts")
+        self.characters += other.characters
+        self.words += other.words
+        self.sentences += other.sentences
+        if isinstance(self.top, Counter):
+            self.top.update(other.top)
+        else:
+            self.top.merge(other.top)
+        if self.unique == 'exact':
+            self.vocabulary |= other.vocabulary
+        else:
+            self.vocabulary.merge(other.vocabulary)
+        return self
+
+    def result(self, top_n: int = 10) -> dict:
+        """Statistics in the same shape as TextUtilities.get_text_info."""
+        return {
+            "characters": self.characters,
+            "words": self.words,
+            "unique_words": len(self.vocabulary),
+            "sentences": self.sentences,
+            "top_words": self.top.most_common(top_n) if isinstance(self.top, Counter) else self.top.top(top_n),
+        }
+
+
+def iter_chunks(filepath: str, chunk_size: int = DEFAULT_TEXT_CHUNK) -> Iterator[str]:
+    """Read a text file incrementally, chunk_size characters at a time."""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for chunk in iter(lambda: f.read(chunk_size), ''):
+            yield chunk
+
+
+def _file_stats(args) -> TextStats:
+    path, language, tokenizer, kwargs = args
+    return TextUtilities(language, tokenizer=tokenizer).text_stats(iter_chunks(path), **kwargs)
+
+
+def text_stats_many(paths: Iterable[str], workers: int = None, language: str = 'english',
+                    tokenizer: str = DEFAULT_TOKENIZER, **kwargs) -> TextStats:
+    """Compute TextStats for many text files across a process pool and merge them."""
+    jobs = [(p, language, tokenizer, kwargs) for p in paths]
+    total = TextStats(kwargs.get('top_capacity', DEFAULT_TOP_CAPACITY), kwargs.get('unique', 'exact'))
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for stats in map(_file_stats, jobs):
+            total.merge(stats)
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for stats in pool.map(_file_stats, jobs):
+            total.merge(stats)
+    return total
 
 
 class TextUtilities:
     """Utility class for text cleaning, tokenization, stemming, keyword extraction, and text analysis."""
 
-    def __init__(self, language: str = 'english'):
-        self.stop_words = set(stopwords.words(language))
-        self.stemmer = PorterStemmer()
+    def __init__(self, language: str = 'english', tokenizer=DEFAULT_TOKENIZER, stemmer='porter'):
+        self.language = language
+        self.tokenizer = get_tokenizer(tokenizer, language)
+        # a backend name uses the shared per-process cache; pass a StemCache for a private/persistent one
+        self._stemmer = stemmer
+
+    @property
+    def stop_words(self) -> frozenset:
+        return get_stopwords(self.language)
+
+    @property
+    def stemmer(self):
+        return self.stem_cache.stemmer
+
+    @property
+    def stem_cache(self) -> StemCache:
+        if isinstance(self._stemmer, StemCache):
+            return self._stemmer
+        return get_stem_cache(self._stemmer, self.language)
 
     # -----------------------------
     # Text Processing Methods
     # -----------------------------
-    def clean_text(self, text: str, remove_stopwords: bool = True) -> str:
-        """Clean text: lowercase, remove punctuation, numbers, extra spaces, optionally remove stopwords."""
-        text = text.lower()
-        text = text.translate(str.maketrans('', '', string.punctuation))
-        text = re.sub(r'\d+', '', text)
-        text = re.sub(r'\s+', ' ', text).strip()
+    def clean_text(self, text: Union[str, Iterable[str]], remove_stopwords: bool = True) -> Union[str, Iterator[str]]:
+        """
+        Clean text: lowercase, remove punctuation, numbers, extra spaces, optionally remove stopwords.
+
+        Stopwords are matched against the whitespace-separated words left after
+        ASCII punctuation and digits are stripped. Earlier versions used
+        word_tokenize here, which differs in two ways: Treebank splits such as
+        "cannot" -> "can" "not" or "gonna" -> "gon" "na" are no longer made, so
+        "cannot" stays one (non-stopword) word; and non-ASCII punctuation
+        (curly quotes, em dashes) stays attached to its word, so "“the”" is not
+        removed as a stopword.
+
+        Given an iterable of pieces (e.g. from iter_text), returns an iterator of cleaned pieces.
+        """
+        stop_words = self.stop_words if remove_stopwords else None
+        if isinstance(text, str):
+            return _clean(text, stop_words)
+        return (_clean(piece, stop_words) for piece in text)
+
+    def clean_batch(self, documents: Iterable[str], remove_stopwords: bool = True, workers: int = None,
+                    chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[str]:
+        """
+        Clean many documents across a process pool, yielding results in input order.
 
+        Documents are sent to the workers in chunks of `chunksize`, and at most
+        two chunks per worker are in flight, so arbitrarily large iterables
+        stream through in bounded memory. workers=1 cleans in this process.
+        """
+        workers = workers or os.cpu_count() or 1
         if remove_stopwords:
-            words = word_tokenize(text)
-            words = [w for w in words if w not in self.stop_words]
-            text = ' '.join(words)
+            self.stop_words  # fail fast here rather than in every worker
+        documents = iter(documents)
+        chunks = iter(lambda: list(islice(documents, chunksize)), [])
+        if workers <= 1:
+            for chunk in chunks:
+                yield from _clean_chunk(chunk, self.language, remove_stopwords)
+            return
 
-        return text
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_clean_worker,
+                                 initargs=(_data_dirs(),)) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_clean_chunk, chunk, self.language, remove_stopwords))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
 
-    def tokenize(self, text: str) -> List[str]:
-        """Tokenize cleaned text into words."""
-        return word_tokenize(text)
+    def tokenize(self, text: Union[str, Iterable[str]]) -> Union[List[str], Iterator[str]]:
+        """Tokenize cleaned text into words; an iterable of pieces gives a lazy token stream."""
+        if isinstance(text, str):
+            return self.tokenizer.tokenize(text)
+        return (token for piece in text for token in self.tokenizer.tokenize(piece))
+
+    def stem_words(self, words: Iterable[str], batch_size: int = 100_000) -> Union[List[str], Iterator[str]]:
+        """
+        Stem a list of words (each distinct word is stemmed once, through the stem cache).
 
-    def stem_words(self, words: List[str]) -> List[str]:
-        """Stem a list of words."""
-        return [self.stemmer.stem(word) for word in words]
+        Any other iterable (e.g. a token stream) is stemmed lazily in batches of batch_size.
+        """
+        if isinstance(words, (list, tuple)):
+            return self.stem_cache.stem_many(words)
+        words = iter(words)
+        batches = iter(lambda: list(islice(words, batch_size)), [])
+        return (stem for batch in batches for stem in self.stem_cache.stem_many(batch))
 
-    def extract_keywords(self, documents: List[str], top_k: int = 10) -> List[str]:
-        """Extract top keywords using TF-IDF from a list of documents."""
+    def extract_keywords(self, documents: Iterable[str], top_k: int = 10) -> List[str]:
+        """Extract top keywords using TF-IDF from documents (any iterable, e.g. iter_text pages)."""
+        from sklearn.feature_extraction.text import TfidfVectorizer
         vectorizer = TfidfVectorizer(stop_words='english', max_features=top_k)
         X = vectorizer.fit_transform(documents)
         return vectorizer.get_feature_names_out().tolist()
 
-    def get_text_info(self, text: str) -> dict:
-        """Return basic statistics about the text."""
-        words = word_tokenize(text)
-        sentences = sent_tokenize(text)
+    def get_text_info(self, text: Union[str, Iterable[str]]) -> dict:
+        """Return basic statistics about the text (pieces from an iterable are streamed)."""
+        if not isinstance(text, str):
+            return self.stream_text_info(text)
+        words = self.tokenizer.tokenize(text)
+        sentences = self.tokenizer.sent_tokenize(text)
         word_count = len(words)
         unique_words = len(set(words))
         char_count = len(text)
@@ -83,6 +571,47 @@ class TextUtilities:
             "top_words": freq_words
         }
 
+    def text_stats(self, pieces: Iterable[str], top_capacity: Optional[int] = DEFAULT_TOP_CAPACITY,
+                   unique: str = 'exact', max_carry: int = DEFAULT_TEXT_CHUNK) -> TextStats:
+        """
+        Accumulate TextStats over text arriving in arbitrary pieces (e.g. file chunks).
+
+        Only complete sentences are tokenized; the trailing, possibly cut-off
+        sentence of each piece is carried into the next one, so words and
+        sentences split across chunk boundaries are counted once. A carry
+        longer than max_carry (text with no sentence breaks) is flushed up to
+        its last whitespace, so memory stays bounded.
+
+        Counts, sentences and (with unique="exact") unique words match
+        get_text_info for any chunk size; top_words match it exactly only with
+        top_capacity=None, or while the text has at most top_capacity distinct
+        words (see TextStats).
+        """
+        stats = TextStats(top_capacity, unique)
+        carry = ''
+        for piece in pieces:
+            stats.characters += len(piece)
+            buf = carry + piece
+            sentences = self.tokenizer.sent_tokenize(buf)
+            if len(sentences) > 1:
+                cut = buf.rfind(sentences[-1])
+                stats.add(self.tokenizer.tokenize(buf[:cut]), len(sentences) - 1)
+                carry = buf[cut:]
+            else:
+                carry = buf
+            if len(carry) > max_carry:
+                cut = max(carry.rfind(' '), carry.rfind('\n'))
+                if cut > 0:
+                    stats.add(self.tokenizer.tokenize(carry[:cut]))
+                    carry = carry[cut:]
+        if carry.strip():
+            stats.add(self.tokenizer.tokenize(carry), len(self.tokenizer.sent_tokenize(carry)))
+        return stats
+
+    def stream_text_info(self, pieces: Iterable[str], top_n: int = 10, **kwargs) -> dict:
+        """get_text_info for text that does not fit in memory; see text_stats for the options."""
+        return self.text_stats(pieces, **kwargs).result(top_n)
+
 # -----------------------------
 # File Reading Helpers
 # -----------------------------
@@ -112,6 +641,29 @@ def read_pdf_file(filepath: str) -> str:
     return '\n'.join(text)
 
 
+def iter_documents(source: Union[str, os.PathLike], field: str = 'text') -> Iterator[Tuple[object, str]]:
+    """
+    Yield (id, text) pairs from a folder of .txt/.docx/.pdf files or a JSONL file.
+
+    JSONL records use `field` for the text and "id" (or the line number) as id;
+    folder documents use their file path.
+    """
+    source = os.fspath(source)
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if os.path.splitext(name)[1].lower() in ('.txt', '.docx', '.pdf'):
+                    path = os.path.join(root, name)
+                    yield path, load_text(path)
+        return
+    with open(source, 'r', encoding='utf-8') as f:
+        for lineno, line in enumerate(f, 1):
+            if line.strip():
+                record = json.loads(line)
+                yield record.get('id', lineno), record.get(field) or ''
+
+
 # -----------------------------
 # Unified Text Loader
 # -----------------------------
@@ -140,3 +692,133 @@ def load_text(source: Union[str, os.PathLike], file_type: str = None) -> str:
         return source
     else:
         raise ValueError("Source must be a string or file path.")
+
+
+# -----------------------------
+# Streaming Text Loader
+# -----------------------------
+TEXT_UNITS = ('line', 'paragraph', 'page', 'chunk')
+_PARAGRAPH_BREAK_RE = re.compile(r'\n[ \t]*\n\s*')
+
+
+def _paragraphs(lines: Iterable[str]) -> Iterator[str]:
+    """Group lines into blank-line (or form-feed) separated paragraphs."""
+    block = []
+    for line in lines:
+        for i, part in enumerate(line.split('\f')):
+            if i or not part.strip():
+                if block:
+                    yield '\n'.join(block)
+                block = []
+            if part.strip():
+                block.append(part.rstrip('\r\n'))
+    if block:
+        yield '\n'.join(block)
+
+
+def _whole_words(pieces: Iterable[str], chunk_size: int) -> Iterator[str]:
+    """Re-cut text pieces into ~chunk_size chunks that end on whitespace, so no word is split."""
+    carry = ''
+    for piece in pieces:
+        carry += piece
+        while len(carry) >= chunk_size:
+            cut = max(carry.rfind(' ', 0, chunk_size), carry.rfind('\n', 0, chunk_size))
+            if cut < 0:
+                m = _SPACE_RE.search(carry, chunk_size)
+                if m:
+                    cut = m.start()
+                elif len(carry) < 4 * chunk_size:
+                    break  # wait for the end of this very long word
+                else:
+                    cut = chunk_size - 1  # no whitespace at all: split rather than grow without bound
+            yield carry[:cut + 1]
+            carry = carry[cut + 1:]
+    if carry:
+        yield carry
+
+
+def _iter_txt(path: str, unit: str, chunk_size: int) -> Iterator[str]:
+    with open(path, 'r', encoding='utf-8') as f:
+        if unit == 'line':
+            yield from (line.rstrip('\r\n') for line in f)
+        elif unit == 'paragraph':
+            yield from _paragraphs(f)
+        elif unit == 'page':  # form feeds separate pages in plain-text exports
+            yield from (page.strip('\n') for page in _split_stream(iter(lambda: f.read(chunk_size), ''), '\f'))
+        else:
+            yield from _whole_words(iter(lambda: f.read(chunk_size), ''), chunk_size)
+
+
+def _split_stream(pieces: Iterable[str], sep: str) -> Iterator[str]:
+    carry = ''
+    for piece in pieces:
+        parts = (carry + piece).split(sep)
+        carry = parts.pop()
+        yield from parts
+    yield carry
+
+
+def _iter_pages(path: str, ext: str) -> Iterator[str]:
+    if ext == 'pdf':
+        if not PyPDF2:
+            raise ImportError("PyPDF2 is not installed. Install it with: pip install PyPDF2")
+        with open(path, 'rb') as f:
+            for page in PyPDF2.PdfReader(f).pages:
+                yield page.extract_text() or ''
+    else:
+        if not docx:
+            raise ImportError("python-docx is not installed. Install it with: pip install python-docx")
+        for para in docx.Document(path).paragraphs:
+            yield para.text
+
+
+def iter_text(source: Union[str, os.PathLike], unit: str = 'paragraph', file_type: str = None,
+              chunk_size: int = DEFAULT_TEXT_CHUNK) -> Iterator[str]:
+    """
+    Lazily yield text from a string or .txt/.docx/.pdf file, one unit at a time.
+
+    Units:
+        line: one line of text.
+        paragraph: blank-line separated blocks (docx paragraphs).
+        page: PDF pages; form-feed separated pages in .txt; docx has no
+            stored pages, so its paragraphs are yielded.
+        chunk: about chunk_size characters, always ending on whitespace.
+
+    Plain-text files are read through a bounded buffer and PDF pages are
+    extracted one at a time, so output starts immediately and the whole file
+    never has to be in memory.
+    """
+    if unit not in TEXT_UNITS:
+        raise ValueError(f"unit must be one of {', '.join(TEXT_UNITS)}")
+    path = os.fspath(source) if isinstance(source, os.PathLike) else source
+    if not isinstance(path, str):
+        raise ValueError("Source must be a string or file path.")
+    if not os.path.isfile(path):
+        pieces = [path]
+    else:
+        ext = (file_type or os.path.splitext(path)[1][1:]).lower()
+        if ext == 'txt':
+            yield from _iter_txt(path, unit, chunk_size)
+            return
+        if ext not in ('docx', 'pdf'):
+            raise ValueError(f"Unsupported file type: {ext}")
+        pieces = _iter_pages(path, ext)
+        if unit == 'page' or (unit == 'paragraph' and ext == 'docx'):
+            yield from pieces
+            return
+        if ext == 'docx':
+            pieces = (p + '\n\n' for p in pieces)
+        else:
+            pieces = (p + '\n' for p in pieces)  # as load_text joins pages; keeps page-end words apart
+
+    if unit == 'line':
+        for piece in pieces:
+            yield from piece.splitlines()
+    elif unit == 'paragraph':
+        for piece in pieces:
+            yield from (p for p in _PARAGRAPH_BREAK_RE.split(piece.strip()) if p)
+    elif unit == 'page':
+        for piece in pieces:
+            yield from piece.split('\f')
+    else:
+        yield from _whole_words(pieces, chunk_size)
@@ -0,0 +1,193 @@
+# tests/test_eda_drift.py
+"""
+Unit tests for rosdl.eda_drift_module.
+"""
+
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+import pytest
+from rosdl import eda_profile
+from scipy.stats import wasserstein_distance
+from rosdl.eda_drift_module import detect_drift, profile_drift, drift_metrics, frequency_vectors, quick_eda
+
+
+def _pair(n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    ref = pd.DataFrame({f"n{i}": rng.normal(size=n) for i in range(6)})
+    ref["city"] = rng.choice(["Mumbai", "Delhi", "Pune"], n)
+    cur = ref.copy()
+    cur["n1"] = rng.normal(1.0, 1.0, n)
+    cur.loc[::4, "n2"] = np.nan
+    cur["city"] = rng.choice(["Mumbai", "Delhi", "Pune"], n)
+    return ref, cur
+
+
+def test_parallel_drift_matches_serial_and_keeps_column_order():
+    ref, cur = _pair()
+    serial = detect_drift(ref, cur)
+    assert serial == detect_drift(ref, cur, workers=2)
+    assert [r[0] for r in serial] == list(ref.columns)
+    by_col = {c: (kind, p) for c, kind, p in serial}
+    assert by_col["n0"] == ("No Change", 1.0)
+    assert by_col["n1"][0] == "Numerical" and by_col["n1"][1] < 1e-6
+    assert by_col["n2"][1] > 0.05 and by_col["city"][0] == "Categorical"
+
+
+def test_column_selection_skips_unknown_columns():
+    ref, cur = _pair(500)
+    result = detect_drift(ref, cur, columns=["city", "n1", "missing"], workers=2)
+    assert [r[0] for r in result] == ["city", "n1"]
+
+
+def test_column_numeric_in_one_frame_only_is_compared_as_text():
+    ref = pd.DataFrame({"code": [1, 2, 3, 2] * 50})
+    same = pd.DataFrame({"code": ["1", "2", "3", "2"] * 50})
+    moved = pd.DataFrame({"code": ["X99", "2", "3", "2"] * 50})
+    for workers in (1, 2):
+        assert detect_drift(ref, same, workers=workers) == [("code", "No Change", 1.0)]
+        (_, kind, p_val), = detect_drift(ref, moved, workers=workers)
+        assert kind == "Categorical" and p_val < 1e-6
+    assert drift_metrics(ref, moved)["Type"].tolist() == ["Categorical"]
+
+
+def test_saved_reference_profile_matches_full_comparison():
+    rng = np.random.default_rng(3)
+    ref = pd.DataFrame({"x": rng.normal(size=20000), "k": rng.integers(0, 10, 20000),
+                        "city": rng.choice(["Mumbai", "Delhi", "Pune"], 20000)})
+    with tempfile.TemporaryDirectory() as tmpdir:
+        csv = os.path.join(tmpdir, "train.csv")
+        ref.to_csv(csv, index=False)
+        path = eda_profile.build_reference(csv, chunksize=5000)
+        assert path.endswith(eda_profile.PROFILE_SUFFIX) and os.path.getsize(path) < 100_000
+        loaded = eda_profile.TableProfile.load(path)
+        assert loaded.rows == 20000 and loaded.columns["k"].value_counts is not None
+
+        same = pd.DataFrame({"x": rng.normal(size=1000), "k": rng.integers(0, 10, 1000),
+                             "city": rng.choice(["Mumbai", "Delhi", "Pune"], 1000)})
+        shifted = pd.DataFrame({"x": rng.normal(0.3, 1, 1000), "k": rng.integers(2, 12, 1000),
+                                "city": rng.choice(["Mumbai", "Delhi", "Pune", "Goa"], 1000)})
+        assert all(p > 0.01 for _, _, p in profile_drift(path, same))
+        assert all(p < 1e-4 for _, _, p in profile_drift(loaded, shifted))
+        # exact reference counts give the same KS p-value as the full two-sample test
+        assert np.isclose(profile_drift(loaded, shifted, columns=["k"])[0][2],
+                          detect_drift(ref, shifted, columns=["k"])[0][2])
+
+
+def test_reference_profile_and_batch_of_different_types():
+    rng = np.random.default_rng(6)
+    ref = pd.DataFrame({"code": rng.integers(0, 5, 5000).astype(str), "k": rng.integers(0, 5, 5000)})
+    ref.loc[3, "code"] = "X"
+    reference = eda_profile.profile_chunks([ref])
+    assert not reference.columns["code"].numeric and reference.columns["k"].numeric
+
+    batch = pd.DataFrame({"code": rng.integers(0, 5, 1000), "k": rng.integers(0, 5, 1000).astype(object)})
+    batch.loc[5, "k"] = "unknown"
+    report = {c: (t, p) for c, t, p in profile_drift(reference, batch)}
+    assert report["code"][0] == "Categorical" and report["code"][1] > 0.01
+    assert report["k"][0] == "Categorical" and report["k"][1] > 0.01
+    # matches the row-level comparison of the same data
+    assert np.isclose(report["code"][1], detect_drift(ref, batch, columns=["code"])[0][2], atol=0.05)
+
+
+def test_top_k_must_keep_at_least_one_category():
+    a = pd.DataFrame({"plan": ["free"] * 90 + ["pro"] * 10})
+    b = pd.DataFrame({"plan": ["free"] * 10 + ["pro"] * 90})
+    assert detect_drift(a, b, top_k=1)[0][2] < 1e-10
+    for call in (lambda: detect_drift(a, b, top_k=0), lambda: frequency_vectors(a["plan"], b["plan"], top_k=-1),
+                 lambda: drift_metrics(a, b, top_k=0)):
+        with pytest.raises(ValueError, match="top_k"):
+            call()
+
+
+def test_vectorised_distance_metrics_and_thresholds():
+    rng = np.random.default_rng(4)
+    n = 20000
+    ref = pd.DataFrame({"a": rng.normal(size=n), "b": rng.exponential(size=n), "city": rng.choice(["x", "y"], n)})
+    cur = pd.DataFrame({"a": rng.normal(0.5, 1, n), "b": rng.exponential(size=n), "city": rng.choice(["x", "y"], n)})
+    cur.loc[::3, "b"] = np.nan
+
+    report = drift_metrics(ref, cur).set_index("Column")
+    assert list(report.index) == ["a", "b", "city"]
+    assert report.loc["city", "Type"] == "Categorical" and np.isnan(report.loc["city", "Wasserstein"])
+    assert np.isclose(report.loc["a", "Wasserstein"], wasserstein_distance(ref["a"], cur["a"]) / ref["a"].std(),
+                      rtol=0.02)
+    assert report.loc["a", "PSI"] > 0.2 and report.loc["a", "JS"] > 0.1 and report.loc["a", "Drift_Detected"]
+    assert report.loc["b", "PSI"] < 0.01 and not report.loc["b", "Drift_Detected"]
+
+    # the same histogram as a per-column np.histogram over the reference deciles
+    edges = np.quantile(ref["a"], np.linspace(0, 1, 11))[1:-1]
+    p = np.bincount(np.searchsorted(edges, ref["a"]), minlength=10) / n
+    q = np.bincount(np.searchsorted(edges, cur["a"]), minlength=10) / n
+    assert np.isclose(report.loc["a", "PSI"], ((q - p) * np.log(q / p)).sum())
+
+    lenient = drift_metrics(ref, cur, thresholds={"psi": 1.0, "js": 1.0, "wasserstein": 1.0}, sample=5000)
+    assert not lenient["Drift_Detected"].any()
+    sampled = drift_metrics(ref, cur, sample=2000, stratify="city").set_index("Column")
+    assert abs(sampled.loc["a", "Wasserstein"] - report.loc["a", "Wasserstein"]) < 0.1
+    with pytest.raises(ValueError, match="region"):
+        drift_metrics(ref, cur, sample=2000, stratify="region")
+
+
+def test_categorical_drift_uses_aligned_frequency_vectors():
+    rng = np.random.default_rng(5)
+    n = 5000
+    # high-cardinality ids: a category-by-category crosstab would be 5000 x 5000
+    ref = pd.DataFrame({"user": [f"u{i}" for i in rng.integers(0, 4000, n)],
+                        "plan": rng.choice(["free", "pro", "team"], n, p=[0.7, 0.2, 0.1])})
+    cur = pd.DataFrame({"user": [f"u{i}" for i in rng.integers(0, 4000, n)],
+                        "plan": rng.choice(["free", "pro", "team"], n, p=[0.5, 0.3, 0.2])}).iloc[::-1]
+
+    table = frequency_vectors(ref["user"], cur["user"], top_k=20)
+    assert table.shape == (2, 21) and table.sum() == 2 * n
+    assert np.array_equal(frequency_vectors(ref["plan"], ref["plan"].sample(frac=1, random_state=0)),
+                          np.tile(ref["plan"].value_counts().to_numpy(dtype=float), (2, 1)))
+
+    result = {c: p for c, _, p in detect_drift(ref, cur)}
+    assert result["user"] > 0.01 and result["plan"] < 1e-10
+    g_test = {c: p for c, _, p in detect_drift(ref, cur, categorical_test="g")}
+    assert g_test["plan"] < 1e-10 and abs(g_test["user"] - result["user"]) < 0.5
+
+
+def test_quick_eda_levels_compute_only_what_is_asked():
+    df, _ = _pair()
+    full = quick_eda(df)
+    minimal = quick_eda(df, level="minimal")
+    standard = quick_eda(df, level="standard")
+
+    assert "basic_stats" not in minimal
+    assert {k: minimal[k] for k in ("shape", "missing", "unique_values")} == \
+        {k: full[k] for k in ("shape", "missing", "unique_values")}
+    assert "25%" not in standard["basic_stats"]
+    for stat in ("count", "mean", "std", "min", "max", "freq"):
+        for col in df.columns:
+            a, b = standard["basic_stats"][stat][col], full["basic_stats"][stat][col]
+            assert (pd.isna(a) and pd.isna(b)) or np.isclose(float(a), float(b), atol=0.01)
+
+
+def test_sampled_quick_eda_reports_bounds_that_hold():
+    rng = np.random.default_rng(3)
+    n = 200_000
+    df = pd.DataFrame({"x": rng.lognormal(size=n), "city": rng.choice(["Mumbai", "Delhi", "Pune"], n, p=[0.6, 0.3, 0.1])})
+    df.loc[rng.random(n) < 0.15, "x"] = np.nan
+    exact = quick_eda(df)
+    approx = quick_eda(df, sample=0.05, seed=2)
+
+    info = approx["sample"]
+    assert (info["rows"], info["total_rows"]) == (10_000, n) and approx["shape"] == (n, 2)
+    bounds = info["error_bounds"]
+    lo, hi = bounds["missing"]["x"]
+    assert lo <= exact["missing"]["x"] <= hi and lo <= approx["missing"]["x"] <= hi
+    lo, hi = bounds["mean"]["x"]
+    assert lo <= exact["basic_stats"]["mean"]["x"] <= hi
+    for q in ("25%", "50%", "75%"):
+        lo, hi = bounds[q]["x"]
+        assert lo <= exact["basic_stats"][q]["x"] <= hi
+    lo, hi = bounds["freq"]["city"]
+    assert lo <= exact["basic_stats"]["freq"]["city"] <= hi
+    assert approx["unique_values"]["city"] == 3
+
+    # a sample read elsewhere (table_loader.read_sample) is scaled the same way
+    presampled = quick_eda(df.sample(n=10_000, random_state=2), total_rows=n)
+    assert presampled["sample"] == approx["sample"] and presampled["missing"] == approx["missing"]
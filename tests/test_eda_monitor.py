@@ -0,0 +1,91 @@
+# tests/test_eda_monitor.py
+"""
+Unit tests for rosdl.eda_monitor (windowed, cached drift monitoring).
+"""
+
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from rosdl.eda_monitor import WindowCache, monitor_drift
+
+
+def _days(start, days, shift=0.0, seed=0, per_day=400):
+    rng = np.random.default_rng(seed)
+    n = days * per_day
+    ts = pd.Timestamp(start) + pd.to_timedelta(np.sort(rng.uniform(0, days * 86400, n)), unit="s")
+    return pd.DataFrame({
+        "ts": ts,
+        "x": rng.normal(shift, 1, n),
+        "city": rng.choice(["Mumbai", "Delhi", "Pune"], n, p=[0.2, 0.3, 0.5] if shift else [0.5, 0.3, 0.2]),
+    })
+
+
+def test_monitor_flags_shifted_window_only():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "events.csv")
+        pd.concat([_days("2024-01-01", 10, seed=1), _days("2024-01-11", 1, shift=2, seed=2)]).to_csv(path, index=False)
+        report = monitor_drift(path, "ts", reference_windows=5)
+
+        assert set(report["Window"].dt.day) == set(range(2, 12))
+        last = report[report["Window"] == pd.Timestamp("2024-01-11")]
+        earlier = report[report["Window"] < pd.Timestamp("2024-01-11")]
+        assert last["Drift_Detected"].all() and (last["p_value"] < 1e-10).all()
+        assert (earlier["PSI"] < 0.1).all() and (earlier["p_value"] > 1e-3).all()
+        assert set(last["Type"]) == {"Numerical", "Categorical"}
+        reference_rows = earlier.drop_duplicates("Window")["Rows"].iloc[-5:].sum()
+        assert (last["Reference_Rows"] == reference_rows).all()
+
+
+def test_appended_rows_and_new_files_are_read_once():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "events.csv")
+        _days("2024-01-01", 5, seed=1).to_csv(path, index=False)
+        cache_dir = os.path.join(tmp, "cache")
+        first = monitor_drift(path, "ts", reference_windows=3, cache_dir=cache_dir)
+
+        _days("2024-01-06", 1, seed=2).to_csv(path, mode="a", header=False, index=False)
+        day7 = os.path.join(tmp, "day7.csv")
+        _days("2024-01-07", 1, seed=3).to_csv(day7, index=False)
+        stats = WindowCache(cache_dir, "ts").refresh([path, day7])
+        assert stats == {"rows_read": 800, "windows_updated": ["20240106T000000", "20240107T000000"]}
+
+        again = monitor_drift([path, day7], "ts", reference_windows=3, cache_dir=cache_dir)
+        pd.testing.assert_frame_equal(again.iloc[:len(first)], first)
+        assert set(again["Window"].dt.day) == set(range(2, 8))
+
+        # the cached profiles add up to a single full pass over the same data
+        full = monitor_drift([path, day7], "ts", reference_windows=3, cache_dir=os.path.join(tmp, "fresh"))
+        pd.testing.assert_frame_equal(again, full)
+
+
+def test_appended_rows_keep_their_columns_when_monitoring_a_subset():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "events.csv")
+        _days("2024-01-01", 4, seed=1).to_csv(path, index=False)
+        cache_dir = os.path.join(tmp, "cache")
+        monitor_drift(path, "ts", reference_windows=2, cache_dir=cache_dir, columns=["city"])
+
+        _days("2024-01-05", 1, seed=2).to_csv(path, mode="a", header=False, index=False)
+        again = monitor_drift(path, "ts", reference_windows=2, cache_dir=cache_dir, columns=["city"])
+        assert set(again["Window"].dt.day) == set(range(2, 6)) and set(again["Column"]) == {"city"}
+
+        full = monitor_drift(path, "ts", reference_windows=2, cache_dir=os.path.join(tmp, "fresh"), columns=["city"])
+        pd.testing.assert_frame_equal(again, full)
+
+
+def test_text_sentinel_in_one_daily_file_is_compared_as_categories():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for day in range(4):
+            df = _days(f"2024-01-0{day + 1}", 1, seed=day)
+            df["code"] = np.random.default_rng(day).integers(0, 5, len(df)).astype(object)
+            if day in (0, 3):  # a sentinel before and after the numeric-only days
+                df.loc[7, "code"] = "unknown"
+            paths.append(os.path.join(tmp, f"day{day}.csv"))
+            df.to_csv(paths[-1], index=False)
+        report = monitor_drift(paths, "ts", reference_windows=1, cache_dir=os.path.join(tmp, "cache"))
+
+        code = report[report["Column"] == "code"]
+        assert list(code["Type"]) == ["Categorical", "Numerical", "Categorical"]
+        assert (code["p_value"] > 1e-3).all() and (code["PSI"] < 0.1).all()
@@ -0,0 +1,86 @@
+# tests/test_eda_profile.py
+"""
+Unit tests for rosdl.eda_profile and the sketches it uses.
+"""
+
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from rosdl import eda_profile as ep
+from rosdl.eda_drift_module import quick_eda
+from rosdl.sketches import TDigest
+
+
+def _frame(n=20000, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "x": rng.normal(10, 2, n),
+        "k": rng.integers(0, 30, n),
+        "city": rng.choice(["Mumbai", "Delhi", "Pune"], n, p=[0.5, 0.3, 0.2]),
+    })
+    df.loc[::10, "x"] = np.nan
+    return df
+
+
+def test_tdigest_quantiles_survive_merging():
+    x = np.random.default_rng(1).lognormal(size=50000)
+    parts = [TDigest().update(c) for c in np.array_split(x, 5)]
+    digest = parts[0]
+    for p in parts[1:]:
+        digest.merge(p)
+    assert len(digest) <= 210 and digest.count == len(x)
+    qs = [0.01, 0.5, 0.99]
+    assert np.allclose(digest.quantile(qs), np.quantile(x, qs), rtol=0.02)
+    assert (digest.min, digest.max) == (x.min(), x.max())
+
+
+def test_chunked_profile_matches_quick_eda():
+    df = _frame()
+    exact = quick_eda(df)
+    chunks = (df.iloc[i:i + 3000] for i in range(0, len(df), 3000))
+    report = ep.profile_chunks(chunks).report()
+
+    assert set(report) == set(exact)
+    assert report["shape"] == exact["shape"]
+    assert report["dtypes"] == exact["dtypes"]
+    assert report["missing"] == exact["missing"]
+    # low-cardinality columns are exact, high-cardinality ones HyperLogLog estimates
+    assert {c: report["unique_values"][c] for c in ("k", "city")} == {"k": 30, "city": 3}
+    assert abs(report["unique_values"]["x"] - exact["unique_values"]["x"]) < 0.02 * len(df)
+    stats = report["basic_stats"]
+    assert stats["top"]["city"] == "Mumbai" and stats["freq"]["city"] == (df["city"] == "Mumbai").sum()
+    assert abs(stats["mean"]["x"] - df["x"].mean()) < 0.01 and abs(stats["std"]["x"] - df["x"].std()) < 0.01
+    assert abs(stats["50%"]["x"] - df["x"].median()) < 0.05
+    assert np.isnan(stats["mean"]["city"]) and np.isnan(stats["unique"]["x"])
+
+
+def test_profile_table_reads_chunks_and_merges_in_parallel():
+    df = _frame(5000, seed=2)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "data.csv")
+        df.to_csv(path, index=False)
+        serial = ep.profile_table(path, chunksize=1000)
+        parallel = ep.profile_table(path, chunksize=1000, workers=2)
+    for prof in (serial, parallel):
+        assert prof.rows == 5000 and prof.columns["x"].nulls == 500
+        assert prof.columns["k"].unique == 30
+    assert np.isclose(serial.columns["x"].mean, parallel.columns["x"].mean)
+    assert np.isclose(serial.columns["x"].m2, parallel.columns["x"].m2)
+
+
+def test_column_turns_categorical_when_a_later_chunk_is_not_numeric():
+    first = pd.DataFrame({"code": [1, 2, 2, 3], "n": [1.0, 2.0, 3.0, 4.0]})
+    later = pd.DataFrame({"code": ["X99", "2", None], "n": ["5", "6", None]})
+    prof = ep.TableProfile().update(first).update(later)
+    code, n = prof.columns["code"], prof.columns["n"]
+    assert not code.numeric and code.nulls == 1
+    assert code.value_counts == {"1": 1, "2": 3, "3": 1, "X99": 1} and code.unique == 4
+    # numbers that only arrived as text stay numeric
+    assert n.numeric and n.nulls == 1 and n.count == 6 and n.mean == 3.5
+
+    # merging a numeric and a categorical profile of the same column gives the same result
+    merged = ep.TableProfile().update(first).merge(ep.TableProfile().update(later))
+    assert merged.columns["code"].value_counts == code.value_counts
+    swapped = ep.TableProfile().update(later).merge(ep.TableProfile().update(first))
+    assert swapped.columns["code"].value_counts == code.value_counts
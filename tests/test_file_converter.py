@@ -0,0 +1,107 @@
+# tests/test_file_converter.py
+"""
+Unit tests for rosdl.file_converter batch conversion.
+"""
+
+import os
+import json
+import time
+import tempfile
+import pandas as pd
+import pytest
+from rosdl import file_converter as fc
+
+
+def _slow_convert(input_path, output_path=None):
+    time.sleep(30)
+    return f"✅ done: {output_path}"
+
+
+def _write_csvs(folder, n=3):
+    paths = []
+    for i in range(n):
+        path = os.path.join(folder, f"data_{i}.csv")
+        pd.DataFrame({"a": [i, i + 1], "b": ["x", "y"]}).to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def test_plan_batch_folder_dispatches_by_extension():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write_csvs(tmpdir, 2)
+        open(os.path.join(tmpdir, "notes.unknown"), "w").close()
+        jobs = fc.plan_batch(tmpdir, output_dir=os.path.join(tmpdir, "out"))
+        assert [j["converter"] for j in jobs] == ["csv-to-xlsx", "csv-to-xlsx"]
+        assert all(j["output"].endswith(".xlsx") for j in jobs)
+
+
+def test_manifest_and_skip_up_to_date():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write_csvs(tmpdir, 2)
+        manifest = os.path.join(tmpdir, "jobs.json")
+        with open(manifest, "w") as f:
+            json.dump({"output_dir": "out", "jobs": ["data_*.csv"]}, f)
+
+        summary = fc.run_batch(fc.plan_batch(manifest), workers=2)
+        assert summary["converted"] == 2 and summary["failed"] == 0
+        assert os.path.exists(os.path.join(tmpdir, "out", "data_0.xlsx"))
+
+        summary = fc.run_batch(fc.plan_batch(manifest), workers=2)
+        assert summary["skipped"] == 2 and summary["converted"] == 0
+
+
+def test_hash_skip_uses_state_file():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = _write_csvs(tmpdir, 1)[0]
+        state = os.path.join(tmpdir, "state.json")
+        out = os.path.join(tmpdir, "out")
+        jobs = fc.plan_batch(tmpdir, output_dir=out)
+        assert fc.run_batch(jobs, skip="hash", state_file=state)["converted"] == 1
+
+        os.utime(src)  # touched but unchanged content
+        assert fc.run_batch(fc.plan_batch(tmpdir, output_dir=out), skip="hash", state_file=state)["skipped"] == 1
+
+
+def test_rerun_in_place_never_converts_outputs_back_over_sources():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "data.csv")
+        with open(src, "w") as f:
+            f.write('id,name\n007,"a, b"\n')
+        assert fc.run_batch(fc.plan_batch(tmpdir))["converted"] == 1
+        assert os.path.exists(os.path.join(tmpdir, "data.xlsx"))
+
+        with open(src, "a") as f:
+            f.write('008,c\n')  # edited source: the pair is reported, never silently dropped
+        summary = fc.run_batch(fc.plan_batch(tmpdir), skip="none")
+        assert summary["skipped"] == 2 and summary["converted"] == 0
+        assert all("round trip" in j["message"] and "output folder" in j["message"] for j in summary["jobs"])
+        with open(src) as f:
+            assert f.read() == 'id,name\n007,"a, b"\n008,c\n'
+        assert fc.run_batch(fc.plan_batch(tmpdir, output_dir=os.path.join(tmpdir, "out")))["converted"] == 2
+
+
+def test_rerun_converts_images_again_but_not_their_outputs():
+    from PIL import Image
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Image.new("RGB", (4, 4)).save(os.path.join(tmpdir, "a.png"))
+        assert fc.run_batch(fc.plan_batch(tmpdir))["converted"] == 1
+        summary = fc.run_batch(fc.plan_batch(tmpdir), skip="none")
+        results = {os.path.basename(j["input"]): j for j in summary["jobs"]}
+        assert results["a.png"]["status"] == "converted"
+        assert results["a_converted.png"]["status"] == "skipped"
+        assert "written by this batch" in results["a_converted.png"]["message"]
+        assert not os.path.exists(os.path.join(tmpdir, "a_converted_converted.png"))
+
+        with pytest.raises(ValueError):
+            fc.run_batch(fc.plan_batch(tmpdir), workers=0)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="relies on fork start method")
+def test_job_timeout_kills_worker(monkeypatch):
+    monkeypatch.setitem(fc.BATCH_CONVERTERS, "csv-to-xlsx", (_slow_convert, ".xlsx"))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write_csvs(tmpdir, 1)
+        start = time.monotonic()
+        summary = fc.run_batch(fc.plan_batch(tmpdir), timeout=0.5)
+        assert summary["timeout"] == 1
+        assert time.monotonic() - start < 10
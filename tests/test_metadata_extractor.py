@@ -0,0 +1,321 @@
+# tests/test_metadata_extractor.py
+"""
+Unit tests for rosdl.metadata_extractor and the metadata subsystem.
+"""
+
+import os
+import tempfile
+import zipfile
+import pandas as pd
+import pytest
+from rosdl import metadata_extractor as me
+from rosdl.metadata_index import MetadataIndex
+from rosdl import duplicate_finder as dfind
+from rosdl import metadata_watch as mw
+
+
+def _make_tree(root):
+    os.makedirs(os.path.join(root, "sub", "deeper"))
+    paths = []
+    for rel in ("a.txt", "b.csv", os.path.join("sub", "c.txt"), os.path.join("sub", "deeper", "d.md")):
+        path = os.path.join(root, rel)
+        with open(path, "w") as f:
+            f.write(f"content of {rel}\n")
+        paths.append(path)
+    return paths
+
+
+def test_iter_files_reuses_scandir_stat():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = _make_tree(tmpdir)
+        found = dict(me.iter_files(tmpdir))
+        assert sorted(found) == sorted(paths)
+        assert all(st.st_size == os.path.getsize(p) for p, st in found.items())
+        top = [p for p, _ in me.iter_files(tmpdir, recursive=False)]
+        assert sorted(top) == sorted(paths[:2])
+
+
+def test_scan_folder_parallel_matches_serial():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _make_tree(tmpdir)
+        serial = me.scan_folder(tmpdir, workers=1)
+        parallel = me.scan_folder(tmpdir, workers=4)
+        assert len(serial) == 4
+        assert serial == parallel
+        assert {m["extension"] for m in serial} == {".txt", ".csv", ".md"}
+        assert me.extract(tmpdir) is None
+
+
+def test_metadata_index_incremental_update_and_query():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = os.path.join(tmpdir, "data")
+        os.makedirs(root)
+        paths = _make_tree(root)
+        db = os.path.join(tmpdir, "meta.db")
+        with MetadataIndex(db) as idx:
+            assert idx.update(root)["added"] == 4
+            assert idx.update(root) == {"added": 0, "updated": 0, "unchanged": 4, "removed": 0}
+
+            with open(paths[0], "a") as f:
+                f.write("more\n")
+            os.remove(paths[1])
+            stats = idx.update(root)
+            assert (stats["updated"], stats["removed"], stats["unchanged"]) == (1, 1, 2)
+
+            assert len(idx.query(extension="txt")) == 2
+            assert len(idx.query(path_prefix=os.path.join(root, "sub"))) == 2
+            assert len(idx.query(modified_since="1d")) == 3
+            assert idx.query(extension="md", fields={"filepath": "%d.md"})[0]["extension"] == ".md"
+            # fields named like query's own arguments are plain filters
+            assert len(idx.query(fields={"extension": ".txt", "limit": "%"})) == 0
+            assert len(idx.query(fields={"extension": ".txt"}, limit=1)) == 1
+
+
+def test_metadata_index_reextracts_rows_stored_with_fewer_fields():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = os.path.join(tmpdir, "data")
+        os.makedirs(root)
+        _make_tree(root)
+        with MetadataIndex(os.path.join(tmpdir, "meta.db")) as idx:
+            assert idx.update(root, fields="stat")["added"] == 4
+            assert idx.update(root, fields="stat")["unchanged"] == 4
+            assert idx.update(root)["updated"] == 4
+            assert all("format" in m for m in idx.query())
+            assert idx.update(root, fields="stat")["unchanged"] == 4
+            assert idx.update(root)["unchanged"] == 4
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "csv", "parquet"])
+def test_stream_export_loads_in_pandas_and_resumes(fmt):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = os.path.join(tmpdir, "data")
+        os.makedirs(root)
+        _make_tree(root)
+        out = os.path.join(tmpdir, f"meta.{fmt}")
+
+        # an interrupted run that only got two files out
+        first_two = me.scan_folder(root)[:2]
+        assert me.stream_export(iter(first_two), out, flush_every=1) == 2
+        if fmt != "parquet":
+            with open(out, "a") as f:
+                f.write('{"filepath": "half-writ')
+
+        assert me.export_folder(root, out, resume=True, flush_every=1) == 2
+        load = {"jsonl": lambda p: pd.read_json(p, lines=True), "csv": pd.read_csv, "parquet": pd.read_parquet}
+        df = load[fmt](out)
+        assert sorted(df["filepath"]) == sorted(m["filepath"] for m in me.scan_folder(root))
+
+
+def test_export_report_streams_same_text_as_build_report():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _make_tree(tmpdir)
+        metas = me.scan_folder(tmpdir)
+        out = os.path.join(tmpdir, "report.txt")
+        me.export_report(iter(metas), out, interactive=False)
+        with open(out, encoding="utf-8") as f:
+            assert f.read() == me.build_report(metas)
+
+        # extract_folder reports in path order, whatever order the workers finish in
+        folder_report = os.path.join(tmpdir, "sub", "folder.txt")
+        me.extract_folder(os.path.join(tmpdir, "sub"), folder_report, interactive=False, workers=4)
+        with open(folder_report, encoding="utf-8") as f:
+            files = [line[len("File: "):] for line in f.read().splitlines() if line.startswith("File: ")]
+        assert files == sorted(files) and len(files) == 2
+
+
+def test_find_duplicates_tiers():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        big = os.urandom(300 * 1024)
+        tweaked = big[:150 * 1024] + b"X" + big[150 * 1024 + 1:]  # same size, head and tail
+        files = {"a.bin": big, "sub/b.bin": big, "c.bin": tweaked, "d.txt": b"hello", "e.txt": b"hello",
+                 "f.txt": b"world"}
+        for rel, data in files.items():
+            path = os.path.join(tmpdir, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+
+        groups = dfind.find_duplicates(tmpdir, workers=2)
+        names = [sorted(os.path.basename(p) for p in g["paths"]) for g in groups]
+        assert names == [["a.bin", "b.bin"], ["d.txt", "e.txt"]]
+        assert groups[0]["wasted_bytes"] == len(big)
+        assert dfind.full_hash(os.path.join(tmpdir, "a.bin")) == \
+            dfind.full_hash(os.path.join(tmpdir, "sub", "b.bin"), use_mmap=False, buffer_size=4096)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="links need extra privileges on Windows")
+def test_find_duplicates_ignores_links_to_the_same_file():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        original = os.path.join(tmpdir, "a.txt")
+        with open(original, "wb") as f:
+            f.write(b"same bytes\n")
+        os.link(original, os.path.join(tmpdir, "hard.txt"))
+        os.symlink(original, os.path.join(tmpdir, "soft.txt"))
+        assert dfind.find_duplicates(tmpdir) == []
+
+        with open(os.path.join(tmpdir, "copy.txt"), "wb") as f:
+            f.write(b"same bytes\n")
+        groups = dfind.find_duplicates(tmpdir)
+        assert [[os.path.basename(p) for p in g["paths"]] for g in groups] == [["a.txt", "copy.txt"]]
+        assert groups[0]["wasted_bytes"] == len(b"same bytes\n")
+
+
+def test_sniff_mime_from_magic_bytes():
+    assert me.sniff_mime(b"%PDF-1.7\n", ".bin") == "application/pdf"
+    assert me.sniff_mime(b"\x89PNG\r\n\x1a\n....", ".jpg") == "image/png"
+    assert me.sniff_mime(b"RIFF\x00\x00\x00\x00WAVEfmt ", "") == "audio/wav"
+    assert me.sniff_mime(b"\x00\x00\x00\x18ftypisom", ".mp4") == "video/mp4"
+    assert me.sniff_mime(b"PK\x03\x04rest", ".docx").endswith("wordprocessingml.document")
+    assert me.sniff_mime(b"PK\x03\x04rest", ".bin") == "application/zip"
+    assert me.sniff_mime(b"a,b\n1,2\n", ".csv") == "text/csv"
+    assert me.sniff_mime(b"BMW is a car brand", ".txt") == "text/plain"
+    assert me.sniff_mime(b"\x00\x01\x02", ".weird") == "unknown"
+
+
+def test_field_selection_and_rich_extractors():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docx = os.path.join(tmpdir, "report.docx")
+        with zipfile.ZipFile(docx, "w") as z:
+            z.writestr("docProps/core.xml",
+                       '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+                       'xmlns:dc="http://purl.org/dc/elements/1.1/"><dc:creator>Jane</dc:creator>'
+                       '<dc:title>Q3</dc:title></cp:coreProperties>')
+            z.writestr("word/document.xml", "<w/>")
+
+        rich = me.extract(docx)
+        assert rich["office"] == {"creator": "Jane", "title": "Q3"}
+
+        cheap = me.extract(docx, fields="stat")
+        assert "format" not in cheap and "office" not in cheap and cheap["extension"] == ".docx"
+
+        fmt_only = me.extract(docx, fields=["format"])
+        assert fmt_only["format"].endswith("wordprocessingml.document") and "office" not in fmt_only
+
+        archive = me.extract(docx, fields="format,archive")
+        assert "archive" not in archive  # docx is sniffed as office, not as a plain zip
+
+        with pytest.raises(ValueError):
+            me.extract(docx, fields="nope")
+
+
+def test_archive_members_are_catalogued_in_memory():
+    import io
+    import tarfile
+    with tempfile.TemporaryDirectory() as tmpdir:
+        inner = io.BytesIO()
+        with zipfile.ZipFile(inner, "w") as z:
+            z.writestr("deep/report.pdf", b"%PDF-1.4\n%%EOF\n")
+        outer_path = os.path.join(tmpdir, "bundle.tar")
+        with tarfile.open(outer_path, "w") as t:
+            for name, data in (("notes.txt", b"plain text\n"), ("inner.zip", inner.getvalue())):
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                t.addfile(info, io.BytesIO(data))
+
+        members = {m["filepath"]: m for m in me.iter_archive(outer_path, depth=2)}
+        nested = outer_path + "!/inner.zip!/deep/report.pdf"
+        assert set(members) == {outer_path + "!/notes.txt", outer_path + "!/inner.zip", nested}
+        assert members[nested]["format"] == "application/pdf"
+        assert members[outer_path + "!/inner.zip"]["archive"]["members"] == 1
+
+        assert len(list(me.iter_archive(outer_path, depth=1))) == 2
+        scanned = me.scan_folder(tmpdir, archive_depth=2, fields="stat")
+        # stat-only listing cannot sniff members, so nested archives stay closed
+        assert len(scanned) == 3 and "format" not in scanned[-1]
+        assert me.scan_folder(tmpdir) == me.scan_folder(tmpdir, archive_depth=0)
+
+
+def test_corrupt_archive_member_does_not_hide_the_rest():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "mixed.zip")
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+            z.writestr("a_broken.txt", b"x" * 5000)
+            z.writestr("b_fine.txt", b"fine\n")
+        with open(path, "r+b") as f:  # garble the first member's compressed data
+            f.seek(40)
+            f.write(b"\xff" * 16)
+
+        members = list(me.iter_archive(path))
+        assert [m["filepath"].split("!/")[1] for m in members] == ["a_broken.txt", "b_fine.txt"]
+        assert "error" in members[0] and members[0]["size_bytes"] == 5000
+        assert "error" not in members[1] and members[1]["format"].startswith("text/")
+
+
+def test_archive_members_are_listed_lazily_despite_bad_zip_dates():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "dates.zip")
+        with zipfile.ZipFile(path, "w") as z:
+            z.writestr(zipfile.ZipInfo("a_month_zero.txt", (1980, 0, 0, 0, 0, 0)), b"hi\n")
+            z.writestr("b_fine.txt", b"ok\n")
+
+        listing = me.extract_with_members(path, archive_depth=1)
+        assert next(listing)["filepath"] == path  # the archive itself, before any member is read
+        members = list(listing)
+        assert [m["filepath"].split("!/")[1] for m in members] == ["a_month_zero.txt", "b_fine.txt"]
+        assert members[0]["modified"] == "N/A" and members[1]["modified"] != "N/A"
+        assert len(me.scan_folder(tmpdir, archive_depth=1, workers=4)) == 3
+
+
+def test_watch_polling_keeps_index_current():
+    import threading
+    import time
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = os.path.join(tmpdir, "data")
+        os.makedirs(root)
+        paths = _make_tree(root)
+        db = os.path.join(tmpdir, "meta.db")
+        batches, stop = [], threading.Event()
+        t = threading.Thread(target=mw.watch, args=(root,), daemon=True,
+                             kwargs=dict(db=db, poll=True, interval=0.05, debounce=0.05, stop=stop,
+                                         on_change=lambda p, s: batches.append(s)))
+        t.start()
+        time.sleep(0.3)
+        new = os.path.join(root, "sub", "new.txt")
+        with open(new, "w") as f:
+            f.write("fresh\n")
+        os.remove(paths[1])
+        deadline = time.time() + 5
+        while sum(b["updated"] + b["removed"] for b in batches) < 2 and time.time() < deadline:
+            time.sleep(0.05)
+        stop.set()
+        t.join(5)
+
+        with MetadataIndex(db) as idx:
+            assert idx.get(new)["extension"] == ".txt"
+            assert idx.get(paths[1]) is None
+            assert len(idx) == 4
+
+
+def test_watch_applies_pending_changes_on_ctrl_c():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = os.path.join(tmpdir, "data")
+        os.makedirs(root)
+        _make_tree(root)
+        db = os.path.join(tmpdir, "meta.db")
+        new = os.path.join(root, "new.txt")
+
+        class CtrlC:
+            calls = 0
+
+            def wait(self, timeout):
+                self.calls += 1
+                if self.calls == 1:
+                    with open(new, "w") as f:
+                        f.write("fresh\n")
+                    return False
+                raise KeyboardInterrupt
+
+        # a long debounce: the new file is still pending when Ctrl+C arrives
+        mw.watch(root, db=db, poll=True, interval=0.01, debounce=60, stop=CtrlC())
+        with MetadataIndex(db) as idx:
+            assert idx.get(new)["extension"] == ".txt"
+        with pytest.raises(ValueError):
+            mw.watch(root, db=db, poll=True, interval=0)
+
+
+def test_debouncer_waits_for_quiet_paths():
+    d = mw.Debouncer(delay=10)
+    d.touch("a")
+    assert d.ready() == [] and len(d) == 1
+    assert d.ready(force=True) == ["a"] and len(d) == 0
+    assert mw.diff_snapshots({"a": 1, "b": 2}, {"a": 1, "b": 3, "c": 4}) == {"b", "c"}
@@ -0,0 +1,104 @@
+# tests/test_table_loader.py
+"""
+Unit tests for rosdl.table_loader
+"""
+
+import os
+import json
+import tempfile
+import pandas as pd
+import pytest
+from rosdl import table_loader as tl
+
+
+@pytest.fixture(autouse=True)
+def _cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("ROSDL_CACHE_DIR", str(tmp_path / "cache"))
+
+
+def _write_csv(folder):
+    path = os.path.join(folder, "data.csv")
+    pd.DataFrame({
+        "id": range(100),
+        "score": [i / 3 for i in range(100)],
+        "city": ["Mumbai", "Delhi"] * 50,
+    }).to_csv(path, index=False)
+    return path
+
+
+def test_schema_is_cached_outside_the_data_folder_and_reused():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = _write_csv(tmpdir)
+        df = tl.read_table(path)
+        assert len(df) == 100 and list(df.columns) == ["id", "score", "city"]
+        assert os.listdir(tmpdir) == ["data.csv"]
+        assert os.path.exists(tl.schema_path(path))
+        assert tl.load_schema(path)["categories"] == ["city"]
+
+        # read options are part of the key; the sidecar is opt-in
+        assert tl.load_schema(path, {"sep": ";"}) is None
+        tl.read_table(path, schema_cache="sidecar")
+        assert os.path.exists(path + tl.SCHEMA_SUFFIX)
+
+        # a stale sidecar (source changed) is ignored
+        pd.DataFrame({"id": [1]}).to_csv(path, index=False)
+        assert tl.load_schema(path) is None
+        assert list(tl.read_table(path).columns) == ["id"]
+
+
+def test_usecols_categorical_and_downcast():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = _write_csv(tmpdir)
+        df = tl.read_table(path, usecols=["id", "city"], categorical=True, downcast=True)
+        assert list(df.columns) == ["id", "city"]
+        assert isinstance(df["city"].dtype, pd.CategoricalDtype)
+        assert df["id"].dtype.itemsize == 1
+
+
+def test_chunked_iteration_and_sample_fallback():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = _write_csv(tmpdir)
+        chunks = list(tl.read_table(path, chunksize=30))
+        assert [len(c) for c in chunks] == [30, 30, 30, 10]
+
+        # a value beyond the sampled rows breaks the inferred int type
+        mixed = os.path.join(tmpdir, "mixed.csv")
+        with open(mixed, "w") as f:
+            f.write("n\n1\n2\nthree\n")
+        df = tl.read_table(mixed, sample_rows=2)
+        assert df["n"].tolist() == ["1", "2", "three"]
+        with open(tl.schema_path(mixed)) as f:
+            assert json.load(f)["sample_rows"] is None
+
+
+def test_chunked_read_recovers_when_sampled_types_break():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "ids.csv")
+        with open(path, "w") as f:
+            f.write("id,x\n" + "".join(f"{i},{i / 2}\n" for i in range(50)) + "X99,1.5\n" + "51,2.5\n")
+        chunks = list(tl.read_table(path, sample_rows=20, chunksize=20))
+        df = pd.concat(chunks)
+        assert len(df) == 52 and df["x"].tolist()[-2:] == [1.5, 2.5]
+        assert [str(v) for v in df["id"]][:3] == ["0", "1", "2"] and "X99" in df["id"].astype(str).tolist()
+
+
+@pytest.mark.parametrize("read_kwargs", [{}, {"sep": ","}])  # pyarrow stream / pandas chunks
+def test_read_sample_streams_a_uniform_sample(read_kwargs):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "notes.csv")
+        full = pd.DataFrame({"id": range(5000), "note": [f"line one\nline two {i}" for i in range(5000)],
+                             "score": [i / 4 if i % 7 else None for i in range(5000)]})
+        full.to_csv(path, index=False)
+
+        df, total = tl.read_sample(path, 100, seed=1, chunksize=700, **read_kwargs)
+        assert total == 5000 and len(df) == 100 and df["id"].is_unique and df["id"].is_monotonic_increasing
+        pd.testing.assert_frame_equal(df.reset_index(drop=True), full.iloc[df["id"]].reset_index(drop=True))
+        again, _ = tl.read_sample(path, 100, seed=1, chunksize=700, **read_kwargs)
+        pd.testing.assert_frame_equal(again, df)
+        # the draw is spread over the whole file, not the first chunk
+        assert df["id"].min() < 1000 and df["id"].max() > 4000
+
+        frac, total = tl.read_sample(path, 0.1, seed=2, usecols=["id", "score"], **read_kwargs)
+        assert total == 5000 and 400 < len(frac) < 600 and list(frac.columns) == ["id", "score"]
+        everything, _ = tl.read_sample(path, 10_000, **read_kwargs)
+        pd.testing.assert_frame_equal(everything, full)
@@ -0,0 +1,41 @@
+# tests/test_text_dedup.py
+"""
+Unit tests for rosdl.text_dedup.
+"""
+
+import os
+import random
+import string
+import tempfile
+from rosdl.text_dedup import MinHashIndex, find_near_duplicates, cluster_pairs
+
+
+def _corpus(n=200, length=120, seed=0):
+    rnd = random.Random(seed)
+    vocab = ["".join(rnd.choice(string.ascii_lowercase) for _ in range(6)) for _ in range(2000)]
+    return [" ".join(rnd.choice(vocab) for _ in range(length)) for _ in range(n)]
+
+
+def test_minhash_estimates_jaccard_and_clusters_near_duplicates():
+    docs = _corpus()
+    index = MinHashIndex()
+    half = " ".join(docs[0].split()[:60])
+    assert abs(index.similarity(index.signature(docs[0]), index.signature(half)) - 0.5) < 0.15
+    assert index.similarity(index.signature(docs[0]), index.signature(docs[0].upper() + "!!")) == 1.0
+
+    edited = docs[3].split()
+    edited[50] = "changed"
+    pairs = [(f"d{i}", d) for i, d in enumerate(docs)] + [("copy3", " ".join(edited)), ("copy3b", docs[3])]
+    assert find_near_duplicates(pairs) == [["copy3", "copy3b", "d3"]]
+    assert cluster_pairs([("a", [("b", 1.0)]), ("c", [("b", 0.9)]), ("x", [])]) == [["a", "b", "c"]]
+
+
+def test_persistent_index_checks_new_batches_incrementally():
+    docs = _corpus(50, seed=1)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "dedup.db")
+        assert find_near_duplicates(((f"old{i}", d) for i, d in enumerate(docs)), path, num_perm=64, bands=16) == []
+        with MinHashIndex(path) as index:  # parameters come from the stored index
+            assert (len(index), index.num_perm, index.bands) == (50, 64, 16)
+            assert index.query(docs[7])[0][0] == "old7"
+        assert find_near_duplicates([("new", docs[7] + " tail")], path) == [["new", "old7"]]
@@ -0,0 +1,58 @@
+# tests/test_text_keywords.py
+"""
+Unit tests for rosdl.text_keywords.
+"""
+
+import os
+import tempfile
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+from rosdl.text_keywords import KeywordModel
+
+
+CORPUS = [
+    "the cat sat on the mat with another cat",
+    "dogs and cats are common pets",
+    "the stock market fell as markets reacted to rates",
+    "interest rates rose and the market dipped",
+] * 5
+
+
+def test_incremental_fit_matches_tfidf_vectorizer_idf():
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    model = KeywordModel(n_features=2 ** 16).fit(iter(CORPUS), chunksize=3)
+    ref = TfidfVectorizer(stop_words="english").fit(CORPUS)
+    assert model.n_docs == len(CORPUS)
+    for term, idf in zip(ref.get_feature_names_out(), ref.idf_):
+        assert model.idf[model._bucket(term)] == pytest.approx(idf)
+
+
+def test_per_document_top_k_and_save_load():
+    model = KeywordModel(n_features=2 ** 16).fit(CORPUS)
+    top = model.top_k(["cat cat cat sat on a mat", "rates and markets"], k=2)
+    assert top[0][0][0] == "cat" and top[0][1][0] in {"sat", "mat"}
+    assert {w for w, _ in top[1]} == {"rates", "markets"}
+    assert top[0][0][1] >= top[0][1][1]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = model.save(os.path.join(tmpdir, "idf.npz"))
+        loaded = KeywordModel.load(path)
+    assert loaded.n_docs == model.n_docs and np.array_equal(loaded.idf, model.idf)
+    assert list(loaded.iter_keywords(["interest rates rose"], k=1, chunksize=1)) == model.top_k(["interest rates rose"], k=1)
+    assert loaded.top_k(["zebras zebras"], k=1)[0][0][0] == "zebras"  # unseen words are still named
+
+
+def test_saved_vocabulary_is_not_padded_to_the_longest_term():
+    long_word = "x" * 5000
+    model = KeywordModel(n_features=2 ** 16).fit(CORPUS + [f"{long_word} café naïve"])
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = model.save(os.path.join(tmpdir, "idf.npz"))
+        with np.load(path) as data:
+            assert data["term_text"].nbytes < 2 * sum(len(t.encode("utf-8")) + 1 for t in model.terms.values())
+        loaded = KeywordModel.load(path)
+        assert loaded.terms == model.terms and long_word in loaded.terms.values()
+
+        empty = KeywordModel.load(KeywordModel(n_features=2 ** 10).save(os.path.join(tmpdir, "empty.npz")))
+        assert empty.terms == {}
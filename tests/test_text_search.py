@@ -0,0 +1,87 @@
+# tests/test_text_search.py
+"""
+Unit tests for rosdl.text_search.
+"""
+
+import os
+import tempfile
+from rosdl.text_search import TextIndex, analyze, search
+
+
+def _write(path, text, mtime=None):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_bm25_ranking_and_stemmed_queries():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docs = os.path.join(tmpdir, "docs")
+        os.makedirs(os.path.join(docs, "sub"))
+        _write(os.path.join(docs, "cats.txt"), "Cats are running. The cat runs after cats all day.")
+        _write(os.path.join(docs, "dogs.txt"), "Dogs bark at the mailman. A dog is a loyal animal.")
+        _write(os.path.join(docs, "sub", "both.txt"), "The cat and the dog sleep. " + "Filler words here. " * 20)
+        _write(os.path.join(docs, "notes.csv"), "cat,cat,cat")  # not an indexed type
+
+        assert analyze("Running cats!") == ["run", "cat"]
+        db = os.path.join(tmpdir, "search.db")
+        with TextIndex(db) as idx:
+            stats = idx.update(docs, workers=1)
+            assert (stats["added"], len(idx)) == (3, 3)
+            results = idx.search("cat running")
+            assert [os.path.basename(p) for p, _ in results] == ["cats.txt", "both.txt"]
+            assert results[0][1] > results[1][1] > 0
+            assert len(idx.search("the", limit=2)) == 2
+            assert idx.search("zebra") == [] and idx.search("!!") == []
+
+        results, elapsed = search("loyal dogs", db)
+        assert os.path.basename(results[0][0]) == "dogs.txt" and elapsed < 1
+
+
+def test_incremental_update_by_mtime_and_compaction():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docs = os.path.join(tmpdir, "docs")
+        os.makedirs(docs)
+        for i in range(10):
+            _write(os.path.join(docs, f"d{i}.txt"), f"common text number{chr(97 + i)} shared", mtime=1_000_000)
+        db = os.path.join(tmpdir, "search.db")
+        with TextIndex(db) as idx:
+            idx.update(docs, workers=1)
+            assert idx.update(docs, workers=1)["unchanged"] == 10
+
+            _write(os.path.join(docs, "d0.txt"), "completely different zebra words", mtime=2_000_000)
+            os.remove(os.path.join(docs, "d1.txt"))
+            stats = idx.update(docs, workers=1)
+            assert (stats["updated"], stats["removed"], stats["unchanged"]) == (1, 1, 8)
+            # stale postings of the old d0 and of d1 are no longer returned
+            assert [os.path.basename(p) for p, _ in idx.search("zebra")] == ["d0.txt"]
+            hits = {os.path.basename(p) for p, _ in idx.search("common", limit=20)}
+            assert hits == {f"d{i}.txt" for i in range(2, 10)}
+
+            idx.optimize()
+            segments = idx.conn.execute("SELECT COUNT(*) FROM postings WHERE term = 'common'").fetchone()[0]
+            assert segments == 1
+            assert len(idx.search("common", limit=20)) == 8
+
+
+def test_document_stats_are_cached_between_queries():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docs = os.path.join(tmpdir, "docs")
+        os.makedirs(docs)
+        for i in range(5):
+            _write(os.path.join(docs, f"d{i}.txt"), f"shared words doc{chr(97 + i)}")
+        db = os.path.join(tmpdir, "search.db")
+        with TextIndex(db) as idx:
+            idx.update(docs, workers=1)
+            statements = []
+            idx.conn.set_trace_callback(statements.append)
+            for _ in range(3):
+                assert len(idx.search("shared", limit=10)) == 5
+            assert sum("FROM docs" in s and "length" in s for s in statements) == 1
+
+            # a write through another connection is picked up by the next query
+            with TextIndex(db) as other:
+                _write(os.path.join(docs, "d5.txt"), "shared again")
+                other.update(docs, workers=1)
+            assert len(idx.search("shared", limit=10)) == 6
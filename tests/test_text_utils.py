@@ -0,0 +1,191 @@
+# tests/test_text_utils.py
+"""
+Unit tests for rosdl.text_utils_module.
+"""
+
+import os
+import sys
+import importlib
+import pytest
+from rosdl import text_utils_module as tu
+
+
+@pytest.fixture
+def nltk_data(tmp_path):
+    """A local NLTK data folder with a tiny stopword corpus, so nothing needs the network."""
+    corpus = tmp_path / "corpora" / "stopwords"
+    corpus.mkdir(parents=True)
+    (corpus / "english").write_text("the\na\nis\nand\nof\n", encoding="utf-8")
+    tu.configure_nltk(str(tmp_path))
+    yield str(tmp_path)
+    tu.configure_nltk(None)
+
+
+def test_import_is_offline_and_lazy(monkeypatch):
+    nltk = pytest.importorskip("nltk")
+    monkeypatch.setattr(nltk, "download", lambda *a, **k: pytest.fail("download called on import"))
+    for mod in ("sklearn", "sklearn.feature_extraction.text"):
+        monkeypatch.delitem(sys.modules, mod, raising=False)
+    importlib.reload(tu)
+    assert "sklearn.feature_extraction.text" not in sys.modules
+
+
+def test_resources_come_from_configured_dir_and_are_shared(nltk_data):
+    pytest.importorskip("nltk")
+    a, b = tu.TextUtilities(), tu.TextUtilities()
+    assert a.stop_words == {"the", "a", "is", "and", "of"}
+    assert a.stop_words is b.stop_words and a.stemmer is b.stemmer
+    assert a.stem_words(["running", "data"]) == ["run", "data"]
+
+
+def test_missing_resource_points_at_download_helper(tmp_path, monkeypatch):
+    pytest.importorskip("nltk")
+    monkeypatch.setenv(tu.NLTK_DATA_ENV, str(tmp_path))
+    tu.get_stopwords.cache_clear()
+    with pytest.raises(LookupError, match="download-nltk"):
+        tu.get_stopwords("klingon")
+
+
+def test_clean_batch_matches_clean_text_in_order(nltk_data, tmp_path):
+    util = tu.TextUtilities()
+    docs = [f"Doc {i}: The QUICK fox, and {i} of the dogs!" for i in range(50)]
+    expected = [util.clean_text(d) for d in docs]
+    assert expected[0] == "doc quick fox dogs"
+    assert list(util.clean_batch(iter(docs), workers=1, chunksize=7)) == expected
+    assert list(util.clean_batch(iter(docs), workers=2, chunksize=4)) == expected
+    assert list(util.clean_batch(docs, remove_stopwords=False, workers=2))[1] == "doc the quick fox and of the dogs"
+
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_text('{"id": "x", "text": "Hello, World"}\n\n{"body": "no text"}\n', encoding="utf-8")
+    assert list(tu.iter_documents(str(corpus))) == [("x", "Hello, World"), (3, "")]
+
+
+def test_clean_text_splits_words_on_whitespace(nltk_data):
+    util = tu.TextUtilities()
+    # no Treebank splitting ("cannot" is not "can" + "not"); hyphens and ASCII quotes go with punctuation,
+    # non-ASCII quotes stay on the word, so the quoted stopword survives
+    assert util.clean_text("The dog cannot-stop, isn't a \u201cthe\u201d dog") == "dog cannotstop isnt \u201cthe\u201d dog"
+    assert util.clean_text("The cannot the", remove_stopwords=False) == "the cannot the"
+
+
+def test_regex_tokenizer_follows_treebank_conventions():
+    tok = tu.get_tokenizer("regex")
+    assert tok.tokenize("Mr. Smith doesn't pay 1,000.50 -- it's the U.S. way!") == \
+        ["Mr.", "Smith", "does", "n't", "pay", "1,000.50", "--", "it", "'s", "the", "U.S.", "way", "!"]
+    assert tok.sent_tokenize("Dr. Who arrived. Was it late? Yes! the end") == \
+        ["Dr. Who arrived.", "Was it late?", "Yes! the end"]
+    assert tu.TextUtilities().get_text_info("A cat. A dog.")["sentences"] == 2
+    with pytest.raises(ValueError):
+        tu.get_tokenizer("nope")
+
+
+def test_benchmark_reports_speed_and_agreement():
+    res = tu.benchmark_tokenizers(["Hello there. General Kenobi!"] * 3, backends=["regex"], reference="regex")
+    assert res["regex"]["tokens"] == 18
+    assert res["regex"]["token_agreement"] == res["regex"]["sentence_agreement"] == 1.0
+    assert tu._agreement(["a", "b", "c"], ["a", "b"]) == pytest.approx(2 / 3)
+
+
+def test_stem_cache_stems_each_word_once_and_persists(tmp_path):
+    pytest.importorskip("nltk")
+    path = str(tmp_path / "stems.json")
+    cache = tu.StemCache("porter", maxsize=3, path=path)
+    assert cache.stem_many(["running", "runs", "running", "data", "running"]) == ["run", "run", "run", "data", "run"]
+    assert (cache.misses, cache.hits) == (3, 0)
+    cache.stem_many(["running", "cats"])
+    assert (cache.misses, cache.hits, len(cache)) == (4, 1, 3)  # "runs" was evicted
+    cache.save()
+
+    again = tu.StemCache("porter", path=path)
+    assert again.stem("cats") == "cat" and again.misses == 0
+    assert len(tu.StemCache("lancaster", path=path)) == 0  # other backends ignore the file
+    assert tu.TextUtilities(stemmer="snowball").stem_words(["generously"]) == ["generous"]
+
+
+def test_streaming_text_info_handles_chunk_boundaries_and_merges(tmp_path):
+    util = tu.TextUtilities()
+    text = "Mr. Smith went to Washington. He didn't like it! The U.S. capital is big. " * 50 + "No full stop"
+    expected = util.get_text_info(text)
+    for size in (5, 64, 10_000):
+        assert util.stream_text_info(text[i:i + size] for i in range(0, len(text), size)) == expected
+
+    approx = util.stream_text_info([text], unique="hll")
+    assert approx["unique_words"] == expected["unique_words"] and approx["words"] == expected["words"]
+
+    paths = []
+    for i, part in enumerate(("Alpha beta. Beta gamma.", "Gamma gamma! Delta.")):
+        paths.append(str(tmp_path / f"{i}.txt"))
+        with open(paths[-1], "w", encoding="utf-8") as f:
+            f.write(part)
+    merged = tu.text_stats_many(paths, workers=2).result(2)
+    assert (merged["words"], merged["sentences"], merged["unique_words"]) == (11, 4, 8)
+    assert merged["top_words"] == [(".", 3), ("gamma", 2)]
+
+
+def test_top_words_are_exact_without_a_sketch_capacity():
+    util = tu.TextUtilities()
+    # 300 distinct filler words overflow a 20-entry sketch before the frequent ones appear
+    text = " ".join(f"w{i}" for i in range(300)) + " alpha beta alpha gamma alpha beta."
+    expected = util.get_text_info(text)
+    pieces = [text[i:i + 50] for i in range(0, len(text), 50)]
+    exact = util.stream_text_info(pieces, top_n=3, top_capacity=None)
+    assert exact["top_words"] == expected["top_words"][:3] == [("alpha", 3), ("beta", 2), ("w0", 1)]
+    sketched = util.stream_text_info(pieces, top_n=3, top_capacity=20)
+    assert sketched["top_words"][0][0] == "alpha" and sketched["top_words"][0][1] >= 3  # counts are upper bounds
+    with pytest.raises(ValueError):
+        tu.TextStats(None).merge(tu.TextStats(20))
+
+
+def test_sketches_are_bounded_and_mergeable():
+    from rosdl.sketches import SpaceSaving, HyperLogLog
+    stream = ["a"] * 50 + ["b"] * 30 + [f"x{i}" for i in range(200)]
+    ss = SpaceSaving(capacity=10).update(stream[:140]).merge(SpaceSaving(10).update(stream[140:]))
+    assert len(ss) == 10 and [item for item, _ in ss.top(2)] == ["a", "b"]
+    assert ss.top(1)[0][1] - ss.error("a") <= 50 <= ss.top(1)[0][1]
+
+    h1, h2 = HyperLogLog().update(str(i) for i in range(20000)), HyperLogLog().update(str(i) for i in range(10000, 30000))
+    assert abs(h1.merge(h2).count() - 30000) < 30000 * 0.03
+
+
+def test_iter_text_units_and_methods_consume_iterables(nltk_data, tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_text("First line. Still first para.\nSecond line!\n\n\nNew para here.\n\fPage two " + "word " * 40,
+                    encoding="utf-8")
+    path = str(path)
+    assert list(tu.iter_text(path, "line"))[:2] == ["First line. Still first para.", "Second line!"]
+    paras = list(tu.iter_text(path, "paragraph"))
+    assert paras[:2] == ["First line. Still first para.\nSecond line!", "New para here."]
+    assert len(list(tu.iter_text(path, "page"))) == 2
+    chunks = list(tu.iter_text(path, "chunk", chunk_size=16))
+    assert "".join(chunks) == tu.load_text(path) and all(c[-1].isspace() for c in chunks[:-1])
+    assert list(tu.iter_text("a b\n\nc", "paragraph")) == ["a b", "c"]
+    with pytest.raises(ValueError):
+        next(tu.iter_text(path, "sentence"))
+
+    util = tu.TextUtilities()
+    assert next(util.clean_text(tu.iter_text(path, "line"))) == "first line still first para"
+    tokens = util.tokenize(tu.iter_text(path, "chunk", chunk_size=16))
+    assert list(tokens) == util.tokenize(tu.load_text(path))
+    assert list(util.stem_words(iter(["running", "runs"]), batch_size=1)) == ["run", "run"]
+    assert util.get_text_info(tu.iter_text(path, "chunk", chunk_size=16)) == util.get_text_info(tu.load_text(path))
+
+
+def test_pdf_pages_do_not_fuse_words(monkeypatch, tmp_path):
+    class Page:
+        def __init__(self, text):
+            self.text = text
+
+        def extract_text(self):
+            return self.text
+
+    class Reader:
+        def __init__(self, f):
+            self.pages = [Page("alpha beta"), Page("gamma delta")]
+
+    monkeypatch.setattr(tu.PyPDF2, "PdfReader", Reader)
+    path = tmp_path / "two_pages.pdf"
+    path.write_bytes(b"%PDF-1.4")
+    chunks = list(tu.iter_text(str(path), "chunk", chunk_size=4))
+    assert "".join(chunks).split() == ["alpha", "beta", "gamma", "delta"]
+    assert "".join(chunks) == tu.load_text(str(path)) + "\n"
+    assert list(tu.iter_text(str(path), "line")) == ["alpha beta", "gamma delta"]